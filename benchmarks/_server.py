@@ -0,0 +1,39 @@
+import socket
+import threading
+import time
+from contextlib import contextmanager
+
+import uvicorn
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def serve_app(app, startup_timeout: float = 10.0):
+    """
+    Runs a FastAPI app under uvicorn in a background thread and yields
+    its base URL. The server is shut down on exit.
+    """
+
+    port = _free_port()
+    config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+    server = uvicorn.Server(config)
+
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + startup_timeout
+    while not server.started:
+        if time.monotonic() > deadline:
+            raise RuntimeError("Benchmark server failed to start")
+        time.sleep(0.05)
+
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
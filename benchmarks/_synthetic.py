@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+
+
+COUNTRIES = {
+    "United States": ("Americas", "North America"),
+    "Brazil": ("Americas", "South America"),
+    "Kenya": ("Africa", "Eastern Africa"),
+    "Nigeria": ("Africa", "Western Africa"),
+    "Germany": ("Europe", "Western Europe"),
+    "India": ("Asia", "Southern Asia"),
+}
+
+RISK_FLAGS = np.array(["low", "medium", "high"], dtype=object)
+
+
+def make_merchants(n: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Synthetic rows matching the merchants.csv schema.
+    """
+
+    rng = np.random.default_rng(seed)
+    countries = np.array(list(COUNTRIES), dtype=object)
+
+    transaction_count = rng.integers(50, 20000, n)
+
+    return pd.DataFrame({
+        "merchant_id": [f"M{i:08d}" for i in range(n)],
+        "name": [f"Merchant {i}" for i in range(n)],
+        "country": countries[rng.integers(0, len(countries), n)],
+        "registration_number": [f"REG{i:08d}" for i in range(n)],
+        "monthly_volume": rng.uniform(1_000, 500_000, n).round(2),
+        "dispute_count": rng.binomial(transaction_count, 0.003),
+        "transaction_count": transaction_count,
+    })
+
+
+def make_internal_risk(merchant_ids, seed: int = 1) -> pd.DataFrame:
+    """
+    Synthetic payloads shaped like the internal risk API columns.
+    """
+
+    rng = np.random.default_rng(seed)
+    n = len(merchant_ids)
+
+    volume = rng.uniform(10000, 200000, n).round(2)
+    txn_count = rng.integers(100, 5000, n)
+
+    return pd.DataFrame({
+        "merchant_id": list(merchant_ids),
+        "internal_risk_flag": RISK_FLAGS[rng.integers(0, 3, n)],
+        "last_30d_volume": volume,
+        "last_30d_txn_count": txn_count,
+        "avg_ticket_size": (volume / txn_count).round(2),
+        "last_review_date": "2026-01-01",
+    })
+
+
+def make_country_metadata() -> pd.DataFrame:
+    return pd.DataFrame(
+        [(c, r, s) for c, (r, s) in COUNTRIES.items()],
+        columns=["country", "region", "subregion"],
+    )
+
+
+PDF_TEXT = "Quarterly summary. Refund volumes rose; one chargeback dispute pending."
+
+SCRAPE_DATA = {
+    "value_propositions": ["Pay over time", "Clear pricing"],
+    "public_stats": ["$1B+ processed"],
+    "partners": [],
+}
+
+
+def make_feature_frame(n: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Fully enriched modelling frame, as produced by build_feature_frame.
+    """
+
+    from features.feature_pipeline import build_feature_frame
+
+    merchants = make_merchants(n, seed)
+
+    return build_feature_frame(
+        merchants,
+        make_internal_risk(merchants["merchant_id"], seed + 1),
+        make_country_metadata(),
+        PDF_TEXT,
+        SCRAPE_DATA,
+    )
+
+
+def write_text_pdf(path, pages) -> None:
+    """
+    Writes a minimal valid PDF with one text page per entry in pages.
+    Enough for pdfplumber to extract, without a PDF library dependency.
+    """
+
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+
+    for text in pages:
+        lines = [line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") for line in text.split("\n")]
+        ops = "BT /F1 10 Tf 14 TL 40 800 Td " + " ".join(f"({line}) Tj T*" for line in lines) + " ET"
+        stream = ops.encode("latin-1", "replace")
+
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        page_ids.append(len(objects))
+
+    kids = " ".join(f"{i} 0 R" for i in page_ids).encode()
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+
+    with open(path, "wb") as f:
+        f.write(bytes(out))
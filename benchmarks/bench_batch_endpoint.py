@@ -0,0 +1,55 @@
+"""
+Compares per-merchant GET /risk/{id} calls against the bulk /risk/batch
+endpoint on the simulated internal risk API, extrapolated to 100k merchants.
+
+Usage:
+    python -m benchmarks.bench_batch_endpoint --merchants 20000
+"""
+
+import argparse
+import time
+
+from benchmarks._server import serve_app
+from ingestion import simulated_api_client
+from ingestion.async_risk_client import fetch_internal_risk_frame
+from simulated_api.api import app
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--merchants", type=int, default=20000)
+    parser.add_argument("--per-id-merchants", type=int, default=2000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    ids = [f"M{i:07d}" for i in range(args.merchants)]
+    per_id_ids = ids[:args.per_id_merchants]
+
+    with serve_app(app) as base_url:
+        simulated_api_client.BASE_URL = base_url
+
+        cases = [
+            ("per-id async GET", len(per_id_ids), lambda: fetch_internal_risk_frame(
+                per_id_ids, base_url=base_url, concurrency=32)),
+            ("batch sync client", len(ids), lambda: simulated_api_client.fetch_internal_risk_batch(
+                ids, chunk_size=args.chunk_size)),
+            ("batch async client", len(ids), lambda: fetch_internal_risk_frame(
+                ids, base_url=base_url, concurrency=args.concurrency,
+                batch_size=args.chunk_size)),
+        ]
+
+        for label, n, fn in cases:
+            elapsed = _timed(fn)
+            per_100k = elapsed / n * 100_000
+            print(f"{label:<20} {n / elapsed:>10.0f} merchants/s   {per_100k:>8.1f} s per 100k")
+
+
+if __name__ == "__main__":
+    main()
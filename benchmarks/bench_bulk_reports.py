@@ -0,0 +1,74 @@
+"""
+Rendering time for template underwriting reports over a scored
+portfolio: the per-row generate_underwriting_report loop versus the bulk
+renderer, then the bulk renderer streamed to each output format.
+
+Usage:
+    python -m benchmarks.bench_bulk_reports --merchants 100000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from reporting.bulk_reports import render_portfolio_reports
+from reporting.report_generator import generate_underwriting_report, iter_underwriting_reports
+
+IMPORTANCE = pd.DataFrame({
+    "feature": ["dispute_rate", "avg_ticket_size", "last_30d_volume"],
+    "coefficient": [2.5, -0.3, 0.01],
+})
+
+
+def make_scored(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "merchant_id": [f"M{i:07d}" for i in range(n)],
+        "country": rng.choice(["Kenya", "Brazil", "Germany", "India"], n),
+        "risk_probability": rng.uniform(0, 1, n),
+        "risk_tier": rng.choice(["High", "Medium", "Low"], n),
+        "monthly_volume": rng.uniform(100, 1e5, n).round(2),
+        "transaction_count": rng.integers(1, 5000, n),
+        "dispute_count": rng.integers(0, 50, n),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--merchants", type=int, default=100_000)
+    args = parser.parse_args()
+
+    df = make_scored(args.merchants)
+    print(f"{args.merchants} merchants")
+    print(f"{'mode':<30} {'seconds':>8} {'reports/s':>10}")
+
+    def row_loop():
+        for _, row in df.iterrows():
+            generate_underwriting_report(row, IMPORTANCE)
+
+    def bulk():
+        for _ in iter_underwriting_reports(df, IMPORTANCE):
+            pass
+
+    with tempfile.TemporaryDirectory() as out:
+        runs = [
+            ("per-row loop (in memory)", row_loop),
+            ("bulk (in memory)", bulk),
+            ("bulk -> jsonl", lambda: render_portfolio_reports(df, IMPORTANCE, "jsonl", os.path.join(out, "r.jsonl"))),
+            ("bulk -> tar.gz", lambda: render_portfolio_reports(df, IMPORTANCE, "tar", os.path.join(out, "r.tar.gz"))),
+            ("bulk -> files", lambda: render_portfolio_reports(df, IMPORTANCE, "files", os.path.join(out, "files"))),
+        ]
+
+        for label, fn in runs:
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+            print(f"{label:<30} {elapsed:>8.2f} {args.merchants / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
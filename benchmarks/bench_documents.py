@@ -0,0 +1,54 @@
+"""
+Documents per second for extract_documents over a directory of synthetic
+per-merchant PDFs, by process-pool size, plus a warm run served entirely
+from the content-hash cache.
+
+Usage:
+    python -m benchmarks.bench_documents --documents 400 --pages 5 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks._synthetic import PDF_TEXT, write_text_pdf
+from ingestion.document_processor import DocumentTextCache, extract_documents
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=400)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        docs = os.path.join(workdir, "docs")
+        os.makedirs(docs)
+
+        for i in range(args.documents):
+            pages = [f"Merchant M{i:06d} page {p}\n{PDF_TEXT}" for p in range(args.pages)]
+            write_text_pdf(os.path.join(docs, f"M{i:06d}_summary.pdf"), pages)
+
+        print(f"{args.documents} documents x {args.pages} pages, {os.cpu_count()} CPUs")
+        print(f"{'workers':>8} {'seconds':>8} {'docs/s':>8}")
+
+        for workers in args.workers:
+            # Fresh cache so every document is parsed
+            cache = DocumentTextCache(os.path.join(workdir, f"cache_{workers}"))
+
+            start = time.perf_counter()
+            extract_documents(docs, max_workers=workers, cache=cache)
+            elapsed = time.perf_counter() - start
+
+            print(f"{workers:>8} {elapsed:>8.2f} {args.documents / elapsed:>8.0f}")
+
+        start = time.perf_counter()
+        extract_documents(docs, cache=cache)
+        elapsed = time.perf_counter() - start
+        print(f"{'cached':>8} {elapsed:>8.2f} {args.documents / elapsed:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+LinearScorer (dot product + sigmoid on a float64 matrix) versus
+LogisticRegression.predict_proba on a DataFrame column selection.
+
+Usage:
+    python -m benchmarks.bench_fast_scorer --sizes 1 100 1000000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from benchmarks._synthetic import make_feature_frame
+from features.registry import MODEL_FEATURES, feature_array
+from model.fast_scorer import LinearScorer
+from model.train import train_risk_model
+
+
+def _per_call_ms(fn, min_seconds=0.5):
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return elapsed / calls * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 100, 1_000_000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            model, _ = train_risk_model(make_feature_frame(5000))
+
+    scorer = LinearScorer.from_estimator(model, MODEL_FEATURES)
+    portfolio = make_feature_frame(max(args.sizes), seed=5)
+
+    print(f"{'batch':>9} {'sklearn ms':>11} {'scorer ms':>10} {'frame+scorer ms':>16} {'max abs diff':>13}")
+    for n in args.sizes:
+        df = portfolio.iloc[:n].copy()
+        X = feature_array(df, MODEL_FEATURES)
+
+        sklearn_ms = _per_call_ms(lambda: model.predict_proba(df[MODEL_FEATURES])[:, 1])
+        scorer_ms = _per_call_ms(lambda: scorer.predict_proba(X))
+        frame_ms = _per_call_ms(lambda: scorer.score_frame(df))
+
+        diff = np.max(np.abs(scorer.predict_proba(X) - model.predict_proba(df[MODEL_FEATURES])[:, 1]))
+        print(f"{n:>9} {sklearn_ms:>11.4f} {scorer_ms:>10.4f} {frame_ms:>16.4f} {diff:>13.2e}")
+
+
+if __name__ == "__main__":
+    main()
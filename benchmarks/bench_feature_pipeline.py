@@ -0,0 +1,91 @@
+"""
+Times the vectorized feature stage (joins, behavioral rates, risk_score,
+tiering) against the previous row-wise iterrows/apply implementation.
+
+Usage:
+    python -m benchmarks.bench_feature_pipeline --sizes 10000 100000 1000000
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from benchmarks._synthetic import (
+    PDF_TEXT,
+    SCRAPE_DATA,
+    make_country_metadata,
+    make_internal_risk,
+    make_merchants,
+)
+from features.feature_pipeline import assign_risk_tier, build_feature_frame
+
+
+def row_wise_stage(merchants, internal_df, country_df):
+    # The hot loops removed from run_pipeline / predict: iterrows enrichment
+    # with row.to_dict(), followed by a scalar apply for tiering
+    internal = internal_df.set_index("merchant_id").to_dict("index")
+    countries = country_df.set_index("country").to_dict("index")
+
+    rows = []
+    for _, row in merchants.iterrows():
+        enriched_row = row.to_dict()
+        enriched_row.update(internal[row["merchant_id"]])
+        rows.append(enriched_row)
+    df = pd.DataFrame(rows)
+
+    rows = []
+    for _, row in df.iterrows():
+        enriched_row = row.to_dict()
+        enriched_row.update(countries[row["country"]])
+        rows.append(enriched_row)
+    df = pd.DataFrame(rows)
+
+    def tier(p):
+        if p > 0.6:
+            return "High"
+        elif p > 0.3:
+            return "Medium"
+        return "Low"
+
+    df["risk_tier"] = df["monthly_volume"].rank(pct=True).apply(tier)
+    return df
+
+
+def vectorized_stage(merchants, internal_df, country_df):
+    df = build_feature_frame(merchants, internal_df, country_df, PDF_TEXT, SCRAPE_DATA)
+    df["risk_tier"] = assign_risk_tier(df["monthly_volume"].rank(pct=True))
+    return df
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--row-wise-max", type=int, default=100_000,
+                        help="skip the row-wise baseline above this size")
+    args = parser.parse_args()
+
+    country_df = make_country_metadata()
+
+    print(f"{'merchants':>10} {'row-wise s':>12} {'vectorized s':>13} {'speedup':>8}")
+    for n in args.sizes:
+        merchants = make_merchants(n)
+        internal_df = make_internal_risk(merchants["merchant_id"])
+
+        fast = _timed(vectorized_stage, merchants, internal_df, country_df)
+
+        if n <= args.row_wise_max:
+            slow = _timed(row_wise_stage, merchants, internal_df, country_df)
+            print(f"{n:>10} {slow:>12.3f} {fast:>13.3f} {slow / fast:>7.1f}x")
+        else:
+            print(f"{n:>10} {'skipped':>12} {fast:>13.3f} {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Cold import time of the pipeline entry points, each in a fresh
+interpreter (median of --repeat runs, minus bare interpreter startup),
+plus pytest collection time for the test suite.
+
+Usage:
+    python -m benchmarks.bench_import_time --repeat 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+MODULES = [
+    "reporting.llm_report_generator",
+    "reporting.batch_reports",
+    "model.predict",
+    "scoring_api.api",
+    "run_pipeline",
+]
+
+
+def _median_seconds(command, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, capture_output=True)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    baseline = _median_seconds([sys.executable, "-c", "pass"], args.repeat)
+
+    print(f"interpreter startup: {baseline:.3f}s (subtracted below)")
+    print(f"{'import':<34} {'seconds':>8} {'transformers loaded':>20}")
+
+    for module in MODULES:
+        seconds = _median_seconds([sys.executable, "-c", f"import {module}"], args.repeat) - baseline
+        loaded = subprocess.run(
+            [sys.executable, "-c", f"import sys, {module}; print('transformers' in sys.modules)"],
+            check=True, capture_output=True, text=True,
+        ).stdout.strip()
+        print(f"{module:<34} {seconds:>8.3f} {loaded:>20}")
+
+    collect = _median_seconds([sys.executable, "-m", "pytest", "--collect-only", "-q"], args.repeat)
+    print(f"{'pytest --collect-only':<34} {collect:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmarks internal risk API enrichment against the simulated FastAPI app.
+
+Usage:
+    python -m benchmarks.bench_internal_api --merchants 2000 --concurrency 1 8 32 128
+"""
+
+import argparse
+import time
+
+from benchmarks._server import serve_app
+from ingestion import simulated_api_client
+from ingestion.async_risk_client import fetch_internal_risk_frame
+from simulated_api.api import app
+
+
+def _merchant_ids(n: int):
+    return [f"M{i:07d}" for i in range(n)]
+
+
+def bench_sequential(base_url: str, n: int) -> float:
+    # Baseline: one blocking requests.get per merchant
+    simulated_api_client.BASE_URL = base_url
+    ids = _merchant_ids(n)
+
+    start = time.perf_counter()
+    for merchant_id in ids:
+        simulated_api_client.fetch_internal_risk(merchant_id)
+    return n / (time.perf_counter() - start)
+
+
+def bench_async(base_url: str, n: int, concurrency: int) -> float:
+    ids = _merchant_ids(n)
+
+    start = time.perf_counter()
+    frame = fetch_internal_risk_frame(ids, base_url=base_url, concurrency=concurrency)
+    elapsed = time.perf_counter() - start
+
+    assert len(frame) == n
+    return n / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--merchants", type=int, default=2000)
+    parser.add_argument("--sequential-merchants", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    args = parser.parse_args()
+
+    with serve_app(app) as base_url:
+        rate = bench_sequential(base_url, args.sequential_merchants)
+        print(f"{'sequential requests':<24} {rate:>10.1f} merchants/s")
+
+        for concurrency in args.concurrency:
+            rate = bench_async(base_url, args.merchants, concurrency)
+            print(f"{f'async concurrency={concurrency}':<24} {rate:>10.1f} merchants/s")
+
+
+if __name__ == "__main__":
+    main()
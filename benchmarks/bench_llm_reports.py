@@ -0,0 +1,73 @@
+"""
+Reports/minute and generated tokens/second of batch LLM report
+generation for a synthetic High tier, across batch sizes and worker
+process counts. Needs transformers and torch (the model is downloaded
+on first use).
+
+Usage:
+    python -m benchmarks.bench_llm_reports --merchants 64 --batch-sizes 1 8 --workers 1 2 --max-new-tokens 128
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+
+from benchmarks._synthetic import make_feature_frame
+from model.predict import predict_risk
+from model.train import train_risk_model
+from reporting.batch_reports import generate_tier_reports, report_path
+from reporting.prompts import build_underwriting_prompt, format_top_drivers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--merchants", type=int, default=64)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--max-new-tokens", type=int, default=128)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        df = make_feature_frame(5000)
+        model, importance = train_risk_model(df)
+
+    df = predict_risk(df, model=model)
+    df = df.sort_values("risk_probability", ascending=False).head(args.merchants)
+    df["risk_tier"] = "High"
+    metrics = {"average_risk_probability": df["risk_probability"].mean()}
+
+    # Token counts need the tokenizer, which loads the model in this process too
+    from reporting.llm_report_generator import count_tokens
+
+    top_drivers = format_top_drivers(importance)
+    prompt_tokens = count_tokens(
+        [build_underwriting_prompt(row, importance, metrics, top_drivers) for row in df.to_dict("records")]
+    )
+
+    print(f"{len(df)} High merchants, max_new_tokens={args.max_new_tokens}, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'batch':>6} {'seconds':>8} {'reports/min':>12} {'tokens/s':>9}")
+
+    for workers in args.workers:
+        for batch_size in args.batch_sizes:
+            with tempfile.TemporaryDirectory() as out:
+                summary = generate_tier_reports(
+                    df, importance, metrics, tier="High",
+                    batch_size=batch_size, max_new_tokens=args.max_new_tokens,
+                    workers=workers, output_dir=out,
+                )
+
+                texts = [open(report_path(out, m)).read() for m in df["merchant_id"]]
+
+            # Generated text echoes the prompt; count only the new tokens
+            new_tokens = max(count_tokens(texts) - prompt_tokens, 0)
+
+            print(
+                f"{workers:>8} {batch_size:>6} {summary['seconds']:>8.2f} "
+                f"{summary['reports_per_minute']:>12.1f} {new_tokens / summary['seconds']:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
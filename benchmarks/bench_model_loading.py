@@ -0,0 +1,65 @@
+"""
+Per-call latency of predict_risk on small batches: unpickling a .pkl
+artifact or loading the versioned store (memory-mapped weights) on every
+call, versus the cached registry and an in-memory model.
+
+Usage:
+    python -m benchmarks.bench_model_loading --calls 200 --batch 10
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks._synthetic import make_feature_frame
+from features.registry import MODEL_FEATURES
+from model.predict import predict_risk
+from model.registry import clear_model_cache, get_model, load_model
+from model.train import save_model, train_risk_model
+
+
+def _latencies(fn, calls):
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        model, _ = train_risk_model(make_feature_frame(5000))
+        save_model(model, MODEL_FEATURES, "risk_model.pkl")
+
+        batch = make_feature_frame(args.batch, seed=99)
+        clear_model_cache()
+
+        cases = {
+            "unpickle every call": lambda: predict_risk(batch, model=load_model("risk_model.pkl")),
+            "store every call": lambda: predict_risk(batch, model=load_model()),
+            "cached registry": lambda: predict_risk(batch),
+            "in-memory model": lambda: predict_risk(batch, model=in_memory),
+        }
+        in_memory = get_model()
+
+        print(f"\n{'mode':<20} {'mean ms':>9} {'p50 ms':>9} {'p99 ms':>9}")
+        for label, fn in cases.items():
+            samples = sorted(_latencies(fn, args.calls))
+            p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+            print(
+                f"{label:<20} {statistics.mean(samples):>9.3f} "
+                f"{statistics.median(samples):>9.3f} {p99:>9.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Cross-validated model search: wall time for the same candidate grid
+with sequential versus parallel (candidate, fold) fits.
+
+Usage:
+    python -m benchmarks.bench_model_search --rows 20000 --jobs 1 -1
+"""
+
+import argparse
+import os
+import time
+
+from benchmarks._synthetic import make_feature_frame
+from features.registry import MODEL_FEATURES, TARGET, compute_features, feature_array
+from model.search import cross_validate_candidates, default_candidates
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, -1])
+    args = parser.parse_args()
+
+    df = make_feature_frame(args.rows)
+    compute_features(df, list(MODEL_FEATURES) + [TARGET])
+    X = feature_array(df, MODEL_FEATURES)
+    y = df[TARGET].to_numpy()
+
+    candidates = default_candidates()
+    print(f"{len(candidates)} candidates x {args.folds} folds on {args.rows} rows, {os.cpu_count()} CPUs")
+
+    for n_jobs in args.jobs:
+        start = time.perf_counter()
+        results = cross_validate_candidates(X, y, candidates, n_splits=args.folds, n_jobs=n_jobs)
+        elapsed = time.perf_counter() - start
+        print(f"\nn_jobs={n_jobs}: {elapsed:.2f}s wall, {results['fit_seconds'].sum():.2f}s fitting")
+
+    print()
+    print(results.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
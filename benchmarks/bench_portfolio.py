@@ -0,0 +1,87 @@
+"""
+Portfolio aggregation over a large synthetic scored portfolio: the old
+per-metric pandas passes versus one PortfolioAccumulator pass, grouped by
+country, and chunked accumulation merged across joblib workers.
+
+Usage:
+    python -m benchmarks.bench_portfolio --merchants 10000000 --chunksize 1000000 --jobs 4
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks._synthetic import COUNTRIES
+from reporting.portfolio import PortfolioAccumulator, aggregate_chunks, portfolio_metrics
+
+
+def legacy_metrics(df):
+    return {
+        "num_high_risk": (df["risk_tier"] == "High").sum(),
+        "num_medium_risk": (df["risk_tier"] == "Medium").sum(),
+        "num_low_risk": (df["risk_tier"] == "Low").sum(),
+        "expected_high_risk_merchants": df["risk_probability"].sum(),
+        "average_risk_probability": df["risk_probability"].mean(),
+    }
+
+
+def legacy_extended(df):
+    # What the new metrics cost with plain pandas: quantiles, exposure, country groupby
+    metrics = legacy_metrics(df)
+    metrics["quantiles"] = df["risk_probability"].quantile([0.5, 0.9, 0.99])
+    metrics["exposure_weighted_risk"] = (
+        (df["monthly_volume"] * df["risk_probability"]).sum() / df["monthly_volume"].sum()
+    )
+    metrics["by_country"] = df.groupby("country")["risk_probability"].agg(["size", "mean", "sum"])
+    return metrics
+
+
+def make_scored(n, seed=0):
+    rng = np.random.default_rng(seed)
+    probability = rng.beta(2, 5, n)
+    return pd.DataFrame({
+        "country": pd.Categorical(rng.choice(list(COUNTRIES), n)),
+        "risk_probability": probability,
+        "monthly_volume": rng.uniform(100, 1e5, n),
+        "risk_tier": pd.Categorical(
+            np.select([probability > 0.6, probability > 0.3], ["High", "Medium"], "Low")
+        ),
+        "predicted_high_risk": (probability > 0.25).astype(np.int8),
+    })
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--merchants", type=int, default=10_000_000)
+    parser.add_argument("--chunksize", type=int, default=1_000_000)
+    parser.add_argument("--jobs", type=int, default=4)
+    args = parser.parse_args()
+
+    df = make_scored(args.merchants)
+    chunks = [df.iloc[i:i + args.chunksize] for i in range(0, len(df), args.chunksize)]
+
+    cases = [
+        ("legacy 5 metrics (pandas)", lambda: legacy_metrics(df)),
+        ("pandas with quantiles/exposure/country", lambda: legacy_extended(df)),
+        ("accumulator, whole portfolio", lambda: portfolio_metrics(df)),
+        ("accumulator, by country", lambda: PortfolioAccumulator("country").update(df).frame()),
+        (f"chunked by country, n_jobs=1", lambda: aggregate_chunks(chunks, "country").frame()),
+        (f"chunked by country, n_jobs={args.jobs}", lambda: aggregate_chunks(chunks, "country", n_jobs=args.jobs).frame()),
+    ]
+
+    print(f"{args.merchants:,} merchants, {len(chunks)} chunks")
+    print(f"{'mode':<40} {'seconds':>8}")
+    for label, fn in cases:
+        print(f"{label:<40} {_timed(fn):>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Validation throughput on a synthetic merchants frame: the previous
+fail-fast validate_schema (one pass per check) versus the compiled schema
+producing a full report, and quarantine splitting good and bad rows.
+
+Usage:
+    python -m benchmarks.bench_schema_validation --rows 1000000 --bad-fraction 0.001
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks._synthetic import make_merchants
+from ingestion.schema_validation import MERCHANT_SCHEMA, validate_schema
+
+
+def legacy_validate_schema(df):
+    # The checks as they were before the compiled schema, stopping at the first failure
+    if df["merchant_id"].isnull().any():
+        raise ValueError("merchant_id contains null values")
+    if not df["merchant_id"].str.startswith("M").all():
+        raise ValueError("merchant_id must start with 'M'")
+    if df["merchant_id"].duplicated().any():
+        raise ValueError("Duplicate merchant_id found")
+    if df["name"].isnull().any():
+        raise ValueError("Merchant name contains null values")
+    if df["country"].isnull().any():
+        raise ValueError("Country contains null values")
+    for field in ["monthly_volume", "dispute_count", "transaction_count"]:
+        if not pd.api.types.is_numeric_dtype(df[field]):
+            raise ValueError(f"{field} must be numeric")
+        if (df[field] < 0).any():
+            raise ValueError(f"{field} contains negative values")
+    if (df["transaction_count"] == 0).any():
+        raise ValueError("transaction_count must be greater than 0")
+
+
+def corrupt(df, fraction, seed=7):
+    # Spreads bad values over several rules; numeric columns stay numeric
+    rng = np.random.default_rng(seed)
+    df = df.copy()
+    n = max(1, int(len(df) * fraction))
+
+    df.loc[rng.choice(df.index, n), "merchant_id"] = "X-bad"
+    df.loc[rng.choice(df.index, n), "name"] = None
+    df.loc[rng.choice(df.index, n), "dispute_count"] = -1
+    df.loc[rng.choice(df.index, n), "transaction_count"] = 0
+    return df
+
+
+def _best_of(fn, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        try:
+            fn()
+        except ValueError:
+            pass
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--bad-fraction", type=float, default=0.001)
+    args = parser.parse_args()
+
+    clean = make_merchants(args.rows)
+    dirty = corrupt(clean, args.bad_fraction)
+
+    report = MERCHANT_SCHEMA.validate(dirty)
+    print(f"{args.rows:,} rows; dirty copy breaks {report.error_counts()}")
+
+    cases = [
+        ("legacy, clean", lambda: legacy_validate_schema(clean)),
+        ("compiled validate_schema, clean", lambda: validate_schema(clean)),
+        ("legacy, dirty (stops at first)", lambda: legacy_validate_schema(dirty)),
+        ("compiled full report, dirty", lambda: MERCHANT_SCHEMA.validate(dirty)),
+        ("compiled quarantine, dirty", lambda: MERCHANT_SCHEMA.quarantine(dirty)),
+    ]
+
+    print(f"{'mode':<34} {'seconds':>8} {'rows/s':>14}")
+    for label, fn in cases:
+        seconds = _best_of(fn)
+        print(f"{label:<34} {seconds:>8.3f} {args.rows / seconds:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
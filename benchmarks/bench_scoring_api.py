@@ -0,0 +1,80 @@
+"""
+p50/p99 latency of the scoring service endpoints via an in-process TestClient.
+
+Usage:
+    python -m benchmarks.bench_scoring_api --requests 500 --batch 100
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from benchmarks._synthetic import COUNTRIES, make_feature_frame
+from ingestion.country_cache import CountryMetadataCache
+from model.train import train_risk_model
+from scoring_api.api import app, configure_service
+
+
+REQUEST_FIELDS = [
+    "merchant_id", "country", "monthly_volume", "dispute_count", "transaction_count",
+    "internal_risk_flag", "last_30d_volume", "last_30d_txn_count", "avg_ticket_size",
+]
+
+
+def _payloads(n: int):
+    frame = make_feature_frame(n, seed=123)[REQUEST_FIELDS]
+    return frame.to_dict("records")
+
+
+def _measure(client, path, bodies):
+    samples = []
+    for body in bodies:
+        start = time.perf_counter()
+        response = client.post(path, json=body)
+        samples.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, response.text
+    return np.percentile(samples, [50, 99])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--batch", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        # Publishes the current version of the default model store the service loads
+        train_risk_model(make_feature_frame(5000))
+
+        # Offline country lookups, pre-warmed so the benchmark measures scoring
+        country_cache = CountryMetadataCache(
+            db_path="countries.sqlite",
+            fetcher=lambda c: {"region": COUNTRIES[c][0], "subregion": COUNTRIES[c][1]},
+        )
+        country_cache.get_many(COUNTRIES)
+        configure_service(country_cache=country_cache)
+
+        client = TestClient(app)
+        rows = _payloads(args.requests)
+
+        single = _measure(client, "/score", rows)
+        print("\nExample drivers:", client.post("/score", json=rows[0]).json()["top_drivers"])
+
+        batches = [
+            {"merchants": rows[i:i + args.batch]}
+            for i in range(0, len(rows) - args.batch + 1, max(1, args.batch // 10))
+        ]
+        batch = _measure(client, "/score/batch", batches)
+
+    print(f"\n{'endpoint':<24} {'p50 ms':>9} {'p99 ms':>9}")
+    print(f"{'/score':<24} {single[0]:>9.2f} {single[1]:>9.2f}")
+    print(f"{f'/score/batch ({args.batch})':<24} {batch[0]:>9.2f} {batch[1]:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
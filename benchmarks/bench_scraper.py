@@ -0,0 +1,84 @@
+"""
+Fetch-and-parse time for many merchant sites served by a local stand-in
+with simulated latency: the old sequential path (requests.get + parse,
+without its extra 1 s sleep per page), then CachedFetcher cold,
+revalidating (304s) and within fresh_seconds (no requests).
+
+Usage:
+    python -m benchmarks.bench_scraper --sites 200 --latency-ms 50 --workers 16
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+
+import requests
+from fastapi import FastAPI, Request, Response
+
+from benchmarks._server import serve_app
+from ingestion.scraper import parse_site_signals, scrape_sites
+from ingestion.web_fetcher import CachedFetcher, HostRateLimiter, ResponseCache
+
+PAGE = "<html><body>" + "".join(
+    f"<p>Pay later with Clear plan {i}</p><p>${i}M+ processed</p><img alt='Partner {i}'>"
+    for i in range(200)
+) + "</body></html>"
+
+
+def make_app(latency: float) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/site/{site_id}")
+    async def site(site_id: int, request: Request):
+        await asyncio.sleep(latency)
+        etag = f'"{site_id}-v1"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+        return Response(PAGE, media_type="text/html", headers={"ETag": etag})
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sites", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=50)
+    parser.add_argument("--workers", type=int, default=16)
+    args = parser.parse_args()
+
+    with serve_app(make_app(args.latency_ms / 1000)) as base_url, tempfile.TemporaryDirectory() as cache_dir:
+        urls = [f"{base_url}/site/{i}" for i in range(args.sites)]
+
+        def sequential():
+            for url in urls:
+                response = requests.get(url, timeout=10)
+                response.raise_for_status()
+                parse_site_signals(response.text)
+
+        def fetcher(fresh_seconds=0.0):
+            # All stand-in sites share one host, so lift the per-host limit
+            return CachedFetcher(
+                cache=ResponseCache(cache_dir),
+                rate_limiter=HostRateLimiter(rate_per_host=1e6, burst=args.workers),
+                fresh_seconds=fresh_seconds,
+                max_workers=args.workers,
+            )
+
+        print(f"{args.sites} sites, {args.latency_ms:.0f} ms latency, {args.workers} workers")
+        print(f"{'mode':<24} {'seconds':>8} {'sites/s':>8}")
+
+        for label, fn in [
+            ("sequential, uncached", sequential),
+            ("cached fetcher, cold", lambda: scrape_sites(urls, fetcher())),
+            ("revalidate (304)", lambda: scrape_sites(urls, fetcher())),
+            ("fresh (no requests)", lambda: scrape_sites(urls, fetcher(fresh_seconds=3600))),
+        ]:
+            start = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - start
+            print(f"{label:<24} {elapsed:>8.2f} {args.sites / elapsed:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
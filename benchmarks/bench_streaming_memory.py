@@ -0,0 +1,90 @@
+"""
+Peak traced memory (tracemalloc) of whole-file scoring versus streaming
+chunked scoring of a synthetic merchants CSV, with offline enrichment.
+Wall times include tracemalloc overhead and are only comparable to each other.
+
+Usage:
+    python -m benchmarks.bench_streaming_memory --merchants 500000 --chunksize 50000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks._synthetic import (
+    COUNTRIES,
+    PDF_TEXT,
+    SCRAPE_DATA,
+    make_country_metadata,
+    make_feature_frame,
+    make_internal_risk,
+    make_merchants,
+)
+from features.feature_pipeline import build_feature_frame
+from ingestion.country_cache import CountryMetadataCache
+from ingestion.csv_loader import load_merchants_csv
+from model.predict import predict_risk
+from model.train import train_risk_model
+from pipeline.streaming import SCORED_COLUMNS, score_merchants_streaming
+
+
+def _profile(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2 ** 20, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--merchants", type=int, default=500_000)
+    parser.add_argument("--chunksize", type=int, default=50_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            model, _ = train_risk_model(make_feature_frame(5000))
+
+        make_merchants(args.merchants).to_csv("merchants.csv", index=False)
+        size_mb = os.path.getsize("merchants.csv") / 2 ** 20
+
+        country_cache = CountryMetadataCache(
+            db_path="countries.sqlite",
+            fetcher=lambda c: {"region": COUNTRIES[c][0], "subregion": COUNTRIES[c][1]},
+        )
+
+        def whole_file():
+            df = load_merchants_csv("merchants.csv")
+            df = build_feature_frame(
+                df, make_internal_risk(df["merchant_id"]), make_country_metadata(),
+                PDF_TEXT, SCRAPE_DATA,
+            )
+            predict_risk(df, model=model)[SCORED_COLUMNS].to_csv("scored_full.csv", index=False)
+
+        def streaming():
+            score_merchants_streaming(
+                "merchants.csv", "scored_stream.csv",
+                chunksize=args.chunksize, model=model,
+                internal_risk_fetcher=make_internal_risk,
+                country_cache=country_cache,
+                pdf_text=PDF_TEXT, scrape_data=SCRAPE_DATA,
+            )
+
+        print(f"input: {args.merchants} merchants, {size_mb:.1f} MiB CSV")
+        print(f"{'mode':<28} {'peak MiB':>9} {'seconds':>8}")
+        for label, fn in [("whole file", whole_file), (f"streaming chunks={args.chunksize}", streaming)]:
+            peak, elapsed = _profile(fn)
+            print(f"{label:<28} {peak:>9.1f} {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
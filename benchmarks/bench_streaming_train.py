@@ -0,0 +1,70 @@
+"""
+Peak traced memory (tracemalloc) and validation AUC of in-memory
+training (read the whole feature CSV, train_risk_model) versus
+out-of-core partial_fit training over the same file in chunks.
+
+Usage:
+    python -m benchmarks.bench_streaming_train --rows 1000000 --chunksize 50000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+from benchmarks._synthetic import make_feature_frame
+from model.streaming_train import train_risk_model_streaming
+from model.train import train_risk_model
+
+
+def _profile(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak / 2 ** 20, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunksize", type=int, default=50_000)
+    parser.add_argument("--epochs", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+
+        make_feature_frame(args.rows).to_csv("features.csv", index=False)
+        size_mb = os.path.getsize("features.csv") / 2 ** 20
+
+        def in_memory():
+            with contextlib.redirect_stdout(io.StringIO()):
+                train_risk_model(pd.read_csv("features.csv"))
+
+        def streaming():
+            with contextlib.redirect_stdout(io.StringIO()):
+                return train_risk_model_streaming(
+                    "features.csv", chunksize=args.chunksize, epochs=args.epochs,
+                    output_path="streamed.pkl",
+                )[2]["auc"]
+
+        print(f"input: {args.rows} rows, {size_mb:.1f} MiB feature CSV")
+        print(f"{'mode':<28} {'peak MiB':>9} {'seconds':>8} {'AUC':>7}")
+
+        _, peak, elapsed = _profile(in_memory)
+        print(f"{'in memory':<28} {peak:>9.1f} {elapsed:>8.2f} {'':>7}")
+
+        auc, peak, elapsed = _profile(streaming)
+        print(f"{f'streaming chunks={args.chunksize}':<28} {peak:>9.1f} {elapsed:>8.2f} {auc:>7.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Keyword count throughput (MB/s) of the compiled KeywordMatcher versus one
+`text.lower().count(term)` pass per term, as the keyword list grows.
+
+Usage:
+    python -m benchmarks.bench_text_signals --megabytes 20 --terms 6 50 200 1000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from features.text_signals import DEFAULT_TERMS, KeywordMatcher
+
+
+def _corpus(megabytes: float, seed: int = 0) -> str:
+    rng = np.random.default_rng(seed)
+    letters = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    vocabulary = ["".join(rng.choice(letters, rng.integers(3, 11))) for _ in range(20_000)]
+    vocabulary += DEFAULT_TERMS
+
+    words = rng.choice(vocabulary, int(megabytes * 2 ** 20 / 8))
+    return " ".join(words)
+
+
+def _terms(n: int, seed: int = 1) -> list:
+    rng = np.random.default_rng(seed)
+    letters = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    extra = ["".join(rng.choice(letters, rng.integers(6, 15))) for _ in range(max(n - len(DEFAULT_TERMS), 0))]
+    return (DEFAULT_TERMS + extra)[:n]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--megabytes", type=float, default=20)
+    parser.add_argument("--terms", type=int, nargs="+", default=[6, 50, 200, 1000])
+    args = parser.parse_args()
+
+    text = _corpus(args.megabytes)
+    size_mb = len(text) / 2 ** 20
+
+    print(f"corpus: {size_mb:.1f} MiB")
+    print(f"{'terms':>6} {'matcher MB/s':>13} {'naive MB/s':>11}")
+
+    for n in args.terms:
+        terms = _terms(n)
+        matcher = KeywordMatcher(terms)
+
+        start = time.perf_counter()
+        matcher.count(text)
+        compiled = size_mb / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        lowered = text.lower()
+        [lowered.count(term) for term in terms]
+        naive = size_mb / (time.perf_counter() - start)
+
+        print(f"{n:>6} {compiled:>13.1f} {naive:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from features.text_signals import DEFAULT_MATCHER, term_column
+
+
+RISK_FLAG_MAP = {
+    "low": 0,
+    "medium": 1,
+    "high": 2
+}
+
+HIGH_RISK_REGIONS = ["Africa", "South America"]
+
+PDF_RISK_KEYWORDS = ["fraud", "lawsuit", "bankruptcy"]
+
+PDF_MENTION_TERMS = {
+    "pdf_mentions_refunds": "refund",
+    "pdf_mentions_chargeback": "chargeback",
+    "pdf_mentions_complaint": "complaint",
+}
+
+# Probability cutoffs published with every model and used by batch and
+# online scoring alike (High > 0.7, Medium > 0.3)
+TIER_HIGH_CUTOFF = 0.7
+TIER_MEDIUM_CUTOFF = 0.3
+
+# Calibrated threshold for imbalance: predicted_high_risk is probability > 0.25
+PREDICTION_THRESHOLD = 0.25
+
+
+# -----------------------------
+# Enrichment joins
+# -----------------------------
+
+def join_on_key(df: pd.DataFrame, lookup: pd.DataFrame, key: str) -> pd.DataFrame:
+    """
+    Left-joins lookup onto df by key. Columns supplied by lookup replace
+    any existing columns of the same name; row order is preserved.
+    """
+
+    overlap = [c for c in lookup.columns if c != key and c in df.columns]
+    base = df.drop(columns=overlap).reset_index(drop=True)
+
+    return base.merge(lookup, on=key, how="left", validate="many_to_one")
+
+
+# -----------------------------
+# External signals
+# -----------------------------
+
+def _pdf_signals(mentioned) -> dict:
+    # mentioned(term) is a bool for shared text or a boolean array per row
+    signals = {column: mentioned(term) * 1 for column, term in PDF_MENTION_TERMS.items()}
+    signals["pdf_risk_signal"] = sum(mentioned(word) for word in PDF_RISK_KEYWORDS) / len(PDF_RISK_KEYWORDS)
+    return signals
+
+
+def extract_pdf_risk_signal(pdf_text):
+
+    counts = DEFAULT_MATCHER.counts(pdf_text or "")
+    return _pdf_signals(lambda term: counts[term] > 0)["pdf_risk_signal"]
+
+
+def build_external_features(df, pdf_text, scrape_data, document_signals: Optional[pd.DataFrame] = None):
+    """
+    Adds PDF, web and internal API signal columns.
+
+    PDF signals come from one keyword scan of the shared pdf_text. With
+    document_signals (per-merchant term counts from
+    features.text_signals.merchant_term_counts), merchants that have
+    their own documents get signals from those instead, and the term
+    count columns are joined onto the frame.
+    """
+
+    # One scan of the shared text for every term
+    shared = DEFAULT_MATCHER.counts(pdf_text or "")
+
+    # ---- PDF Risk Signals ----
+    if document_signals is None:
+        pdf_signals = _pdf_signals(lambda term: shared[term] > 0)
+    else:
+        df = join_on_key(df, document_signals, "merchant_id")
+
+        count_columns = [c for c in document_signals.columns if c != "merchant_id"]
+        df[count_columns] = df[count_columns].fillna(0).astype("int64")
+
+        has_documents = df["document_count"].to_numpy() > 0
+        pdf_signals = _pdf_signals(
+            lambda term: np.where(has_documents, df[term_column(term)].to_numpy() > 0, shared[term] > 0)
+        )
+
+    for column in PDF_MENTION_TERMS:
+        df[column] = pdf_signals[column]
+
+    # ---- Web Scrape Signals ----
+    df["num_value_props"] = len(scrape_data.get("value_propositions", []))
+    df["num_public_stats"] = len(scrape_data.get("public_stats", []))
+    df["num_partners"] = len(scrape_data.get("partners", []))
+
+    # ---- Internal API Signals ----
+    # Validate unknown categories
+    unknown_flags = set(df["internal_risk_flag"].dropna().unique()) - set(RISK_FLAG_MAP.keys())
+
+    if unknown_flags:
+        print(f"WARNING: Unknown internal risk flags found: {unknown_flags}")
+
+    # Unknown or missing flags fall back to medium
+    df["internal_flag_numeric"] = df["internal_risk_flag"].map(RISK_FLAG_MAP).fillna(1)
+
+    # ---- Country Risk Proxy ----
+    df["is_high_risk_region"] = df["region"].isin(HIGH_RISK_REGIONS).astype(int)
+
+    df["pdf_risk_signal"] = pdf_signals["pdf_risk_signal"]
+
+    return df
+
+
+# -----------------------------
+# Behavioral rates and scores
+# -----------------------------
+
+def compute_behavioral_rates(df: pd.DataFrame) -> pd.DataFrame:
+
+    df["transaction_count"] = df["transaction_count"].replace(0, 1)
+    df["chargeback_rate"] = df["dispute_count"] / df["transaction_count"]
+    df["fraud_rate"] = df["chargeback_rate"] * 0.6
+
+    return df
+
+
+def compute_country_risk(df: pd.DataFrame) -> pd.DataFrame:
+
+    if {"chargeback_rate", "fraud_rate"}.issubset(df.columns):
+
+        # Grouped transform broadcasts per-country means without a lookup map
+        country_means = (
+            df.groupby("country")[["chargeback_rate", "fraud_rate"]]
+            .transform("mean")
+        )
+
+        df["country_risk_score"] = country_means.mean(axis=1)
+
+    else:
+        df["country_risk_score"] = 0.0
+
+    return df
+
+
+def compute_composite_risk_score(df: pd.DataFrame) -> pd.DataFrame:
+
+    df["risk_score"] = (
+        0.4 * df["chargeback_rate"] +
+        0.3 * df["fraud_rate"] +
+        0.2 * df["internal_flag_numeric"] +
+        0.1 * df["country_risk_score"]
+    )
+
+    return df
+
+
+def assign_risk_tier(
+    probabilities,
+    high: float = TIER_HIGH_CUTOFF,
+    medium: float = TIER_MEDIUM_CUTOFF,
+) -> np.ndarray:
+    """
+    Maps risk probabilities to High / Medium / Low in one vectorized pass.
+    Missing probabilities map to Low, as the scalar comparisons did.
+    """
+
+    p = np.asarray(probabilities, dtype=np.float64)
+
+    return np.select([p > high, p > medium], ["High", "Medium"], default="Low").astype(object)
+
+
+# -----------------------------
+# Single feature stage
+# -----------------------------
+
+def build_feature_frame(
+    df: pd.DataFrame,
+    internal_df: pd.DataFrame,
+    country_df: pd.DataFrame,
+    pdf_text: str,
+    scrape_data: dict,
+    document_signals: Optional[pd.DataFrame] = None,
+) -> pd.DataFrame:
+    """
+    Builds the full modelling frame from the merchant CSV rows, the
+    internal risk payloads (one row per merchant_id) and the country
+    metadata (one row per country), using joins and column arithmetic only.
+    document_signals optionally adds per-merchant document term counts.
+    """
+
+    df = join_on_key(df, internal_df, "merchant_id")
+    df = join_on_key(df, country_df, "country")
+
+    df = build_external_features(df, pdf_text, scrape_data, document_signals)
+    df = compute_behavioral_rates(df)
+    df = compute_country_risk(df)
+    df = compute_composite_risk_score(df)
+
+    return df
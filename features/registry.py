@@ -0,0 +1,180 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class FeatureSpec:
+    """
+    Declares one model input.
+
+    source   -- where the column comes from (csv, internal_api, country,
+                pdf, web, derived, label)
+    compute  -- builds the column from other columns; None means the
+                column must already be present on the frame
+    fallback -- compute only fills rows where the source value is
+                missing; source values are never overwritten
+    """
+
+    name: str
+    dtype: str
+    source: str
+    compute: Optional[Callable[[pd.DataFrame], pd.Series]] = None
+    depends_on: Tuple[str, ...] = ()
+    fallback: bool = False
+
+
+def _ratio(numerator: str, denominator: str):
+    return lambda df: df[numerator] / df[denominator]
+
+
+FEATURE_SPECS = [
+    # Core transactional
+    FeatureSpec("monthly_volume", "float64", "csv"),
+    FeatureSpec("transaction_count", "float64", "csv"),
+    FeatureSpec("dispute_count", "float64", "csv"),
+    FeatureSpec(
+        "dispute_rate", "float64", "derived",
+        compute=_ratio("dispute_count", "transaction_count"),
+        depends_on=("dispute_count", "transaction_count"),
+    ),
+
+    # Internal API (monthly ratio only used where the API value is absent)
+    FeatureSpec(
+        "avg_ticket_size", "float64", "internal_api",
+        compute=_ratio("monthly_volume", "transaction_count"),
+        depends_on=("monthly_volume", "transaction_count"),
+        fallback=True,
+    ),
+    FeatureSpec("last_30d_volume", "float64", "internal_api"),
+    FeatureSpec("last_30d_txn_count", "float64", "internal_api"),
+    FeatureSpec("internal_flag_numeric", "float64", "internal_api"),
+
+    # Country risk
+    FeatureSpec("is_high_risk_region", "float64", "country"),
+
+    # PDF signals
+    FeatureSpec("pdf_mentions_refunds", "float64", "pdf"),
+    FeatureSpec("pdf_mentions_chargeback", "float64", "pdf"),
+    FeatureSpec("pdf_mentions_complaint", "float64", "pdf"),
+
+    # Web signals
+    FeatureSpec("num_value_props", "float64", "web"),
+    FeatureSpec("num_public_stats", "float64", "web"),
+    FeatureSpec("num_partners", "float64", "web"),
+
+    # Training label
+    FeatureSpec(
+        "high_risk", "int64", "label",
+        compute=lambda df: (df["dispute_rate"] > 0.002).astype(int),
+        depends_on=("dispute_rate",),
+    ),
+]
+
+FEATURE_REGISTRY: Dict[str, FeatureSpec] = {spec.name: spec for spec in FEATURE_SPECS}
+
+MODEL_FEATURES: List[str] = [
+    "monthly_volume",
+    "transaction_count",
+    "dispute_rate",
+    "avg_ticket_size",
+    "last_30d_volume",
+    "last_30d_txn_count",
+    "internal_flag_numeric",
+    "is_high_risk_region",
+    "pdf_mentions_refunds",
+    "pdf_mentions_chargeback",
+    "pdf_mentions_complaint",
+    "num_value_props",
+    "num_public_stats",
+    "num_partners",
+]
+
+TARGET = "high_risk"
+
+
+def _resolve(names: Iterable[str], df: pd.DataFrame, recompute: bool) -> List[str]:
+    # Depth-first dependency order of the columns compute_features must (re)build
+    order: List[str] = []
+    seen = set()
+
+    def visit(name: str):
+        if name in seen:
+            return
+        seen.add(name)
+
+        spec = FEATURE_REGISTRY.get(name)
+
+        if name in df.columns:
+            if spec is None or spec.compute is None:
+                return
+            if spec.fallback:
+                if not df[name].isna().any():
+                    return
+            elif not recompute:
+                return
+        else:
+            if spec is None:
+                raise KeyError(f"Unknown feature: {name}")
+            if spec.compute is None:
+                raise ValueError(f"Missing {spec.source} column required by model: {name}")
+
+        for dependency in spec.depends_on:
+            visit(dependency)
+        order.append(name)
+
+    for name in names:
+        visit(name)
+
+    return order
+
+
+def compute_features(
+    df: pd.DataFrame,
+    names: Iterable[str] = MODEL_FEATURES,
+    recompute: bool = False,
+) -> pd.DataFrame:
+    """
+    Adds the requested features (and only their dependencies) to df.
+
+    Derived columns already on the frame are treated as cached and reused,
+    so training and prediction over the same frame share one compute pass.
+    Pass recompute=True for frames from outside the pipeline, so derived
+    columns (e.g. a caller-supplied dispute_rate) are rebuilt from their
+    inputs instead of trusted. Fallback columns (avg_ticket_size) keep
+    every source value and are filled only in rows where it is missing.
+    """
+
+    for name in _resolve(names, df, recompute):
+        spec = FEATURE_REGISTRY[name]
+        values = spec.compute(df)
+        df[name] = df[name].fillna(values) if spec.fallback and name in df.columns else values
+
+    return df
+
+
+def feature_matrix(df: pd.DataFrame, names: Iterable[str] = MODEL_FEATURES) -> pd.DataFrame:
+    """
+    Returns the model inputs with their registered dtypes.
+    """
+
+    names = list(names)
+    compute_features(df, names)
+
+    dtypes = {name: FEATURE_REGISTRY[name].dtype for name in names if name in FEATURE_REGISTRY}
+
+    return df[names].astype(dtypes)
+
+
+def feature_array(df: pd.DataFrame, names: Iterable[str] = MODEL_FEATURES) -> np.ndarray:
+    """
+    Model inputs as one C-contiguous float64 matrix, skipping the
+    intermediate typed DataFrame built by feature_matrix.
+    """
+
+    names = list(names)
+    compute_features(df, names)
+
+    return np.ascontiguousarray(df[names].to_numpy(dtype=np.float64))
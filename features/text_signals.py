@@ -0,0 +1,122 @@
+import re
+from typing import Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_TERMS = ["refund", "chargeback", "complaint", "fraud", "lawsuit", "bankruptcy"]
+
+
+def _trie_pattern(terms: Iterable[str]) -> str:
+    # Shared prefixes collapse into one branch, so the regex does the same
+    # amount of work per character whether there are ten terms or a thousand
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def render(node: dict) -> str:
+        branches = [re.escape(ch) + render(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+        # A term ends here but longer ones continue: greedy, so longest first
+        return f"(?:{body})?" if "" in node else body
+
+    return render(trie)
+
+
+class KeywordMatcher:
+    """
+    Counts occurrences of many keywords / phrases in one pass over a text.
+
+    Matching is case-insensitive substring matching, the same as
+    `term in text.lower()`, and overlapping occurrences all count: with
+    terms "charge" and "chargeback", "chargeback" counts once for each.
+    """
+
+    def __init__(self, terms: Iterable[str] = DEFAULT_TERMS):
+        self.terms: List[str] = list(dict.fromkeys(t.lower() for t in terms))
+
+        if not self.terms or not all(self.terms):
+            raise ValueError("KeywordMatcher needs at least one non-empty term")
+
+        self._index: Dict[str, int] = {term: i for i, term in enumerate(self.terms)}
+
+        # A lookahead matches at every start position; the capture is the
+        # longest term starting there, and every shorter term starting
+        # there is one of its prefixes
+        self._pattern = re.compile(f"(?=({_trie_pattern(self.terms)}))")
+        self._prefix_terms: Dict[str, List[int]] = {
+            term: [self._index[term[:n]] for n in range(1, len(term) + 1) if term[:n] in self._index]
+            for term in self.terms
+        }
+
+    def count(self, text: str) -> np.ndarray:
+        """Occurrences of each term in text, aligned with self.terms."""
+
+        counts = np.zeros(len(self.terms), dtype=np.int64)
+        if not text:
+            return counts
+
+        for match in self._pattern.finditer(text.lower()):
+            for i in self._prefix_terms[match.group(1)]:
+                counts[i] += 1
+
+        return counts
+
+    def count_many(self, texts: Iterable[str]) -> np.ndarray:
+        """(documents x terms) count matrix."""
+
+        rows = [self.count(text) for text in texts]
+        if not rows:
+            return np.zeros((0, len(self.terms)), dtype=np.int64)
+        return np.vstack(rows)
+
+    def counts(self, text: str) -> Dict[str, int]:
+        return dict(zip(self.terms, self.count(text).tolist()))
+
+
+DEFAULT_MATCHER = KeywordMatcher()
+
+
+def term_column(term: str) -> str:
+    return "term_" + re.sub(r"\W+", "_", term).strip("_")
+
+
+# -----------------------------
+# Per document / per merchant
+# -----------------------------
+
+def document_term_counts(documents: pd.DataFrame, matcher: KeywordMatcher = DEFAULT_MATCHER) -> pd.DataFrame:
+    """
+    One row per document (merchant_id, document) with a term_<term>
+    count column per matcher term.
+    """
+
+    counts = pd.DataFrame(
+        matcher.count_many(documents["text"]),
+        columns=[term_column(t) for t in matcher.terms],
+    )
+
+    return pd.concat([documents[["merchant_id", "document"]].reset_index(drop=True), counts], axis=1)
+
+
+def merchant_term_counts(doc_counts: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sums document counts per merchant, one row per merchant_id, with the
+    number of documents in document_count.
+    """
+
+    term_columns = [c for c in doc_counts.columns if c.startswith("term_")]
+    grouped = doc_counts.groupby("merchant_id", sort=False)
+
+    merchant_counts = grouped[term_columns].sum()
+    merchant_counts.insert(0, "document_count", grouped.size())
+
+    return merchant_counts.reset_index()
@@ -0,0 +1,172 @@
+import asyncio
+import json
+import logging
+import random
+from typing import Optional, Sequence
+
+import aiohttp
+import numpy as np
+import pandas as pd
+
+from ingestion.simulated_api_client import BASE_URL
+
+logger = logging.getLogger(__name__)
+
+
+INTERNAL_RISK_COLUMNS = [
+    "internal_risk_flag",
+    "last_30d_volume",
+    "last_30d_txn_count",
+    "avg_ticket_size",
+    "last_review_date",
+]
+
+# Status codes worth retrying; anything else in the 4xx range is a bad request
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class _RetryableError(Exception):
+    pass
+
+
+async def _request_with_retries(
+    session: aiohttp.ClientSession,
+    method: str,
+    url: str,
+    retries: int,
+    backoff: float,
+    payload: Optional[dict] = None,
+) -> list:
+    """
+    Sends one request on the shared session, retrying transient
+    failures with exponential backoff and jitter.
+
+    Single-merchant responses are returned as a one-element list and
+    NDJSON batch responses as one element per line.
+    """
+
+    for attempt in range(retries + 1):
+        try:
+            async with session.request(method, url, json=payload) as response:
+                if response.status in RETRYABLE_STATUS:
+                    raise _RetryableError(f"HTTP {response.status}")
+                if response.status >= 400:
+                    raise RuntimeError(f"API call failed for {url}: HTTP {response.status}")
+
+                if payload is None:
+                    return [await response.json()]
+
+                return [json.loads(line) async for line in response.content if line.strip()]
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, _RetryableError) as e:
+            if attempt == retries:
+                raise RuntimeError(f"API call failed for {url} after {retries + 1} attempts: {e}")
+
+            delay = backoff * (2 ** attempt) * (1 + random.random())
+            logger.debug(f"Retrying {url} in {delay:.2f}s ({e})")
+            await asyncio.sleep(delay)
+
+
+async def fetch_internal_risk_frame_async(
+    merchant_ids: Sequence[str],
+    base_url: str = BASE_URL,
+    concurrency: int = 64,
+    retries: int = 3,
+    backoff: float = 0.1,
+    timeout: float = 5.0,
+    batch_size: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Fetches internal risk payloads for many merchants over one pooled
+    connection with at most `concurrency` requests in flight.
+
+    With batch_size set, merchants are sent in chunks to the bulk
+    /risk/batch endpoint instead of one GET per merchant.
+
+    Responses are written straight into preallocated column arrays, so
+    the result is a DataFrame aligned with `merchant_ids` (one row each).
+    Raises RuntimeError if any merchant cannot be fetched or a payload
+    comes back for a different merchant than requested.
+
+    timeout bounds connecting and each socket read, not the whole
+    request, so large streamed batches are not cut off while data keeps
+    arriving.
+    """
+
+    merchant_ids = list(merchant_ids)
+    n = len(merchant_ids)
+
+    flags = np.empty(n, dtype=object)
+    volumes = np.empty(n, dtype=np.float64)
+    txn_counts = np.empty(n, dtype=np.int64)
+    ticket_sizes = np.empty(n, dtype=np.float64)
+    review_dates = np.empty(n, dtype=object)
+
+    step = batch_size or 1
+    chunk_starts = iter(range(0, n, step))
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    client_timeout = aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout) as session:
+
+        async def worker():
+            # Workers share one chunk iterator instead of spawning a task per merchant
+            for start in chunk_starts:
+                chunk = merchant_ids[start:start + step]
+                if batch_size:
+                    payloads = await _request_with_retries(
+                        session, "POST", f"{base_url}/risk/batch", retries, backoff,
+                        payload={"merchant_ids": chunk},
+                    )
+                    if len(payloads) != len(chunk):
+                        raise RuntimeError(
+                            f"Batch API returned {len(payloads)} rows for {len(chunk)} merchants"
+                        )
+                else:
+                    payloads = await _request_with_retries(
+                        session, "GET", f"{base_url}/risk/{chunk[0]}", retries, backoff
+                    )
+
+                for i, (merchant_id, payload) in enumerate(zip(chunk, payloads), start=start):
+                    # Rows are placed by position, so each must be for the merchant asked for
+                    if payload.get("merchant_id") != merchant_id:
+                        raise RuntimeError(
+                            f"Risk API returned a payload for {payload.get('merchant_id')!r} "
+                            f"where {merchant_id!r} was requested"
+                        )
+
+                    summary = payload["transaction_summary"]
+
+                    flags[i] = payload["internal_risk_flag"]
+                    volumes[i] = summary["last_30d_volume"]
+                    txn_counts[i] = summary["last_30d_txn_count"]
+                    ticket_sizes[i] = summary["avg_ticket_size"]
+                    review_dates[i] = payload.get("last_review_date")
+
+        n_workers = max(1, min(concurrency, -(-n // step)))
+        workers = [asyncio.create_task(worker()) for _ in range(n_workers)]
+
+        try:
+            await asyncio.gather(*workers)
+        except Exception:
+            for task in workers:
+                task.cancel()
+            raise
+
+    return pd.DataFrame({
+        "merchant_id": merchant_ids,
+        "internal_risk_flag": flags,
+        "last_30d_volume": volumes,
+        "last_30d_txn_count": txn_counts,
+        "avg_ticket_size": ticket_sizes,
+        "last_review_date": review_dates,
+    })
+
+
+def fetch_internal_risk_frame(merchant_ids: Sequence[str], **kwargs) -> pd.DataFrame:
+    """
+    Synchronous wrapper around fetch_internal_risk_frame_async.
+    """
+
+    return asyncio.run(fetch_internal_risk_frame_async(merchant_ids, **kwargs))
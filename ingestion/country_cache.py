@@ -0,0 +1,233 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional
+
+import pandas as pd
+
+from ingestion.rest_countries_client import FALLBACK_METADATA, request_country_metadata
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CACHE_PATH = "data/cache/country_metadata.sqlite"
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600  # country regions rarely change
+
+COUNTRY_COLUMNS = ["region", "subregion"]
+
+
+class CountryMetadataCache:
+    """
+    Two-level cache for REST Countries metadata.
+
+    Lookups hit an in-process dict first, then a SQLite store on disk,
+    and only then the live API. Disk entries older than ttl_seconds are
+    refreshed; if the refresh fails the stale entry is still served, so
+    enrichment keeps working offline. In-process entries expire with the
+    same TTL. Stale and fallback values for countries that could not be
+    resolved are neither memoized nor persisted, so the next lookup
+    retries the API.
+    """
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_CACHE_PATH,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        fetcher: Callable[[str], Dict] = request_country_metadata,
+        max_workers: int = 8,
+    ):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.fetcher = fetcher
+        self.max_workers = max_workers
+
+        # country -> (metadata, fetched_at), expiring like disk entries
+        self._memory: Dict[str, tuple] = {}
+        self._disk: Optional[Dict[str, tuple]] = None
+        self._lock = threading.Lock()
+
+    # -----------------------------
+    # Disk store
+    # -----------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        directory = os.path.dirname(self.db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS country_metadata (
+                country TEXT PRIMARY KEY,
+                region TEXT,
+                subregion TEXT,
+                fetched_at REAL NOT NULL
+            )
+            """
+        )
+        return conn
+
+    def _load_disk(self) -> Dict[str, tuple]:
+        # The whole table is a few hundred rows, so read it once per process
+        if self._disk is None:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    "SELECT country, region, subregion, fetched_at FROM country_metadata"
+                ).fetchall()
+            self._disk = {
+                country: ({"region": region, "subregion": subregion}, fetched_at)
+                for country, region, subregion, fetched_at in rows
+            }
+        return self._disk
+
+    def _store(self, results: Dict[str, Dict]) -> None:
+        if not results:
+            return
+
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO country_metadata VALUES (?, ?, ?, ?)",
+                [
+                    (country, data["region"], data["subregion"], now)
+                    for country, data in results.items()
+                ],
+            )
+
+        disk = self._load_disk()
+        for country, data in results.items():
+            disk[country] = (data, now)
+
+    # -----------------------------
+    # Lookups
+    # -----------------------------
+
+    def _fetch(self, country: str):
+        try:
+            return country, self.fetcher(country)
+        except Exception as e:
+            return country, e
+
+    def get_many(self, countries: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Resolves each distinct country once, fetching cache misses
+        concurrently. The network fetch runs outside the lock, so callers
+        whose countries are cached are never queued behind slow I/O.
+        """
+
+        countries = list(dict.fromkeys(countries))
+
+        with self._lock:
+            disk = self._load_disk()
+            now = time.time()
+
+            results = {}
+            to_fetch = []
+
+            for country in countries:
+                memory = self._memory.get(country)
+                if memory and now - memory[1] < self.ttl_seconds:
+                    results[country] = memory[0]
+                    continue
+
+                cached = disk.get(country)
+                if cached and now - cached[1] < self.ttl_seconds:
+                    results[country] = cached[0]
+                    self._memory[country] = cached
+                else:
+                    to_fetch.append(country)
+
+        if not to_fetch:
+            return results
+
+        workers = max(1, min(self.max_workers, len(to_fetch)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            fetched = list(pool.map(self._fetch, to_fetch))
+
+        fresh = {country: outcome for country, outcome in fetched if not isinstance(outcome, Exception)}
+
+        with self._lock:
+            self._store(fresh)
+            now = time.time()
+            for country, data in fresh.items():
+                results[country] = data
+                self._memory[country] = (data, now)
+
+            # Stale and fallback values are served but not memoized, so the
+            # next lookup retries the API instead of pinning a failure
+            disk = self._load_disk()
+            for country, outcome in fetched:
+                if country in fresh:
+                    continue
+
+                stale = disk.get(country)
+                if stale:
+                    logger.warning(
+                        f"REST Countries API failed for {country}: {outcome}. Using cached entry."
+                    )
+                    results[country] = stale[0]
+                else:
+                    logger.warning(
+                        f"REST Countries API failed for {country}: {outcome}. Using fallback."
+                    )
+                    results[country] = dict(FALLBACK_METADATA)
+
+        return results
+
+    def get(self, country: str) -> Dict:
+        return dict(self.get_many([country])[country])
+
+    def prefetch_frame(self, countries: Iterable[str]) -> pd.DataFrame:
+        """
+        Returns one row per distinct country with its region and subregion,
+        ready to be merged onto a merchant frame.
+        """
+
+        resolved = self.get_many(countries)
+
+        return pd.DataFrame(
+            [
+                {"country": country, **{c: data.get(c) for c in COUNTRY_COLUMNS}}
+                for country, data in resolved.items()
+            ],
+            columns=["country"] + COUNTRY_COLUMNS,
+        )
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._disk = None
+
+
+_default_cache: Optional[CountryMetadataCache] = None
+
+
+def get_country_cache() -> CountryMetadataCache:
+    """
+    Process-wide cache shared by the pipeline and services.
+    """
+
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = CountryMetadataCache()
+    return _default_cache
+
+
+def enrich_with_country_cache(
+    df: pd.DataFrame, cache: Optional[CountryMetadataCache] = None
+) -> pd.DataFrame:
+    """
+    Joins country metadata onto df, resolving each distinct country once.
+    """
+
+    cache = cache or get_country_cache()
+    country_df = cache.prefetch_frame(df["country"].dropna().unique())
+
+    base = df.drop(columns=[c for c in COUNTRY_COLUMNS if c in df.columns])
+
+    return base.merge(country_df, on="country", how="left", validate="many_to_one")
@@ -1,17 +1,161 @@
+import logging
+import os
+from typing import Iterator, List, Optional
+
+import numpy as np
 import pandas as pd
-from ingestion.schema_validation import validate_schema
+from ingestion.schema_validation import ERRORS_COLUMN, quarantine_merchants, validate_schema
+
+logger = logging.getLogger(__name__)
+
 
+# Explicit dtypes avoid per-chunk type inference and object columns for numbers
+MERCHANT_DTYPES = {
+    "merchant_id": str,
+    "name": str,
+    "country": str,
+    "registration_number": str,
+    "monthly_volume": "float64",
+    "dispute_count": "int64",
+    "transaction_count": "int64",
+}
 
-def load_merchants_csv(file_path: str) -> pd.DataFrame:
-    
-    # Loads merchants CSV and validates schema.
-    
+
+def load_merchants_csv(file_path: str, quarantine_path: Optional[str] = None) -> pd.DataFrame:
+    """
+    Loads merchants CSV and validates schema. With quarantine_path,
+    invalid rows are written there instead of failing the load.
+    """
 
     try:
         df = pd.read_csv(file_path)
     except Exception as e:
         raise ValueError(f"Error reading CSV file: {e}")
 
-    validate_schema(df)
+    if quarantine_path is None:
+        validate_schema(df)
+        return df
+
+    _remove_stale(quarantine_path)
+    df, rejected, _ = quarantine_merchants(df)
+    _write_quarantine(rejected, quarantine_path)
+
+    return _as_numeric(df, MERCHANT_DTYPES)
+
+
+# -----------------------------
+# Quarantine
+# -----------------------------
+
+def _remove_stale(quarantine_path: str) -> None:
+    if os.path.exists(quarantine_path):
+        os.remove(quarantine_path)
 
+
+def _write_quarantine(rejected: pd.DataFrame, quarantine_path: str) -> None:
+    # Appends rejected rows (with the rules they broke); the header is written once
+    if not len(rejected):
+        return
+
+    exists = os.path.exists(quarantine_path)
+    rejected.to_csv(quarantine_path, mode="a", header=not exists, index=False)
+    logger.warning(f"Quarantined {len(rejected)} invalid merchant rows to {quarantine_path}")
+
+
+def _as_numeric(df: pd.DataFrame, dtype: dict) -> pd.DataFrame:
+    # Rows that passed quarantine parse as numbers; restore the declared dtypes
+    for column, column_dtype in dtype.items():
+        if column in df and column_dtype not in (str, object) and not pd.api.types.is_numeric_dtype(df[column]):
+            values = pd.to_numeric(df[column])
+            try:
+                df[column] = values.astype(column_dtype)
+            except (TypeError, ValueError):
+                df[column] = values  # e.g. missing values in an integer column
     return df
+
+
+class _SeenMerchantIds:
+    """
+    64-bit merchant_id hashes (8 bytes per merchant) used to catch
+    duplicates that span chunks, held as sorted runs whose sizes at least
+    halve from one run to the next. Each chunk is sorted on its own and
+    merged only into runs of comparable size, so recording n ids costs
+    O(n log n) overall instead of re-sorting the whole history per chunk.
+    """
+
+    def __init__(self):
+        self._runs: List[np.ndarray] = []
+
+    def add_chunk(self, merchant_ids: pd.Series) -> pd.Series:
+        """
+        Records the chunk's ids and returns a mask of ids seen in earlier chunks.
+        """
+
+        if merchant_ids.empty:
+            return pd.Series(False, index=merchant_ids.index)
+
+        hashes = pd.util.hash_pandas_object(merchant_ids, index=False).to_numpy()
+
+        seen = np.zeros(len(hashes), dtype=bool)
+        for run in self._runs:
+            positions = np.searchsorted(run, hashes).clip(max=len(run) - 1)
+            seen |= run[positions] == hashes
+
+        run = np.sort(hashes)
+        while self._runs and len(self._runs[-1]) <= 2 * len(run):
+            # Stable sort of two sorted runs is a linear merge
+            run = np.sort(np.concatenate([self._runs.pop(), run]), kind="stable")
+        self._runs.append(run)
+
+        return pd.Series(seen, index=merchant_ids.index)
+
+
+def iter_merchants_csv(
+    file_path: str,
+    chunksize: int = 100_000,
+    dtype: dict = MERCHANT_DTYPES,
+    quarantine_path: Optional[str] = None,
+) -> Iterator[pd.DataFrame]:
+    """
+    Streams the merchants CSV in chunks of chunksize rows, validating each
+    chunk as it is read. Duplicate merchant_ids are detected across chunks.
+    Raises ValueError on the first invalid chunk, or with quarantine_path
+    appends invalid rows (and cross-chunk duplicates) to that CSV, with a
+    validation_errors column, and yields only the valid rows.
+    """
+
+    seen_ids = _SeenMerchantIds()
+
+    if quarantine_path is not None:
+        _remove_stale(quarantine_path)
+        # Numbers are parsed after validation, so one bad value cannot fail the read
+        read_dtype = {c: (t if t is str else str) for c, t in dtype.items()}
+    else:
+        read_dtype = dtype
+
+    try:
+        reader = pd.read_csv(file_path, chunksize=chunksize, dtype=read_dtype)
+    except Exception as e:
+        raise ValueError(f"Error reading CSV file: {e}")
+
+    with reader:
+        for chunk_number, chunk in enumerate(reader):
+            if quarantine_path is None:
+                validate_schema(chunk)
+            else:
+                chunk, rejected, _ = quarantine_merchants(chunk)
+                _write_quarantine(rejected, quarantine_path)
+                chunk = _as_numeric(chunk, dtype)
+
+            repeated = seen_ids.add_chunk(chunk["merchant_id"])
+            if repeated.any():
+                if quarantine_path is not None:
+                    _write_quarantine(chunk[repeated].assign(**{ERRORS_COLUMN: "merchant_id_unique"}), quarantine_path)
+                    chunk = chunk[~repeated]
+                else:
+                    examples = chunk.loc[repeated, "merchant_id"].head(5).tolist()
+                    raise ValueError(
+                        f"Duplicate merchant_id found across chunks (chunk {chunk_number}): {examples}"
+                    )
+
+            yield chunk
@@ -0,0 +1,158 @@
+import hashlib
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional
+
+import pandas as pd
+import pdfplumber
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CACHE_DIR = "data/cache/documents"
+
+# Files are named <merchant_id>_<anything>.pdf, e.g. M000123_q3_summary.pdf
+MERCHANT_ID_PATTERN = re.compile(r"^(M[A-Za-z0-9]+)_")
+
+# error is set (and text empty) for documents that could not be parsed
+DOCUMENT_COLUMNS = ["merchant_id", "document", "content_hash", "text", "error"]
+
+
+def iter_pdf_pages(file_path: str) -> Iterator[str]:
+    """
+    Yields the text of each page as it is parsed, so callers can stop
+    early or scan page by page without holding the whole document.
+    """
+
+    try:
+        with pdfplumber.open(file_path) as pdf:
+            for page in pdf.pages:
+                text = page.extract_text()
+                # Release the parsed layout before moving to the next page
+                page.close()
+                if text:
+                    yield text
+    except Exception as e:
+        raise RuntimeError(f"Failed to process PDF {file_path}: {e}")
+
+
+def extract_pdf_text(file_path: str) -> str:
+    return "\n".join(iter_pdf_pages(file_path))
+
+
+def _extract_or_error(file_path: str):
+    # Pool worker: one corrupt document must not fail the whole batch
+    try:
+        return extract_pdf_text(file_path), None
+    except Exception as e:
+        return "", str(e)
+
+
+def content_hash(file_path: str) -> str:
+    sha = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def merchant_id_for_document(file_path: str) -> Optional[str]:
+    match = MERCHANT_ID_PATTERN.match(os.path.basename(file_path))
+    return match.group(1) if match else None
+
+
+class DocumentTextCache:
+    """
+    Extracted text keyed by the SHA-256 of the PDF bytes, one file per
+    document. Renamed or re-uploaded copies of an unchanged PDF hit the
+    same entry; any edit to the file changes the key.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, f"{digest}.txt")
+
+    def get(self, digest: str) -> Optional[str]:
+        try:
+            with open(self._path(digest), encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, digest: str, text: str) -> None:
+        path = self._path(digest)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(f"{path}.tmp", path)
+
+
+def extract_documents(
+    directory: str,
+    max_workers: Optional[int] = None,
+    cache: Optional[DocumentTextCache] = None,
+) -> pd.DataFrame:
+    """
+    Extracts every *.pdf in directory, parsing cache misses in a process
+    pool (max_workers defaults to the CPU count). Returns one row per
+    document with merchant_id, document path, content_hash and text.
+    Documents whose name does not start with a merchant id and "_" are
+    skipped. A document that fails to parse gets empty text and its
+    error, is logged and is not cached; the others are unaffected.
+    """
+
+    cache = cache or DocumentTextCache()
+
+    paths = sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.lower().endswith(".pdf")
+    )
+
+    rows = []
+    misses: List[dict] = []
+
+    for path in paths:
+        merchant_id = merchant_id_for_document(path)
+        if merchant_id is None:
+            logger.warning(f"Skipping {path}: file name does not start with <merchant_id>_")
+            continue
+
+        digest = content_hash(path)
+        row = {"merchant_id": merchant_id, "document": path, "content_hash": digest,
+               "text": cache.get(digest), "error": None}
+        rows.append(row)
+
+        if row["text"] is None:
+            misses.append(row)
+
+    if misses:
+        logger.info(f"Parsing {len(misses)} of {len(rows)} documents ({len(rows) - len(misses)} cached)")
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            outcomes = pool.map(_extract_or_error, [row["document"] for row in misses])
+
+            for row, (text, error) in zip(misses, outcomes):
+                row["text"], row["error"] = text, error
+                if error is None:
+                    cache.put(row["content_hash"], text)
+                else:
+                    logger.warning(f"Could not parse {row['document']}: {error}")
+
+    return pd.DataFrame(rows, columns=DOCUMENT_COLUMNS)
+
+
+def merchant_document_text(documents: pd.DataFrame) -> pd.DataFrame:
+    """
+    Concatenates each merchant's documents into one text per merchant.
+    """
+
+    return (
+        documents.groupby("merchant_id", sort=False)["text"]
+        .agg("\n".join)
+        .reset_index()
+    )
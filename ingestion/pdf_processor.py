@@ -1,23 +1,12 @@
-import pdfplumber
 import asyncio
 
+from ingestion.document_processor import extract_pdf_text
+
 
 async def extract_pdf_text_async(file_path: str) -> str:
 
     # Asynchronously extracts text from a PDF file.
-    # Simulate async background processing
-    
-    await asyncio.sleep(0.1)
-
-    text_content = []
-
-    try:
-        with pdfplumber.open(file_path) as pdf:
-            for page in pdf.pages:
-                text = page.extract_text()
-                if text:
-                    text_content.append(text)
-    except Exception as e:
-        raise RuntimeError(f"Failed to process PDF: {e}")
+    # pdfplumber is synchronous, so parsing runs in a worker thread and
+    # the event loop stays free for other stages.
 
-    return "\n".join(text_content)
+    return await asyncio.to_thread(extract_pdf_text, file_path)
@@ -1,29 +1,45 @@
-import requests
 import logging
 from typing import Dict
 
 logger = logging.getLogger(__name__)
 
 
-def fetch_country_metadata(country_name: str) -> Dict:
+FALLBACK_METADATA = {
+    "region": "Unknown",
+    "subregion": "Unknown",
+}
+
+
+def request_country_metadata(country_name: str) -> Dict:
+    """
+    Looks up a country on REST Countries.
+    Raises on any network or payload error (no fallback).
+    """
+
+    import requests
 
     url = f"https://restcountries.com/v3.1/name/{country_name}"
 
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
+    response = requests.get(url, timeout=10)
+    response.raise_for_status()
 
-        data = response.json()[0]
+    data = response.json()[0]
 
-        result = {
-            "region": data.get("region"),
-            "subregion": data.get("subregion"),
-        }
+    result = {
+        "region": data.get("region"),
+        "subregion": data.get("subregion"),
+    }
 
-        if not result["region"]:
-            raise ValueError("Missing region field")
+    if not result["region"]:
+        raise ValueError("Missing region field")
 
-        return result
+    return result
+
+
+def fetch_country_metadata(country_name: str) -> Dict:
+
+    try:
+        return request_country_metadata(country_name)
 
     except Exception as e:
         logger.warning(
@@ -31,7 +47,4 @@ def fetch_country_metadata(country_name: str) -> Dict:
         )
 
         # Fallback default
-        return {
-            "region": "Unknown",
-            "subregion": "Unknown",
-        }
\ No newline at end of file
+        return dict(FALLBACK_METADATA)
@@ -1,3 +1,7 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 import pandas as pd
 
 
@@ -11,52 +15,278 @@ REQUIRED_COLUMNS = [
     "transaction_count",
 ]
 
+NUMERIC_FIELDS = ["monthly_volume", "dispute_count", "transaction_count"]
 
-def validate_schema(df: pd.DataFrame) -> None:
+# Column added to quarantined rows: the names of every rule the row broke
+ERRORS_COLUMN = "validation_errors"
+
+
+# -----------------------------
+# Declarative rules
+# -----------------------------
+
+@dataclass(frozen=True)
+class Rule:
     """
-    Validates merchant CSV schema and business rules.
-    Raises ValueError if validation fails.
+    One row-level check on one column.
+
+    kind     -- a key of CHECKS (not_null, prefix, unique, numeric,
+                non_negative, positive)
+    value    -- the check's argument, e.g. the prefix
+    message  -- the ValueError text validate_schema raises
+    """
+
+    name: str
+    column: str
+    kind: str
+    message: str
+    value: Any = None
+
+
+MERCHANT_RULES = [
+    Rule("merchant_id_not_null", "merchant_id", "not_null", "merchant_id contains null values"),
+    Rule("merchant_id_prefix", "merchant_id", "prefix", "merchant_id must start with 'M'", "M"),
+    Rule("merchant_id_unique", "merchant_id", "unique", "Duplicate merchant_id found"),
+    Rule("name_not_null", "name", "not_null", "Merchant name contains null values"),
+    Rule("country_not_null", "country", "not_null", "Country contains null values"),
+    *[
+        rule
+        for column in NUMERIC_FIELDS
+        for rule in (
+            Rule(f"{column}_numeric", column, "numeric", f"{column} must be numeric"),
+            Rule(f"{column}_non_negative", column, "non_negative", f"{column} contains negative values"),
+        )
+    ],
+    Rule("transaction_count_positive", "transaction_count", "positive", "transaction_count must be greater than 0"),
+]
+
+
+class _Column:
+    """
+    Lazily computed views of one column, each built at most once and
+    shared by every rule on that column. With coerce, a text column is
+    parsed value by value; without it, a column that is not a numeric
+    dtype fails the numeric rule on every row.
+    """
+
+    def __init__(self, series: pd.Series, coerce: bool = False):
+        self.series = series
+        self.coerce = coerce
+        self._isna = None
+        self._numeric = None
+
+    @property
+    def isna(self) -> np.ndarray:
+        if self._isna is None:
+            self._isna = self.series.isna().to_numpy()
+        return self._isna
+
+    @property
+    def numeric(self) -> Tuple[np.ndarray, np.ndarray]:
+        # (values as numbers, mask of present values that are not numbers)
+        if self._numeric is None:
+            if pd.api.types.is_numeric_dtype(self.series) and not pd.api.types.is_bool_dtype(self.series):
+                values = self.series.to_numpy()
+                self._numeric = values, np.zeros(len(values), dtype=bool)
+            else:
+                values = pd.to_numeric(self.series, errors="coerce").to_numpy(dtype=np.float64)
+                bad = np.isnan(values) & ~self.isna if self.coerce else np.ones(len(values), dtype=bool)
+                self._numeric = values, bad
+        return self._numeric
+
+
+def _not_null(column: _Column, rule: Rule) -> np.ndarray:
+    return column.isna
+
+
+def _prefix(column: _Column, rule: Rule) -> np.ndarray:
+    # Nulls are reported by not_null, not here
+    return ~column.series.str.startswith(rule.value, na=True).to_numpy(dtype=bool)
+
+
+def _unique(column: _Column, rule: Rule) -> np.ndarray:
+    # Every repeat after the first, so quarantining keeps one copy
+    return column.series.duplicated().to_numpy()
+
+
+def _numeric(column: _Column, rule: Rule) -> np.ndarray:
+    return column.numeric[1]
+
+
+def _non_negative(column: _Column, rule: Rule) -> np.ndarray:
+    return column.numeric[0] < 0
+
+
+def _positive(column: _Column, rule: Rule) -> np.ndarray:
+    return column.numeric[0] <= 0
+
+
+CHECKS: Dict[str, Callable[[_Column, Rule], np.ndarray]] = {
+    "not_null": _not_null,
+    "prefix": _prefix,
+    "unique": _unique,
+    "numeric": _numeric,
+    "non_negative": _non_negative,
+    "positive": _positive,
+}
+
+
+# -----------------------------
+# Reports
+# -----------------------------
+
+@dataclass
+class ValidationReport:
+    """
+    Every failure of every rule: missing columns, and for each broken
+    rule the index labels of all offending rows.
     """
 
-    # Checking required columns
-    
-    missing_cols = set(REQUIRED_COLUMNS) - set(df.columns)
-    if missing_cols:
-        raise ValueError(f"Missing required columns: {missing_cols}")
+    rows: int
+    rules: List[Rule]
+    missing_columns: List[str] = field(default_factory=list)
+    failures: Dict[str, np.ndarray] = field(default_factory=dict)
+    invalid: Optional[np.ndarray] = None
+    # Positional mask per broken rule, aligned with failures
+    masks: Dict[str, np.ndarray] = field(default_factory=dict, repr=False)
 
-    # merchant_id validation
-    
-    if df["merchant_id"].isnull().any():
-        raise ValueError("merchant_id contains null values")
+    @property
+    def valid(self) -> bool:
+        return not self.missing_columns and not self.failures
 
-    if not df["merchant_id"].str.startswith("M").all():
-        raise ValueError("merchant_id must start with 'M'")
+    def error_counts(self) -> Dict[str, int]:
+        return {name: len(index) for name, index in self.failures.items()}
 
-    if df["merchant_id"].duplicated().any():
-        raise ValueError("Duplicate merchant_id found")
+    def error_frame(self) -> pd.DataFrame:
+        """
+        One (rule, column, index) row per failure.
+        """
 
-    # name validation
-    
-    if df["name"].isnull().any():
-        raise ValueError("Merchant name contains null values")
+        columns = {rule.name: rule.column for rule in self.rules}
+        return pd.DataFrame(
+            [(name, columns[name], label) for name, index in self.failures.items() for label in index],
+            columns=["rule", "column", "index"],
+        )
 
-    # country validation
-    
-    if df["country"].isnull().any():
-        raise ValueError("Country contains null values")
+    def summary(self, examples: int = 5) -> str:
+        if self.missing_columns:
+            return f"Missing required columns: {set(self.missing_columns)}"
 
-    # Numeric fields validation
-    
-    numeric_fields = ["monthly_volume", "dispute_count", "transaction_count"]
+        messages = {rule.name: rule.message for rule in self.rules}
+        return "; ".join(
+            f"{messages[name]} ({len(index)} rows, e.g. index {index[:examples].tolist()})"
+            for name, index in self.failures.items()
+        )
 
-    for field in numeric_fields:
-        if not pd.api.types.is_numeric_dtype(df[field]):
-            raise ValueError(f"{field} must be numeric")
+    def raise_if_invalid(self) -> None:
+        if not self.valid:
+            raise ValueError(self.summary())
 
-        if (df[field] < 0).any():
-            raise ValueError(f"{field} contains negative values")
 
-    # transaction_count must be > 0
-    
-    if (df["transaction_count"] == 0).any():
-        raise ValueError("transaction_count must be greater than 0")
+# -----------------------------
+# Compiled schema
+# -----------------------------
+
+class CompiledSchema:
+    """
+    Rules grouped by column once, up front. validate() then reads each
+    column a single time and evaluates all its rules on shared views (one
+    null mask, one numeric conversion), OR-ing the masks into a single
+    invalid-row mask.
+    """
+
+    def __init__(self, rules: Sequence[Rule], required_columns: Sequence[str] = ()):
+        unknown = {rule.kind for rule in rules} - set(CHECKS)
+        if unknown:
+            raise ValueError(f"Unknown rule kinds: {sorted(unknown)}")
+
+        self.rules = list(rules)
+        self.required_columns = list(dict.fromkeys([*required_columns, *(rule.column for rule in rules)]))
+
+        self._plan: Dict[str, List[Tuple[Rule, Callable]]] = {}
+        for rule in self.rules:
+            self._plan.setdefault(rule.column, []).append((rule, CHECKS[rule.kind]))
+
+    def validate(self, df: pd.DataFrame, coerce_numeric: bool = False) -> ValidationReport:
+        """
+        Report of every rule violation. Numeric rules require a numeric
+        dtype unless coerce_numeric, which accepts text that parses.
+        """
+
+        report = ValidationReport(rows=len(df), rules=self.rules)
+
+        report.missing_columns = [c for c in self.required_columns if c not in df.columns]
+        if report.missing_columns:
+            return report
+
+        invalid = np.zeros(len(df), dtype=bool)
+        masks = {}
+
+        for column, checks in self._plan.items():
+            view = _Column(df[column], coerce=coerce_numeric)
+            for rule, check in checks:
+                mask = check(view, rule)
+                if mask.any():
+                    masks[rule.name] = mask
+                    invalid |= mask
+
+        # Report in declaration order, whatever the column grouping
+        report.masks = {rule.name: masks[rule.name] for rule in self.rules if rule.name in masks}
+        report.failures = {name: df.index[mask].to_numpy() for name, mask in report.masks.items()}
+        report.invalid = invalid
+        return report
+
+    def quarantine(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame, ValidationReport]:
+        """
+        Splits df into (valid rows, invalid rows, report) instead of
+        raising. Invalid rows get a validation_errors column naming every
+        rule they broke. Missing columns cannot be quarantined row by row
+        and still raise ValueError. Numbers read as text are checked value
+        by value, so the caller converts the valid rows afterwards.
+        """
+
+        report = self.validate(df, coerce_numeric=True)
+        if report.missing_columns:
+            report.raise_if_invalid()
+
+        invalid = report.invalid
+        rejected = df[invalid].copy()
+
+        # Rule names per rejected row, appended one rule at a time over the rejected subset
+        reasons = np.full(len(rejected), "", dtype=object)
+        for name, mask in report.masks.items():
+            broken = mask[invalid]
+            reasons[broken] = reasons[broken] + name + ","
+
+        rejected[ERRORS_COLUMN] = [reason[:-1] for reason in reasons]
+        return df[~invalid], rejected, report
+
+
+MERCHANT_SCHEMA = CompiledSchema(MERCHANT_RULES, REQUIRED_COLUMNS)
+
+
+def validate_merchants(df: pd.DataFrame, schema: CompiledSchema = MERCHANT_SCHEMA) -> ValidationReport:
+    """
+    Full report of every rule violation in df, without raising.
+    """
+
+    return schema.validate(df)
+
+
+def quarantine_merchants(df: pd.DataFrame, schema: CompiledSchema = MERCHANT_SCHEMA):
+    """
+    (valid_df, invalid_df, report): loads keep the good rows of a file
+    instead of failing on the first bad one.
+    """
+
+    return schema.quarantine(df)
+
+
+def validate_schema(df: pd.DataFrame) -> None:
+    """
+    Validates merchant CSV schema and business rules.
+    Raises ValueError if validation fails, listing every broken rule
+    with its row count and example indexes.
+    """
+
+    MERCHANT_SCHEMA.validate(df).raise_if_invalid()
@@ -1,76 +1,91 @@
-import requests
-import time
-from bs4 import BeautifulSoup
+from typing import Dict, Iterable, Optional
+
+from bs4 import BeautifulSoup, Tag
+
+from ingestion.web_fetcher import HEADERS, CachedFetcher, get_fetcher  # noqa: F401
 
 
 BASE_URL = "https://claritypay.com"
 
+VALUE_PROP_KEYWORDS = ["Pay", "Clear", "Flexible", "Transparent"]
 
-HEADERS = {
-    "User-Agent": "MerchantRiskAssessmentBot/1.0 (Educational Project)"
-}
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 
-def scrape_claritypay():
+def parse_site_signals(html: str) -> dict:
     """
-    Scrapes claritypay.com homepage.
-    Extracts:
+    Extracts from a page, in one walk over the parsed tree:
     - Value propositions
     - Partner mentions
     - Public stats
+
+    Each list is de-duplicated in page order.
     """
 
-    try:
-        response = requests.get(BASE_URL, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-    except requests.RequestException as e:
-        raise RuntimeError(f"Failed to scrape claritypay.com: {e}")
+    soup = BeautifulSoup(html, HTML_PARSER)
 
-    time.sleep(1)  # Respectful rate limiting
+    # The same strings get_text() would return (no script, style or comments)
+    text_types = soup.interesting_string_types
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    value_props = {}
+    stats = {}
+    partners = {}
 
-    page_text = soup.get_text(separator="\n")
+    for node in soup.descendants:
+        if type(node) in text_types:
+            for line in node.split("\n"):
+                line = line.strip()
 
-    # -------------------------
-    # Extract Value Propositions
-    # -------------------------
-    value_props = []
-    keywords = ["Pay", "Clear", "Flexible", "Transparent"]
+                # ---- Value Propositions ----
+                if 10 < len(line) < 120 and any(keyword in line for keyword in VALUE_PROP_KEYWORDS):
+                    value_props[line] = None
 
-    for line in page_text.split("\n"):
-        line = line.strip()
-        if any(keyword in line for keyword in keywords):
-            if 10 < len(line) < 120:
-                value_props.append(line)
+                # ---- Public Stats ----
+                if ("+" in line or "$" in line) and any(char.isdigit() for char in line):
+                    stats[line] = None
 
-    value_props = list(set(value_props))[:10]
+        # ---- Partner Extraction (heuristic) ----
+        elif isinstance(node, Tag) and node.name == "img":
+            alt_text = node.get("alt")
+            if alt_text and "partner" in alt_text.lower():
+                partners[alt_text] = None
+
+    return {
+        "value_propositions": list(value_props)[:10],
+        "public_stats": list(stats)[:10],
+        "partners": list(partners),
+    }
 
-    # -------------------------
-    # Extract Public Stats
-    # -------------------------
-    stats = []
-    for line in page_text.split("\n"):
-        line = line.strip()
-        if "+" in line or "$" in line:
-            if any(char.isdigit() for char in line):
-                stats.append(line)
 
-    stats = list(set(stats))[:10]
+def scrape_claritypay(fetcher: Optional[CachedFetcher] = None):
+    """
+    Scrapes claritypay.com homepage through the cached, rate-limited
+    fetcher; an unchanged page is revalidated rather than re-downloaded.
+    """
 
-    # -------------------------
-    # Partner Extraction (heuristic)
-    # -------------------------
-    partners = []
-    for img in soup.find_all("img"):
-        alt_text = img.get("alt")
-        if alt_text and "partner" in alt_text.lower():
-            partners.append(alt_text)
+    fetcher = fetcher or get_fetcher()
+
+    try:
+        result = fetcher.fetch(BASE_URL)
+    except RuntimeError as e:
+        raise RuntimeError(f"Failed to scrape claritypay.com: {e}")
+
+    return parse_site_signals(result.text)
+
+
+def scrape_sites(urls: Iterable[str], fetcher: Optional[CachedFetcher] = None) -> Dict[str, Optional[dict]]:
+    """
+    Fetches many merchant sites concurrently and parses each one.
+    Sites that could not be fetched map to None.
+    """
 
-    partners = list(set(partners))
+    fetcher = fetcher or get_fetcher()
 
     return {
-        "value_propositions": value_props,
-        "public_stats": stats,
-        "partners": partners,
-    }
\ No newline at end of file
+        url: parse_site_signals(result.text) if result is not None else None
+        for url, result in fetcher.fetch_many(urls).items()
+    }
@@ -1,3 +1,4 @@
+import json
 import requests
 
 
@@ -18,4 +19,40 @@ def fetch_internal_risk(merchant_id: str) -> dict:
     except requests.RequestException as e:
         raise RuntimeError(f"API call failed for {merchant_id}: {e}")
 
-    return response.json()
\ No newline at end of file
+    return response.json()
+
+
+def fetch_internal_risk_batch(merchant_ids, chunk_size: int = 1000) -> list:
+    """
+    Calls the bulk /risk/batch endpoint, splitting merchant_ids into
+    chunks of chunk_size. Returns payloads in the same order as the input.
+    Raises RuntimeError if a chunk does not return one payload per merchant.
+    """
+
+    merchant_ids = list(merchant_ids)
+    url = f"{BASE_URL}/risk/batch"
+    results = []
+
+    with requests.Session() as session:
+        for start in range(0, len(merchant_ids), chunk_size):
+            chunk = merchant_ids[start:start + chunk_size]
+
+            try:
+                response = session.post(
+                    url, json={"merchant_ids": chunk}, stream=True, timeout=30
+                )
+                response.raise_for_status()
+                payloads = [json.loads(line) for line in response.iter_lines() if line]
+            except requests.RequestException as e:
+                raise RuntimeError(
+                    f"Batch API call failed for merchants {chunk[0]}..{chunk[-1]}: {e}"
+                )
+
+            if len(payloads) != len(chunk):
+                raise RuntimeError(
+                    f"Batch API returned {len(payloads)} rows for {len(chunk)} merchants "
+                    f"({chunk[0]}..{chunk[-1]})"
+                )
+            results.extend(payloads)
+
+    return results
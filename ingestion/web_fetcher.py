@@ -0,0 +1,261 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CACHE_DIR = "data/cache/http"
+
+HEADERS = {
+    "User-Agent": "MerchantRiskAssessmentBot/1.0 (Educational Project)"
+}
+
+
+# -----------------------------
+# Rate limiting
+# -----------------------------
+
+class TokenBucket:
+    """
+    Allows `rate` requests per second on average with bursts of up to
+    `capacity`. acquire() blocks only as long as needed for the next token.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """One TokenBucket per host, so many sites can be fetched at once."""
+
+    def __init__(self, rate_per_host: float = 1.0, burst: float = 1.0):
+        self.rate_per_host = rate_per_host
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> None:
+        host = urlsplit(url).netloc.lower()
+
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate_per_host, self.burst)
+
+        bucket.acquire()
+
+
+# -----------------------------
+# Response cache
+# -----------------------------
+
+@dataclass
+class FetchResult:
+    url: str
+    status: int
+    text: str
+    from_cache: bool = False
+
+
+class ResponseCache:
+    """
+    Response bodies on disk keyed by the SHA-256 of the URL, with the
+    validators (ETag, Last-Modified) needed to revalidate them.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return f"{base}.json", f"{base}.body"
+
+    def get(self, url: str) -> Optional[dict]:
+        meta_path, body_path = self._paths(url)
+
+        try:
+            with open(meta_path) as f:
+                entry = json.load(f)
+            with open(body_path, "rb") as f:
+                entry["body"] = f.read()
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        return entry
+
+    def put(self, url: str, body: bytes, encoding: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+        meta_path, body_path = self._paths(url)
+        meta = {
+            "url": url,
+            "encoding": encoding,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.time(),
+        }
+
+        # Body first, metadata last: metadata is only visible once the body is complete
+        with open(f"{body_path}.tmp", "wb") as f:
+            f.write(body)
+        os.replace(f"{body_path}.tmp", body_path)
+
+        with open(f"{meta_path}.tmp", "w") as f:
+            json.dump(meta, f)
+        os.replace(f"{meta_path}.tmp", meta_path)
+
+    def touch(self, url: str) -> None:
+        # Revalidated: only the fetch time changes, the body stays as is
+        meta_path, _ = self._paths(url)
+
+        with open(meta_path) as f:
+            meta = json.load(f)
+        meta["fetched_at"] = time.time()
+
+        with open(f"{meta_path}.tmp", "w") as f:
+            json.dump(meta, f)
+        os.replace(f"{meta_path}.tmp", meta_path)
+
+
+# -----------------------------
+# Fetcher
+# -----------------------------
+
+class CachedFetcher:
+    """
+    HTTP GET with an on-disk cache and per-host rate limiting.
+
+    Cached responses are revalidated with If-None-Match / If-Modified-Since,
+    so an unchanged page costs a 304 with no body. Entries younger than
+    fresh_seconds are served without any request. If a request fails and
+    a cached copy exists, the stale copy is served.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        fresh_seconds: float = 0.0,
+        timeout: float = 10.0,
+        max_workers: int = 8,
+        headers: Optional[dict] = None,
+    ):
+        self.cache = cache or ResponseCache()
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.fresh_seconds = fresh_seconds
+        self.timeout = timeout
+        self.max_workers = max_workers
+
+        self.session = requests.Session()
+        self.session.headers.update(headers or HEADERS)
+        adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _cached_result(self, url: str, entry: dict, status: int) -> FetchResult:
+        return FetchResult(url, status, entry["body"].decode(entry["encoding"], "replace"), from_cache=True)
+
+    def fetch(self, url: str) -> FetchResult:
+        entry = self.cache.get(url)
+
+        if entry is not None and time.time() - entry["fetched_at"] < self.fresh_seconds:
+            return self._cached_result(url, entry, 200)
+
+        conditional = {}
+        if entry is not None:
+            if entry["etag"]:
+                conditional["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                conditional["If-Modified-Since"] = entry["last_modified"]
+
+        self.rate_limiter.acquire(url)
+
+        try:
+            response = self.session.get(url, headers=conditional, timeout=self.timeout)
+
+            if response.status_code == 304 and entry is not None:
+                self.cache.touch(url)
+                return self._cached_result(url, entry, 304)
+
+            response.raise_for_status()
+        except requests.RequestException as e:
+            if entry is not None:
+                logger.warning(f"Fetching {url} failed ({e}); serving cached copy")
+                return self._cached_result(url, entry, 200)
+            raise RuntimeError(f"Failed to fetch {url}: {e}")
+
+        encoding = response.encoding or response.apparent_encoding or "utf-8"
+        self.cache.put(
+            url,
+            response.content,
+            encoding,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+
+        return FetchResult(url, response.status_code, response.content.decode(encoding, "replace"))
+
+    def fetch_many(self, urls: Iterable[str]) -> Dict[str, Optional[FetchResult]]:
+        """
+        Fetches urls concurrently; the per-host limiter still spaces out
+        requests to the same site. Failed urls map to None.
+        """
+
+        urls = list(dict.fromkeys(urls))
+
+        def fetch_or_none(url):
+            try:
+                return self.fetch(url)
+            except RuntimeError as e:
+                logger.warning(str(e))
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return dict(zip(urls, pool.map(fetch_or_none, urls)))
+
+
+_default_fetcher: Optional[CachedFetcher] = None
+
+
+def get_fetcher() -> CachedFetcher:
+    """
+    Process-wide fetcher, so the cache and per-host limits are shared.
+    """
+
+    global _default_fetcher
+    if _default_fetcher is None:
+        _default_fetcher = CachedFetcher()
+    return _default_fetcher
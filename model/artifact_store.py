@@ -0,0 +1,213 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
+
+import joblib
+import numpy as np
+
+from features.feature_pipeline import PREDICTION_THRESHOLD, TIER_HIGH_CUTOFF, TIER_MEDIUM_CUTOFF
+from model.fast_scorer import LinearScorer, as_scorer
+
+
+DEFAULT_STORE = "artifacts/models"
+
+CURRENT_POINTER = "CURRENT"
+VERSIONS_DIR = "versions"
+
+METADATA_FILE = "metadata.json"
+WEIGHTS_FILE = "weights.npy"
+ESTIMATOR_FILE = "model.joblib"
+
+
+def is_store(path: str) -> bool:
+    return os.path.isdir(path)
+
+
+def pointer_path(root: str) -> str:
+    return os.path.join(root, CURRENT_POINTER)
+
+
+def _sha256_file(path: str) -> str:
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+class ModelStore:
+    """
+    Directory of immutable, content-addressed model versions:
+
+        root/versions/<version>/metadata.json
+        root/versions/<version>/weights.npy    (linear models: coef + intercept)
+        root/versions/<version>/model.joblib   (any other estimator)
+        root/CURRENT                           (the active version id)
+
+    Linear models are stored as one float64 vector and loaded memory-mapped,
+    with no unpickling. Publishing identical content (weights, scoring
+    settings, metrics and baseline) twice yields the same version.
+    CURRENT is replaced atomically, so readers always see either the old
+    or the new version.
+    """
+
+    def __init__(self, root: str = DEFAULT_STORE):
+        self.root = root
+
+    def _version_dir(self, version: str) -> str:
+        return os.path.join(self.root, VERSIONS_DIR, version)
+
+    # -----------------------------
+    # Writing
+    # -----------------------------
+
+    def publish(
+        self,
+        model,
+        features: List[str],
+        metrics: Optional[Dict[str, float]] = None,
+        training_seconds: Optional[float] = None,
+        threshold: float = PREDICTION_THRESHOLD,
+        tier_cutoffs: Optional[Dict[str, float]] = None,
+        activate: bool = True,
+        baseline: Optional[Sequence[float]] = None,
+    ) -> str:
+        """
+        Stores model as a new version (or finds the identical existing one)
+        and, with activate=True, makes it current. Returns the version id.
+        baseline (training feature means) is the reference point for
+        per-merchant explanations.
+        """
+
+        features = list(features)
+        tier_cutoffs = tier_cutoffs or {"high": TIER_HIGH_CUTOFF, "medium": TIER_MEDIUM_CUTOFF}
+        scorer = as_scorer(model, features)
+
+        os.makedirs(os.path.join(self.root, VERSIONS_DIR), exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=".staging-", dir=os.path.join(self.root, VERSIONS_DIR))
+
+        try:
+            if scorer is not None:
+                payload = os.path.join(staging, WEIGHTS_FILE)
+                np.save(payload, np.append(scorer.coef, scorer.intercept))
+            else:
+                payload = os.path.join(staging, ESTIMATOR_FILE)
+                joblib.dump(model, payload)
+
+            # The version covers the weights, what they are applied to and the
+            # explanation baseline and metrics stored with them; only timings are left out
+            content = {
+                "features": features,
+                "threshold": threshold,
+                "tier_cutoffs": tier_cutoffs,
+                "metrics": {name: float(value) for name, value in (metrics or {}).items()},
+                "baseline": None if baseline is None else [float(v) for v in baseline],
+            }
+            sha = hashlib.sha256(_sha256_file(payload).encode())
+            sha.update(json.dumps(content, sort_keys=True).encode())
+            version = sha.hexdigest()[:16]
+
+            metadata = {
+                "version": version,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "format": "linear" if scorer is not None else "estimator",
+                "model_type": type(model).__name__,
+                **content,
+                "training_seconds": training_seconds,
+            }
+            with open(os.path.join(staging, METADATA_FILE), "w") as f:
+                json.dump(metadata, f, indent=2)
+
+            if os.path.exists(self._version_dir(version)):
+                shutil.rmtree(staging)
+            else:
+                os.replace(staging, self._version_dir(version))
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        if activate:
+            self.activate(version)
+
+        return version
+
+    def activate(self, version: str) -> None:
+        """
+        Points CURRENT at version with one atomic rename.
+        """
+
+        if not os.path.exists(os.path.join(self._version_dir(version), METADATA_FILE)):
+            raise ValueError(f"Unknown model version {version!r} in {self.root}")
+
+        tmp = f"{pointer_path(self.root)}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(version)
+        os.replace(tmp, pointer_path(self.root))
+
+    # -----------------------------
+    # Reading
+    # -----------------------------
+
+    def current(self) -> Optional[str]:
+        try:
+            with open(pointer_path(self.root)) as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def metadata(self, version: Optional[str] = None) -> dict:
+        version = version or self.current()
+        if version is None:
+            raise FileNotFoundError(f"No current model version in {self.root}")
+
+        with open(os.path.join(self._version_dir(version), METADATA_FILE)) as f:
+            return json.load(f)
+
+    def versions(self) -> List[dict]:
+        """
+        Metadata of every stored version, oldest first.
+        """
+
+        directory = os.path.join(self.root, VERSIONS_DIR)
+        if not os.path.isdir(directory):
+            return []
+
+        found = [
+            self.metadata(name) for name in os.listdir(directory)
+            if not name.startswith(".") and os.path.exists(os.path.join(directory, name, METADATA_FILE))
+        ]
+        return sorted(found, key=lambda m: m["created_at"])
+
+    def load(self, version: Optional[str] = None, mmap_mode: Optional[str] = "r") -> dict:
+        """
+        Returns the artifact dict predict_risk scores with, for version or
+        the current one, including its threshold and tier cutoffs.
+        """
+
+        metadata = self.metadata(version)
+        directory = self._version_dir(metadata["version"])
+        features = metadata["features"]
+
+        artifact = {
+            "features": features,
+            "threshold": metadata["threshold"],
+            "tier_cutoffs": metadata["tier_cutoffs"],
+            "version": metadata["version"],
+            "metadata": metadata,
+        }
+
+        if metadata.get("baseline") is not None:
+            artifact["baseline"] = np.asarray(metadata["baseline"], dtype=np.float64)
+
+        if metadata["format"] == "linear":
+            weights = np.load(os.path.join(directory, WEIGHTS_FILE), mmap_mode=mmap_mode)
+            scorer = LinearScorer(weights[:-1], weights[-1], features)
+            artifact.update(model=scorer, scorer=scorer)
+        else:
+            artifact["model"] = joblib.load(os.path.join(directory, ESTIMATOR_FILE))
+
+        return artifact
@@ -0,0 +1,106 @@
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from features.registry import feature_array
+
+
+class LinearScorer:
+    """
+    Compact scorer for binary linear models (e.g. LogisticRegression).
+
+    Holds the weights as one contiguous float64 vector and scores with a
+    dot product plus a sigmoid, bypassing sklearn input validation and
+    pandas column selection. Probabilities match predict_proba[:, 1].
+    """
+
+    def __init__(self, coef, intercept: float, features: Iterable[str]):
+        self.coef = np.ascontiguousarray(coef, dtype=np.float64).ravel()
+        self.intercept = float(intercept)
+        self.features = list(features)
+
+        if self.coef.shape[0] != len(self.features):
+            raise ValueError(
+                f"Scorer has {self.coef.shape[0]} weights for {len(self.features)} features"
+            )
+
+    @classmethod
+    def from_estimator(cls, model, features: Optional[Iterable[str]] = None) -> "LinearScorer":
+        """
+        Also accepts a Pipeline of StandardScalers ending in a linear
+        model; the scaling is folded into the weights.
+        """
+
+        if hasattr(model, "steps"):
+            if features is None:
+                features = model.feature_names_in_
+
+            scorer = cls.from_estimator(model[-1], features)
+            for _, step in reversed(model.steps[:-1]):
+                scorer = scorer._fold_scaler(step)
+            return scorer
+
+        coef = getattr(model, "coef_", None)
+        if coef is None or coef.shape[0] != 1:
+            raise ValueError(f"{type(model).__name__} is not a fitted binary linear model")
+
+        if features is None:
+            features = model.feature_names_in_
+
+        return cls(coef[0], model.intercept_[0], features)
+
+    def _fold_scaler(self, scaler) -> "LinearScorer":
+        # w . (x - mean) / scale + b  ==  (w / scale) . x + (b - (w / scale) . mean)
+        if not (hasattr(scaler, "with_mean") and hasattr(scaler, "scale_")):
+            raise ValueError(f"Cannot fold {type(scaler).__name__} into a linear scorer")
+
+        coef = self.coef / scaler.scale_ if scaler.scale_ is not None else self.coef
+        intercept = self.intercept - coef @ scaler.mean_ if scaler.with_mean else self.intercept
+
+        return LinearScorer(coef, intercept, self.features)
+
+    def decision_function(self, X: np.ndarray) -> np.ndarray:
+        return X @ self.coef + self.intercept
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        Positive-class probabilities for a float64 feature matrix.
+        """
+
+        # Stable sigmoid, 1 / (1 + exp(-z)), without importing scipy
+        return np.exp(-np.logaddexp(0.0, -self.decision_function(X)))
+
+    def score_frame(self, df: pd.DataFrame) -> np.ndarray:
+        return self.predict_proba(feature_array(df, self.features))
+
+    # -----------------------------
+    # Export
+    # -----------------------------
+
+    def save(self, path: str) -> None:
+        np.savez(
+            path,
+            coef=self.coef,
+            intercept=np.array([self.intercept]),
+            features=np.array(self.features),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "LinearScorer":
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data["coef"], data["intercept"][0], data["features"].tolist())
+
+
+def as_scorer(model, features: Iterable[str]) -> Optional[LinearScorer]:
+    """
+    LinearScorer for model if it is a binary linear estimator, else None.
+    """
+
+    if isinstance(model, LinearScorer):
+        return model
+
+    try:
+        return LinearScorer.from_estimator(model, features)
+    except (AttributeError, ValueError, IndexError):
+        return None
@@ -1,61 +1,45 @@
-import joblib
 import pandas as pd
 
+from features.feature_pipeline import PREDICTION_THRESHOLD, assign_risk_tier
+from features.registry import feature_array, feature_matrix
+from model.fast_scorer import as_scorer
+from model.registry import MODEL_PATH, as_artifact, get_model, load_model  # noqa: F401
 
-def load_model():
-    return joblib.load("artifacts/risk_model.pkl")
 
+def predict_risk(df: pd.DataFrame, model=None, model_path: str = MODEL_PATH):
+    """
+    Scores df in place. Pass an in-memory artifact or estimator as model
+    to skip disk entirely; otherwise the process-wide cached artifact at
+    model_path is used and only reloaded when the file changes.
+    """
 
-def predict_risk(df: pd.DataFrame):
+    if model is None:
+        artifact = get_model(model_path)
+    else:
+        artifact = as_artifact(model)
 
-    model = load_model()
+    model = artifact["model"]
+    features = artifact["features"]
 
-    df["dispute_rate"] = df["dispute_count"] / df["transaction_count"]
-    df["avg_ticket_size"] = df["monthly_volume"] / df["transaction_count"]
+    # Linear models score with a plain dot product; others go through sklearn
+    if "scorer" not in artifact:
+        artifact["scorer"] = as_scorer(model, features)
+    scorer = artifact["scorer"]
 
-    features = [
-    # Core transactional
-    "monthly_volume",
-    "transaction_count",
-    "dispute_rate",
-    "avg_ticket_size",
+    # Features come from the artifact so scoring always matches training
+    if scorer is not None:
+        probs = scorer.predict_proba(feature_array(df, features))
+    else:
+        probs = model.predict_proba(feature_matrix(df, features))[:, 1]
 
-    # Internal API
-    "last_30d_volume",
-    "last_30d_txn_count",
-    "internal_flag_numeric",
-
-    # Country risk
-    "is_high_risk_region",
-
-    # PDF signals
-    "pdf_mentions_refunds",
-    "pdf_mentions_chargeback",
-    "pdf_mentions_complaint",
-
-    # Web signals
-    "num_value_props",
-    "num_public_stats",
-    "num_partners"   
-    ]
-
-    probs = model.predict_proba(df[features])[:, 1]
     df["risk_probability"] = probs
 
-    # Calibrated threshold for imbalance
-    threshold = 0.25
+    # Versioned artifacts carry the threshold and cutoffs they were published with
+    threshold = artifact.get("threshold", PREDICTION_THRESHOLD)
 
     df["predicted_high_risk"] = (df["risk_probability"] > threshold).astype(int)
 
     # Tiering logic
-    def assign_tier(p):
-        if p > 0.6:
-            return "High"
-        elif p > 0.3:
-            return "Medium"
-        else:
-            return "Low"
-
-    df["risk_tier"] = df["risk_probability"].apply(assign_tier)
+    df["risk_tier"] = assign_risk_tier(df["risk_probability"], **artifact.get("tier_cutoffs", {}))
 
-    return df
\ No newline at end of file
+    return df
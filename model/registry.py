@@ -0,0 +1,107 @@
+import hashlib
+import os
+import threading
+from typing import Dict, Optional
+
+import joblib
+
+from features.registry import MODEL_FEATURES
+from model.artifact_store import DEFAULT_STORE, ModelStore, is_store, pointer_path
+
+
+# A versioned ModelStore directory; single-file .pkl artifacts still load
+MODEL_PATH = DEFAULT_STORE
+
+
+# abspath -> {"stat": (mtime_ns, size, inode), "digest": sha256, "artifact": {...}}
+_MODEL_CACHE: Dict[str, dict] = {}
+_LOCK = threading.Lock()
+
+
+def load_model(path: str = MODEL_PATH) -> dict:
+    """
+    Returns {"model": estimator, "features": [...]}, plus the version,
+    threshold and tier cutoffs for the current version of a model store.
+    Bare pickled estimators from older runs are wrapped on the fly.
+    """
+
+    if is_store(path):
+        return ModelStore(path).load()
+
+    return as_artifact(joblib.load(path))
+
+
+def as_artifact(model) -> dict:
+    """
+    Normalizes an artifact dict or a bare fitted estimator.
+    """
+
+    if isinstance(model, dict):
+        return model
+
+    features = getattr(model, "features", None)
+    if features is None:
+        features = getattr(model, "feature_names_in_", MODEL_FEATURES)
+
+    return {"model": model, "features": list(features)}
+
+
+def _stat(path: str) -> tuple:
+    # The inode catches an atomic replace within one mtime tick at the same size
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _digest(path: str) -> str:
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def get_model(path: str = MODEL_PATH, reload: bool = False) -> dict:
+    """
+    Returns the loaded artifact for path, deserializing it only when
+    it is not cached yet, its content changed on disk, or reload=True.
+
+    Each call costs one os.stat. The file is hashed only when its mtime
+    or size changed, so touching an artifact without changing it does
+    not trigger a reload. For a model store the watched file is its
+    CURRENT pointer, so switching versions hot-swaps the model.
+    """
+
+    key = os.path.abspath(path)
+    watched = pointer_path(key) if is_store(key) else key
+    stat = _stat(watched)
+
+    with _LOCK:
+        entry = _MODEL_CACHE.get(key)
+
+        if entry is not None and not reload:
+            if entry["stat"] == stat:
+                return entry["artifact"]
+
+            digest = _digest(watched)
+            if entry["digest"] == digest:
+                entry["stat"] = stat
+                return entry["artifact"]
+        else:
+            digest = _digest(watched)
+
+        artifact = load_model(key)
+        _MODEL_CACHE[key] = {"stat": stat, "digest": digest, "artifact": artifact}
+
+        return artifact
+
+
+def reload_model(path: str = MODEL_PATH) -> dict:
+    return get_model(path, reload=True)
+
+
+def clear_model_cache(path: Optional[str] = None) -> None:
+    with _LOCK:
+        if path is None:
+            _MODEL_CACHE.clear()
+        else:
+            _MODEL_CACHE.pop(os.path.abspath(path), None)
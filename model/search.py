@@ -0,0 +1,226 @@
+import os
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from features.registry import MODEL_FEATURES, TARGET, compute_features, feature_array, feature_matrix
+from model.registry import MODEL_PATH
+from model.train import save_model
+
+
+@dataclass
+class Candidate:
+    """
+    One model configuration: build(**params) returns an unfitted estimator.
+    """
+
+    name: str
+    build: Callable
+    params: Dict = field(default_factory=dict)
+
+    def estimator(self):
+        return self.build(**self.params)
+
+
+def _penalty_params(penalty: str) -> dict:
+    # sklearn 1.8 deprecated `penalty` in favour of l1_ratio
+    import sklearn
+
+    version = tuple(int(part) for part in sklearn.__version__.split(".")[:2])
+    if version >= (1, 8):
+        return {"l1_ratio": {"l1": 1.0, "l2": 0.0}[penalty]}
+    return {"penalty": penalty}
+
+
+def scaled_logistic_regression(C: float = 1.0, penalty: str = "l2", solver: str = "lbfgs"):
+    """
+    Standardized LogisticRegression. Scaling makes every solver converge
+    on the raw volume / count features and keeps C comparable across them.
+    """
+
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    return make_pipeline(
+        StandardScaler(),
+        LogisticRegression(
+            C=C, solver=solver, max_iter=1000, class_weight="balanced", **_penalty_params(penalty)
+        ),
+    )
+
+
+def default_candidates() -> List[Candidate]:
+    """
+    LogisticRegression over C / penalty / solver (the current model
+    family) plus HistGradientBoostingClassifier settings.
+    """
+
+    from sklearn.ensemble import HistGradientBoostingClassifier
+
+    candidates = []
+
+    for C in [0.01, 0.1, 1.0, 10.0]:
+        for penalty, solver in [("l2", "lbfgs"), ("l2", "liblinear"), ("l1", "saga")]:
+            candidates.append(Candidate(
+                f"logreg C={C} {penalty} {solver}",
+                scaled_logistic_regression,
+                {"C": C, "penalty": penalty, "solver": solver},
+            ))
+
+    for learning_rate in [0.05, 0.1]:
+        for max_leaf_nodes in [15, 31]:
+            candidates.append(Candidate(
+                f"hist_gb lr={learning_rate} leaves={max_leaf_nodes}",
+                HistGradientBoostingClassifier,
+                {"learning_rate": learning_rate, "max_leaf_nodes": max_leaf_nodes,
+                 "class_weight": "balanced", "random_state": 42},
+            ))
+
+    return candidates
+
+
+# -----------------------------
+# Parallel CV
+# -----------------------------
+
+def _fit_fold(candidate: Candidate, X: np.ndarray, y: np.ndarray, train_idx, test_idx) -> tuple:
+    from sklearn.metrics import roc_auc_score
+
+    # X is a read-only memmap shared by every worker; indexing copies only this fold
+    started = time.time()
+    model = candidate.estimator().fit(X[train_idx], y[train_idx])
+    fit_seconds = time.time() - started
+
+    auc = roc_auc_score(y[test_idx], model.predict_proba(X[test_idx])[:, 1])
+    return auc, fit_seconds, started, time.time()
+
+
+def cross_validate_candidates(
+    X: np.ndarray,
+    y: np.ndarray,
+    candidates: List[Candidate],
+    n_splits: int = 5,
+    n_jobs: int = -1,
+    random_state: int = 42,
+) -> pd.DataFrame:
+    """
+    Stratified k-fold AUC for every candidate, with every (candidate,
+    fold) fit run in parallel. X and y are written once to a memory-mapped
+    file that all workers open, instead of being pickled to each task.
+
+    Returns one row per candidate: mean / std AUC, fit seconds summed
+    over folds, and wall seconds from its first fold starting to its last
+    fold finishing.
+    """
+
+    from sklearn.model_selection import StratifiedKFold
+
+    folds = list(StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state).split(X, y))
+
+    with tempfile.TemporaryDirectory() as shared_dir:
+        path = os.path.join(shared_dir, "xy.joblib")
+        joblib.dump((np.ascontiguousarray(X), np.asarray(y)), path)
+        X_shared, y_shared = joblib.load(path, mmap_mode="r")
+
+        tasks = [(c, f) for c in range(len(candidates)) for f in range(n_splits)]
+
+        outputs = joblib.Parallel(n_jobs=n_jobs)(
+            joblib.delayed(_fit_fold)(candidates[c], X_shared, y_shared, *folds[f])
+            for c, f in tasks
+        )
+
+    scores = {c: [] for c in range(len(candidates))}
+    for (c, _), output in zip(tasks, outputs):
+        scores[c].append(output)
+
+    rows = []
+    for c, candidate in enumerate(candidates):
+        aucs, fit_seconds, starts, ends = (np.array(v) for v in zip(*scores[c]))
+        rows.append({
+            "candidate": candidate.name,
+            "mean_auc": aucs.mean(),
+            "std_auc": aucs.std(),
+            "fit_seconds": fit_seconds.sum(),
+            "wall_seconds": ends.max() - starts.min(),
+        })
+
+    return pd.DataFrame(rows).sort_values("mean_auc", ascending=False, ignore_index=True)
+
+
+# -----------------------------
+# Training mode
+# -----------------------------
+
+def feature_importance_frame(model, features: List[str], X: pd.DataFrame, y: pd.Series) -> pd.DataFrame:
+    """
+    Coefficients for linear models (standardized ones when the model
+    scales its inputs). Other models get permutation importance (mean AUC
+    drop) in the same "coefficient" column, so reports can rank drivers
+    either way.
+    """
+
+    final = model[-1] if hasattr(model, "steps") else model
+
+    if hasattr(final, "coef_"):
+        values = final.coef_[0]
+    else:
+        from sklearn.inspection import permutation_importance
+
+        sample = X.sample(min(len(X), 5000), random_state=42)
+        values = permutation_importance(
+            model, sample, y.loc[sample.index], scoring="roc_auc", n_repeats=3, random_state=42
+        ).importances_mean
+
+    return pd.DataFrame({"feature": features, "coefficient": values}).sort_values(
+        by="coefficient", ascending=False
+    )
+
+
+def search_risk_model(
+    df: pd.DataFrame,
+    candidates: Optional[List[Candidate]] = None,
+    n_splits: int = 5,
+    n_jobs: int = -1,
+    path: str = MODEL_PATH,
+):
+    """
+    Cross-validates every candidate in parallel, refits the best by mean
+    AUC on all rows and saves it like train_risk_model.
+
+    Returns (model, importance_df, results), results holding the
+    per-candidate AUC and timings.
+    """
+
+    features = list(MODEL_FEATURES)
+    candidates = candidates or default_candidates()
+
+    compute_features(df, features + [TARGET])
+
+    X = feature_array(df, features)
+    y = df[TARGET].to_numpy()
+
+    start = time.perf_counter()
+    results = cross_validate_candidates(X, y, candidates, n_splits=n_splits, n_jobs=n_jobs)
+    elapsed = time.perf_counter() - start
+
+    print(f"Cross-validated {len(candidates)} candidates x {n_splits} folds in {elapsed:.2f}s")
+    print(results.to_string(index=False))
+
+    best = next(c for c in candidates if c.name == results.loc[0, "candidate"])
+    print(f"\nBest: {best.name} (AUC {results.loc[0, 'mean_auc']:.4f})")
+
+    # Refit on named columns so predict_risk's feature_matrix matches
+    X_frame = feature_matrix(df, features)
+    model = best.estimator().fit(X_frame, df[TARGET])
+
+    metrics = {"cv_mean_auc": results.loc[0, "mean_auc"], "cv_std_auc": results.loc[0, "std_auc"]}
+    save_model(model, features, path, metrics=metrics, training_seconds=elapsed, baseline=X.mean(axis=0))
+    print(f"Model saved to {path}")
+
+    return model, feature_importance_frame(model, features, X_frame, df[TARGET]), results
@@ -0,0 +1,202 @@
+import logging
+import os
+import time
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+from features.registry import FEATURE_REGISTRY, MODEL_FEATURES, TARGET, compute_features, feature_array
+from model.registry import MODEL_PATH
+from model.train import save_model
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------
+# Chunked input
+# -----------------------------
+
+def _is_parquet(path: str) -> bool:
+    # write_feature_table produces a directory of (partitioned) Parquet files
+    return os.path.isdir(path) or path.endswith((".parquet", ".pq"))
+
+
+def iter_feature_chunks(path: str, chunksize: int = 50_000) -> Iterator[pd.DataFrame]:
+    """
+    Streams an enriched feature table (CSV, Parquet file or Parquet
+    dataset directory) in chunks of at most chunksize rows. Only columns
+    known to the feature registry are read.
+    """
+
+    if _is_parquet(path):
+        import pyarrow.dataset as ds
+
+        dataset = ds.dataset(path, format="parquet", partitioning="hive")
+        columns = [c for c in dataset.schema.names if c in FEATURE_REGISTRY]
+
+        for batch in dataset.to_batches(columns=columns, batch_size=chunksize):
+            if batch.num_rows:
+                yield batch.to_pandas()
+    else:
+        with pd.read_csv(path, chunksize=chunksize, usecols=lambda c: c in FEATURE_REGISTRY) as reader:
+            yield from reader
+
+
+# -----------------------------
+# Validation reservoir
+# -----------------------------
+
+class ValidationReservoir:
+    """
+    Uniform sample of at most size rows from a stream (Algorithm R,
+    vectorized per chunk), held as fixed-size arrays.
+    """
+
+    def __init__(self, size: int, n_features: int, seed: int = 42):
+        self.X = np.empty((size, n_features), dtype=np.float64)
+        self.y = np.empty(size, dtype=np.int64)
+        self.size = size
+        self.seen = 0
+        self._rng = np.random.default_rng(seed)
+
+    def add(self, X: np.ndarray, y: np.ndarray) -> None:
+        positions = self.seen + np.arange(len(y))
+
+        # Row t fills slot t while there is room, then replaces a random slot with probability size / (t + 1)
+        slots = np.where(positions < self.size, positions, self._rng.integers(0, positions + 1))
+        keep = slots < self.size
+
+        # Later rows win duplicate slots, as they would one row at a time
+        self.X[slots[keep]] = X[keep]
+        self.y[slots[keep]] = y[keep]
+        self.seen += len(y)
+
+    def arrays(self):
+        n = min(self.seen, self.size)
+        return self.X[:n], self.y[:n]
+
+
+# -----------------------------
+# Training
+# -----------------------------
+
+def _default_model():
+    from sklearn.linear_model import SGDClassifier
+
+    return SGDClassifier(loss="log_loss", alpha=1e-4, random_state=42)
+
+
+def train_risk_model_streaming(
+    path: str,
+    chunksize: int = 50_000,
+    epochs: int = 1,
+    validation_fraction: float = 0.1,
+    reservoir_size: int = 50_000,
+    model=None,
+    output_path: str = MODEL_PATH,
+    seed: int = 42,
+):
+    """
+    Fits a risk model out of core over a feature table too large for
+    memory, one chunk at a time. model is any classifier with
+    partial_fit and predict_proba (SGDClassifier with log loss by default).
+
+    Features are standardized with running mean / variance (updated in the
+    first epoch only) and classes reweighted by their running frequency,
+    like class_weight="balanced". validation_fraction of the rows are held
+    out into a reservoir of at most reservoir_size rows for the AUC, so
+    peak memory depends on chunksize and reservoir_size, not on the file.
+
+    Saves a StandardScaler + model pipeline that predict_risk loads like
+    any other artifact. Returns (model, importance_df, summary).
+    """
+
+    from sklearn.metrics import roc_auc_score
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    from model.search import feature_importance_frame
+
+    features = list(MODEL_FEATURES)
+    classes = np.array([0, 1])
+
+    scaler = StandardScaler()
+    model = model if model is not None else _default_model()
+    reservoir = ValidationReservoir(reservoir_size, len(features), seed)
+    rng = np.random.default_rng(seed)
+
+    class_counts = np.zeros(2, dtype=np.int64)
+    rows = 0
+    chunks = 0
+    start = time.perf_counter()
+
+    for epoch in range(epochs):
+        # Same seed each epoch, so the held-out rows never reach training
+        split_rng = np.random.default_rng(seed + 1)
+
+        for chunk in iter_feature_chunks(path, chunksize):
+            compute_features(chunk, features + [TARGET], recompute=True)
+            X = feature_array(chunk, features)
+            y = chunk[TARGET].to_numpy(dtype=np.int64)
+            held_out = split_rng.random(len(y)) < validation_fraction
+
+            if epoch == 0:
+                reservoir.add(X[held_out], y[held_out])
+                rows += len(y)
+
+            X, y = X[~held_out], y[~held_out]
+            if not len(y):
+                continue
+
+            if epoch == 0:
+                scaler.partial_fit(X)
+                class_counts += np.bincount(y, minlength=2)
+
+            # Balanced weights from the class counts seen so far
+            weights = class_counts.sum() / (2.0 * np.maximum(class_counts, 1))
+
+            order = rng.permutation(len(y))
+            model.partial_fit(scaler.transform(X[order]), y[order], classes=classes, sample_weight=weights[y[order]])
+
+            chunks += 1
+            logger.info(f"Epoch {epoch + 1}: trained on chunk {chunks}")
+
+    if not class_counts.sum():
+        raise ValueError(f"No training rows read from {path}")
+
+    seconds = time.perf_counter() - start
+
+    X_val, y_val = reservoir.arrays()
+    auc = (
+        roc_auc_score(y_val, model.predict_proba(scaler.transform(X_val))[:, 1])
+        if len(np.unique(y_val)) == 2 else float("nan")
+    )
+
+    # Fitted on arrays; name the columns so the pipeline accepts feature frames
+    scaler.feature_names_in_ = np.array(features, dtype=object)
+    pipeline = make_pipeline(scaler, model)
+
+    summary = {
+        "rows": rows,
+        "chunks": chunks,
+        "epochs": epochs,
+        "validation_rows": len(y_val),
+        "auc": auc,
+        "seconds": seconds,
+    }
+
+    print(f"Streamed {rows} rows in {chunks} chunks over {epochs} epoch(s) in {seconds:.2f}s")
+    print(f"Validation ROC-AUC ({len(y_val)} held-out rows): {auc:.4f}")
+
+    save_model(
+        pipeline, features, output_path,
+        metrics={"roc_auc": auc}, training_seconds=seconds, baseline=scaler.mean_,
+    )
+    print(f"Model saved to {output_path}")
+
+    importance_df = feature_importance_frame(
+        pipeline, features, pd.DataFrame(X_val, columns=features), pd.Series(y_val)
+    )
+
+    return pipeline, importance_df, summary
@@ -1,57 +1,65 @@
 import os
+import time
+import numpy as np
 import pandas as pd
 import joblib
-from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import classification_report, roc_auc_score
+
+from features.registry import MODEL_FEATURES, TARGET, compute_features, feature_matrix
+from model.artifact_store import ModelStore
+from model.registry import MODEL_PATH
+
+
+def save_model(
+    model, features, path: str = MODEL_PATH, metrics=None, training_seconds=None, baseline=None
+) -> str:
+    """
+    Publishes the estimator with the feature list it was fit on, its
+    metrics, training time and training feature means (baseline) as a
+    new current version of the model store at path, and returns the
+    version. A .pkl / .joblib path instead gets a single-file artifact
+    (no version history).
+    """
+
+    if path.endswith((".pkl", ".joblib")):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        artifact = {"model": model, "features": list(features)}
+        if baseline is not None:
+            artifact["baseline"] = np.asarray(baseline, dtype=np.float64)
+        joblib.dump(artifact, path)
+        return path
+
+    return ModelStore(path).publish(
+        model, features, metrics=metrics, training_seconds=training_seconds, baseline=baseline
+    )
 
 
 def train_risk_model(df: pd.DataFrame):
 
+    # sklearn takes over a second to import; only pay for it when training
+    from sklearn.model_selection import train_test_split
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.metrics import classification_report, roc_auc_score
+
+    features = list(MODEL_FEATURES)
 
-    df["dispute_rate"] = df["dispute_count"] / df["transaction_count"]
-    df["avg_ticket_size"] = df["monthly_volume"] / df["transaction_count"]
-    df["high_risk"] = (df["dispute_rate"] > 0.002).astype(int)
+    # Reuses any features already computed on df (e.g. by the pipeline)
+    compute_features(df, features + [TARGET])
 
     print("Class Distribution:")
-    print(df["high_risk"].value_counts())
+    print(df[TARGET].value_counts())
     print()
 
-    features = [
-    # Core transactional
-    "monthly_volume",
-    "transaction_count",
-    "dispute_rate",
-    "avg_ticket_size",
-
-    # Internal API
-    "last_30d_volume",
-    "last_30d_txn_count",
-    "internal_flag_numeric",
-
-    # Country risk
-    "is_high_risk_region",
-
-    # PDF signals
-    "pdf_mentions_refunds",
-    "pdf_mentions_chargeback",
-    "pdf_mentions_complaint",
-
-    # Web signals
-    "num_value_props",
-    "num_public_stats",
-    "num_partners"
-    ]
-
-    X = df[features]
-    y = df["high_risk"]
+    X = feature_matrix(df, features)
+    y = df[TARGET]
 
     X_train, X_test, y_train, y_test = train_test_split(
         X, y, test_size=0.3, random_state=42
     )
 
+    start = time.perf_counter()
     model = LogisticRegression(max_iter=1000, class_weight="balanced")
     model.fit(X_train, y_train)
+    training_seconds = time.perf_counter() - start
 
     y_preds = model.predict(X_test)
     probs = model.predict_proba(X_test)[:, 1]
@@ -59,12 +67,17 @@ def train_risk_model(df: pd.DataFrame):
     print("Classification Report:")
     print(classification_report(y_test, y_preds))
 
-    print("ROC-AUC:", roc_auc_score(y_test, probs))
+    auc = roc_auc_score(y_test, probs)
+    print("ROC-AUC:", auc)
 
-    os.makedirs("artifacts", exist_ok=True)
-    joblib.dump(model, "artifacts/risk_model.pkl")
+    version = save_model(
+        model, features,
+        metrics={"roc_auc": auc},
+        training_seconds=training_seconds,
+        baseline=X_train.mean().to_numpy(),
+    )
 
-    print("Model saved to artifacts/risk_model.pkl")
+    print(f"Model saved to {MODEL_PATH} (version {version})")
 
     importance_df = pd.DataFrame({
         "feature": features,
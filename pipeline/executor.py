@@ -0,0 +1,186 @@
+import asyncio
+import inspect
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Stage:
+    """
+    One pipeline step.
+
+    inputs are passed to func positionally, in order. func's return value
+    is bound to outputs: one name takes the value as-is, several names
+    unpack a tuple. Plain functions run in the thread pool; coroutine
+    functions are awaited on the event loop.
+    """
+
+    name: str
+    func: Callable
+    inputs: Sequence[str] = ()
+    outputs: Sequence[str] = ()
+
+
+@dataclass
+class StageTiming:
+    name: str
+    start: float
+    end: float
+
+    @property
+    def seconds(self) -> float:
+        return self.end - self.start
+
+
+@dataclass
+class PipelineResult:
+    values: Dict[str, Any]
+    timings: Dict[str, StageTiming]
+    wall_time: float
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_time: float = 0.0
+
+    def __getitem__(self, name: str) -> Any:
+        return self.values[name]
+
+    def format_timings(self) -> str:
+        lines = [f"{'stage':<20} {'start s':>8} {'seconds':>8}"]
+        for timing in sorted(self.timings.values(), key=lambda t: t.start):
+            lines.append(f"{timing.name:<20} {timing.start:>8.3f} {timing.seconds:>8.3f}")
+        lines.append(f"wall time: {self.wall_time:.3f}s")
+        lines.append(
+            f"critical path: {' -> '.join(self.critical_path)} ({self.critical_path_time:.3f}s)"
+        )
+        return "\n".join(lines)
+
+
+class PipelineExecutor:
+    """
+    Runs stages as soon as their inputs exist, so independent stages
+    (e.g. PDF extraction, web scraping and API enrichment) overlap.
+    """
+
+    def __init__(self, stages: Sequence[Stage], max_workers: int = 8):
+        self.stages = list(stages)
+        self.max_workers = max_workers
+        self._producers = self._index_outputs()
+
+    def _index_outputs(self) -> Dict[str, Stage]:
+        producers: Dict[str, Stage] = {}
+        names = set()
+
+        for stage in self.stages:
+            if stage.name in names:
+                raise ValueError(f"Duplicate stage name: {stage.name}")
+            names.add(stage.name)
+
+            for output in stage.outputs:
+                if output in producers:
+                    raise ValueError(
+                        f"Output {output} produced by both {producers[output].name} and {stage.name}"
+                    )
+                producers[output] = stage
+
+        return producers
+
+    def _validate(self, initial: Dict[str, Any]) -> None:
+        for stage in self.stages:
+            for name in stage.inputs:
+                if name not in self._producers and name not in initial:
+                    raise ValueError(f"Stage {stage.name} needs {name}, which nothing provides")
+
+        # Kahn's algorithm: every stage must become runnable
+        available = set(initial)
+        pending = list(self.stages)
+        while pending:
+            runnable = [s for s in pending if set(s.inputs) <= available]
+            if not runnable:
+                raise ValueError(f"Cycle between stages: {[s.name for s in pending]}")
+            for stage in runnable:
+                available.update(stage.outputs)
+                pending.remove(stage)
+
+    def _upstream(self, stage: Stage, initial: Dict[str, Any]) -> List[Stage]:
+        return [
+            self._producers[name] for name in stage.inputs
+            if name in self._producers and name not in initial
+        ]
+
+    def _critical_path(self, timings: Dict[str, StageTiming], initial: Dict[str, Any]) -> Tuple[List[str], float]:
+        # Longest chain of stage durations through the dependency graph
+        best: Dict[str, Tuple[float, List[str]]] = {}
+
+        def longest(stage: Stage) -> Tuple[float, List[str]]:
+            if stage.name not in best:
+                chains = [longest(up) for up in self._upstream(stage, initial)]
+                before, path = max(chains, key=lambda c: c[0], default=(0.0, []))
+                best[stage.name] = (before + timings[stage.name].seconds, path + [stage.name])
+            return best[stage.name]
+
+        total, path = max((longest(s) for s in self.stages), key=lambda c: c[0], default=(0.0, []))
+        return path, total
+
+    async def run_async(self, initial: Optional[Dict[str, Any]] = None) -> PipelineResult:
+        initial = dict(initial or {})
+        self._validate(initial)
+
+        loop = asyncio.get_running_loop()
+        values: Dict[str, Any] = dict(initial)
+        timings: Dict[str, StageTiming] = {}
+        tasks: Dict[str, asyncio.Task] = {}
+        origin = time.perf_counter()
+
+        pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pipeline")
+
+        async def run_stage(stage: Stage):
+            upstream = self._upstream(stage, initial)
+            if upstream:
+                await asyncio.gather(*(tasks[up.name] for up in upstream))
+
+            args = [values[name] for name in stage.inputs]
+            start = time.perf_counter() - origin
+
+            try:
+                if inspect.iscoroutinefunction(stage.func):
+                    result = await stage.func(*args)
+                else:
+                    result = await loop.run_in_executor(pool, lambda: stage.func(*args))
+            except Exception as e:
+                raise RuntimeError(f"Stage {stage.name} failed: {e}") from e
+
+            timings[stage.name] = StageTiming(stage.name, start, time.perf_counter() - origin)
+            logger.info(f"Stage {stage.name} finished in {timings[stage.name].seconds:.3f}s")
+
+            if len(stage.outputs) == 1:
+                values[stage.outputs[0]] = result
+            elif stage.outputs:
+                values.update(zip(stage.outputs, result))
+
+        try:
+            for stage in self.stages:
+                tasks[stage.name] = asyncio.ensure_future(run_stage(stage))
+            await asyncio.gather(*tasks.values())
+        except Exception:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        path, path_time = self._critical_path(timings, initial)
+
+        return PipelineResult(
+            values=values,
+            timings=timings,
+            wall_time=time.perf_counter() - origin,
+            critical_path=path,
+            critical_path_time=path_time,
+        )
+
+    def run(self, initial: Optional[Dict[str, Any]] = None) -> PipelineResult:
+        return asyncio.run(self.run_async(initial))
@@ -0,0 +1,284 @@
+import json
+import logging
+import os
+import time
+from typing import Callable, List, Optional, Tuple
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from features.feature_pipeline import build_feature_frame
+from ingestion.async_risk_client import INTERNAL_RISK_COLUMNS, fetch_internal_risk_frame
+from ingestion.country_cache import COUNTRY_COLUMNS, CountryMetadataCache, get_country_cache
+from ingestion.schema_validation import REQUIRED_COLUMNS
+from model.fast_scorer import as_scorer
+from model.predict import predict_risk
+from model.registry import as_artifact, get_model
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_STATE_DIR = "data/state"
+
+SCORE_COLUMNS = ["risk_probability", "predicted_high_risk", "risk_tier"]
+ENRICHMENT_COLUMNS = INTERNAL_RISK_COLUMNS + COUNTRY_COLUMNS
+TIERS = ["High", "Medium", "Low"]
+
+# Stored internal API payloads older than this are fetched again even if
+# the merchant's own row did not change
+DEFAULT_INTERNAL_MAX_AGE_SECONDS = 24 * 3600
+
+# Pinned so reused (Parquet) and fetched (API) payloads hash identically
+INTERNAL_NUMERIC_DTYPES = {
+    "last_30d_volume": "float64",
+    "last_30d_txn_count": "int64",
+    "avg_ticket_size": "float64",
+}
+
+
+# -----------------------------
+# Fingerprints
+# -----------------------------
+
+def fingerprint_rows(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+    """
+    64-bit hash per row over columns. Values are normalized first (numbers
+    to float64, everything else to str) so a column re-read with another
+    dtype, e.g. int vs float, does not look like a change.
+    """
+
+    normalized = pd.DataFrame({
+        c: df[c].astype("float64") if pd.api.types.is_numeric_dtype(df[c]) else df[c].astype(str)
+        for c in columns
+    })
+
+    return pd.util.hash_pandas_object(normalized, index=False).to_numpy()
+
+
+def _model_identity(model):
+    # What the model scores with, not the artifact dict itself: predict_risk
+    # caches a scorer on the dict, which must not look like a new model
+    artifact = as_artifact(model)
+    scoring = [artifact["features"], artifact.get("threshold"), artifact.get("tier_cutoffs")]
+
+    if "version" in artifact:
+        return ["version", artifact["version"], *scoring]
+
+    scorer = artifact.get("scorer") or as_scorer(artifact["model"], artifact["features"])
+    if scorer is not None:
+        return ["linear", np.asarray(scorer.coef), float(scorer.intercept), *scoring]
+
+    return ["estimator", artifact["model"], *scoring]
+
+
+def _context_fingerprint(model, pdf_text: str, scrape_data: dict) -> str:
+    # Anything shared by every merchant; a change here forces a full re-score
+    return joblib.hash([_model_identity(model), pdf_text, scrape_data])
+
+
+# -----------------------------
+# Portfolio metrics from deltas
+# -----------------------------
+
+def _metric_totals(df: pd.DataFrame) -> dict:
+    tier_counts = df["risk_tier"].value_counts()
+    totals = {f"num_{tier.lower()}_risk": int(tier_counts.get(tier, 0)) for tier in TIERS}
+    totals["merchant_count"] = int(len(df))
+    totals["expected_high_risk_merchants"] = float(df["risk_probability"].sum())
+    return totals
+
+
+def _apply_delta(totals: dict, removed: pd.DataFrame, added: pd.DataFrame) -> dict:
+    before, after = _metric_totals(removed), _metric_totals(added)
+    return {k: totals[k] - before[k] + after[k] for k in totals}
+
+
+def _metrics(totals: dict) -> dict:
+    count = totals["merchant_count"]
+    metrics = {k: v for k, v in totals.items() if k != "merchant_count"}
+    metrics["average_risk_probability"] = (
+        totals["expected_high_risk_merchants"] / count if count else float("nan")
+    )
+    return metrics
+
+
+# -----------------------------
+# State store
+# -----------------------------
+
+def _state_paths(state_dir: str) -> Tuple[str, str]:
+    return (
+        os.path.join(state_dir, "merchant_state.parquet"),
+        os.path.join(state_dir, "merchant_state.json"),
+    )
+
+
+def load_state(state_dir: str = DEFAULT_STATE_DIR) -> Tuple[Optional[pd.DataFrame], dict]:
+    table_path, meta_path = _state_paths(state_dir)
+
+    if not (os.path.exists(table_path) and os.path.exists(meta_path)):
+        return None, {}
+
+    with open(meta_path) as f:
+        meta = json.load(f)
+
+    return pd.read_parquet(table_path).set_index("merchant_id"), meta
+
+
+def _save_state(state_dir: str, state: pd.DataFrame, meta: dict) -> None:
+    os.makedirs(state_dir, exist_ok=True)
+    table_path, meta_path = _state_paths(state_dir)
+
+    # Write both files aside and swap them in, so a crash keeps the last good state
+    state.to_parquet(f"{table_path}.tmp", index=False)
+    with open(f"{meta_path}.tmp", "w") as f:
+        json.dump(meta, f)
+
+    os.replace(f"{table_path}.tmp", table_path)
+    os.replace(f"{meta_path}.tmp", meta_path)
+
+
+def _previous_values(previous: pd.DataFrame, column: str, positions: np.ndarray) -> np.ndarray:
+    # Values aligned with positions; entries for unknown merchants are meaningless
+    values = previous[column].to_numpy()
+    if len(values) == 0:
+        return np.zeros(len(positions), dtype=np.uint64)
+    return values[np.where(positions >= 0, positions, 0)]
+
+
+# -----------------------------
+# Incremental run
+# -----------------------------
+
+def _fetch_internal_risk(merchant_ids: List[str]) -> pd.DataFrame:
+    return fetch_internal_risk_frame(merchant_ids, batch_size=1000)
+
+
+def run_incremental(
+    merchants: pd.DataFrame,
+    state_dir: str = DEFAULT_STATE_DIR,
+    model=None,
+    internal_risk_fetcher: Callable[[List[str]], pd.DataFrame] = _fetch_internal_risk,
+    country_cache: Optional[CountryMetadataCache] = None,
+    pdf_text: str = "",
+    scrape_data: Optional[dict] = None,
+    internal_max_age_seconds: float = DEFAULT_INTERNAL_MAX_AGE_SECONDS,
+) -> Tuple[pd.DataFrame, dict]:
+    """
+    Scores merchants against the state left by the previous run.
+
+    - new or edited rows (by input fingerprint), and rows whose stored
+      payload is older than internal_max_age_seconds, are re-enriched from
+      the internal API; everyone else reuses their stored payload
+    - rows are re-scored when new or edited, when their enrichment payload
+      (including country metadata) changed, or when the model or shared
+      PDF / web signals changed; other scores are reused as stored
+    - portfolio metrics are updated by subtracting the old contribution
+      of re-scored and removed merchants and adding the new one
+
+    Feature columns are rebuilt for the whole frame, since that is local
+    column arithmetic; API calls and scoring scale with churn.
+
+    Returns the scored frame and a run summary including the metrics.
+    """
+
+    model = model or get_model()
+    country_cache = country_cache or get_country_cache()
+    scrape_data = scrape_data or {}
+
+    merchants = merchants.reset_index(drop=True).copy()
+    merchants["input_fingerprint"] = fingerprint_rows(merchants, REQUIRED_COLUMNS)
+
+    previous, meta = load_state(state_dir)
+    if previous is None:
+        previous = pd.DataFrame(
+            columns=["input_fingerprint", "enrichment_fingerprint", "enriched_at"] + INTERNAL_RISK_COLUMNS + SCORE_COLUMNS,
+            index=pd.Index([], name="merchant_id"),
+        )
+
+    context = _context_fingerprint(model, pdf_text, scrape_data)
+    context_changed = meta.get("context") != context
+
+    ids = merchants["merchant_id"]
+
+    # Positional lookups keep the uint64 fingerprints exact (map() would upcast to float)
+    positions = previous.index.get_indexer(ids)
+    is_new = pd.Series(positions < 0)
+    is_edited = ~is_new & (
+        _previous_values(previous, "input_fingerprint", positions) != merchants["input_fingerprint"].to_numpy()
+    )
+    # State written before payloads were timestamped counts as expired
+    now = time.time()
+    enriched_at = (
+        _previous_values(previous, "enriched_at", positions).astype(np.float64)
+        if "enriched_at" in previous else np.zeros(len(ids))
+    )
+    is_expired = ~is_new & ~is_edited & (now - enriched_at >= internal_max_age_seconds)
+    needs_enrichment = is_new | is_edited | is_expired
+
+    # ---- Enrichment: API calls only for new / edited merchants ----
+    fetched = (
+        internal_risk_fetcher(ids[needs_enrichment].tolist())
+        if needs_enrichment.any() else pd.DataFrame(columns=["merchant_id"] + INTERNAL_RISK_COLUMNS)
+    )
+    reused = previous.loc[ids[~needs_enrichment], INTERNAL_RISK_COLUMNS].reset_index()
+    internal_df = pd.concat(
+        [part for part in (reused, fetched[["merchant_id"] + INTERNAL_RISK_COLUMNS]) if len(part)],
+        ignore_index=True,
+    ).astype(INTERNAL_NUMERIC_DTYPES)
+
+    country_df = country_cache.prefetch_frame(merchants["country"].unique())
+
+    df = build_feature_frame(merchants, internal_df, country_df, pdf_text, scrape_data)
+    df["enrichment_fingerprint"] = fingerprint_rows(df, ENRICHMENT_COLUMNS)
+    df["enriched_at"] = np.where(needs_enrichment, now, enriched_at)
+
+    # ---- Scoring: only rows whose inputs or context changed ----
+    enrichment_changed = (
+        _previous_values(previous, "enrichment_fingerprint", positions) != df["enrichment_fingerprint"].to_numpy()
+    )
+    needs_scoring = is_new | is_edited | enrichment_changed | context_changed
+
+    for column in SCORE_COLUMNS:
+        df[column] = previous[column].reindex(ids).to_numpy()
+
+    if needs_scoring.any():
+        rescored = predict_risk(df.loc[needs_scoring].copy(), model=model)
+        for column in SCORE_COLUMNS:
+            df.loc[needs_scoring, column] = rescored[column].to_numpy()
+
+    df["predicted_high_risk"] = df["predicted_high_risk"].astype(int)
+    df["risk_probability"] = df["risk_probability"].astype(float)
+
+    # ---- Metrics from deltas ----
+    removed_ids = previous.index.difference(ids)
+    stale = previous.loc[ids[needs_scoring & ~is_new].tolist() + removed_ids.tolist(), SCORE_COLUMNS]
+
+    if "totals" in meta:
+        totals = _apply_delta(meta["totals"], stale, df.loc[needs_scoring, SCORE_COLUMNS])
+    else:
+        totals = _metric_totals(df)
+
+    state = df[
+        ["merchant_id", "input_fingerprint", "enrichment_fingerprint", "enriched_at"]
+        + INTERNAL_RISK_COLUMNS + SCORE_COLUMNS
+    ]
+    _save_state(state_dir, state, {"context": context, "totals": totals})
+
+    summary = {
+        "new": int(is_new.sum()),
+        "edited": int(is_edited.sum()),
+        "expired": int(is_expired.sum()),
+        "removed": int(len(removed_ids)),
+        "enriched": int(needs_enrichment.sum()),
+        "rescored": int(needs_scoring.sum()),
+        "reused": int((~needs_scoring).sum()),
+        "metrics": _metrics(totals),
+    }
+    logger.info(
+        f"Incremental run: {summary['enriched']} enriched, {summary['rescored']} re-scored, "
+        f"{summary['reused']} reused, {summary['removed']} removed"
+    )
+
+    return df, summary
@@ -0,0 +1,120 @@
+import logging
+import os
+from typing import Callable, List, Optional
+
+import pandas as pd
+
+from features.feature_pipeline import build_feature_frame
+from ingestion.async_risk_client import fetch_internal_risk_frame
+from ingestion.country_cache import CountryMetadataCache, get_country_cache
+from ingestion.csv_loader import iter_merchants_csv
+from model.predict import predict_risk
+from model.registry import get_model
+from reporting.portfolio import PortfolioAccumulator
+from storage.parquet_store import write_scored_merchants
+
+logger = logging.getLogger(__name__)
+
+
+SCORED_COLUMNS = [
+    "merchant_id",
+    "country",
+    "region",
+    "monthly_volume",
+    "risk_score",
+    "risk_probability",
+    "predicted_high_risk",
+    "risk_tier",
+]
+
+
+def _fetch_internal_risk(merchant_ids: List[str]) -> pd.DataFrame:
+    return fetch_internal_risk_frame(merchant_ids, batch_size=1000)
+
+
+def score_merchants_streaming(
+    input_path: str,
+    output_path: str,
+    chunksize: int = 50_000,
+    model=None,
+    internal_risk_fetcher: Callable[[List[str]], pd.DataFrame] = _fetch_internal_risk,
+    country_cache: Optional[CountryMetadataCache] = None,
+    pdf_text: str = "",
+    scrape_data: Optional[dict] = None,
+    output_columns: List[str] = SCORED_COLUMNS,
+    parquet_root: Optional[str] = None,
+    quarantine_path: Optional[str] = None,
+) -> dict:
+    """
+    Scores a merchants CSV chunk by chunk: validate, enrich, build
+    features, score and append to output_path. Peak memory depends on
+    chunksize, not file size. Nothing is retrained; the model comes from
+    the argument or the cached artifact.
+
+    country_risk_score (and so risk_score) is a per-country mean over the
+    chunk rather than the whole portfolio; the model inputs do not use it.
+
+    With parquet_root set, each scored chunk is also appended to the
+    partitioned Parquet scored table under that root. With quarantine_path
+    set, invalid rows are written there and skipped instead of failing
+    the run.
+
+    Returns a small summary with merchant and chunk counts and the
+    portfolio metrics, accumulated chunk by chunk.
+    """
+
+    model = model or get_model()
+    country_cache = country_cache or get_country_cache()
+    scrape_data = scrape_data or {}
+
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # Write to a temporary file so a failed run never leaves a partial output
+    partial_path = f"{output_path}.partial"
+
+    merchants = 0
+    chunks = 0
+    portfolio = PortfolioAccumulator()
+
+    try:
+        with open(partial_path, "w", newline="") as out:
+            for chunk in iter_merchants_csv(input_path, chunksize=chunksize, quarantine_path=quarantine_path):
+                if not len(chunk):
+                    continue  # every row quarantined
+
+                internal_df = internal_risk_fetcher(chunk["merchant_id"].tolist())
+                country_df = country_cache.prefetch_frame(chunk["country"].unique())
+
+                df = build_feature_frame(chunk, internal_df, country_df, pdf_text, scrape_data)
+                df = predict_risk(df, model=model)
+
+                df[output_columns].to_csv(out, header=chunks == 0, index=False)
+
+                if parquet_root:
+                    write_scored_merchants(
+                        df, parquet_root, mode="append" if chunks else "overwrite"
+                    )
+
+                portfolio.update(df)
+                merchants += len(df)
+                chunks += 1
+                logger.info(f"Scored chunk {chunks} ({merchants} merchants so far)")
+
+            # An empty input still produces a readable CSV with the header
+            if not chunks:
+                pd.DataFrame(columns=output_columns).to_csv(out, index=False)
+    except Exception:
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+        raise
+
+    os.replace(partial_path, output_path)
+
+    return {
+        "merchants": merchants,
+        "chunks": chunks,
+        "output_path": output_path,
+        "portfolio_metrics": portfolio.metrics(),
+    }
@@ -0,0 +1,151 @@
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from model.explain import has_drivers
+from reporting.prompts import build_underwriting_prompt, format_top_drivers
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_REPORT_DIR = "data/reports"
+
+# generate(prompts, max_new_tokens, batch_size) -> one text per prompt
+Generator = Callable[[List[str], int, int], List[str]]
+
+
+def _llm_generate(prompts: List[str], max_new_tokens: int, batch_size: int) -> List[str]:
+    # Imported here so the model is only loaded in the processes that generate
+    from reporting.llm_report_generator import generate_llm_reports
+
+    return generate_llm_reports(prompts, max_new_tokens=max_new_tokens, batch_size=batch_size)
+
+
+def report_path(output_dir: str, merchant_id) -> str:
+    return os.path.join(output_dir, f"{merchant_id}_llm_report.txt")
+
+
+def _write_report(path: str, text: str) -> None:
+    with open(f"{path}.tmp", "w") as f:
+        f.write(text)
+    os.replace(f"{path}.tmp", path)
+
+
+def _prompt_batches(
+    df: pd.DataFrame, feature_importance, portfolio_metrics: dict, batch_size: int
+) -> Iterator[Tuple[List, List[str]]]:
+    # Prompts are built one batch at a time, never for the whole tier up front
+    # Per-merchant drivers are formatted per prompt; global ones only once
+    top_drivers = None if has_drivers(df) else format_top_drivers(feature_importance)
+
+    for start in range(0, len(df), batch_size):
+        rows = df.iloc[start:start + batch_size].to_dict("records")
+        yield (
+            [row["merchant_id"] for row in rows],
+            [build_underwriting_prompt(row, feature_importance, portfolio_metrics, top_drivers) for row in rows],
+        )
+
+
+# -----------------------------
+# Worker processes
+# -----------------------------
+
+_worker_generate: Optional[Generator] = None
+
+
+def _init_worker(generate: Generator, threads: int) -> None:
+    global _worker_generate
+    _worker_generate = generate
+
+    # Split the cores between workers instead of each one using all of them
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+
+
+def _run_batch(merchant_ids: List, prompts: List[str], max_new_tokens: int, batch_size: int):
+    return merchant_ids, _worker_generate(prompts, max_new_tokens, batch_size)
+
+
+# -----------------------------
+# Batch mode
+# -----------------------------
+
+def generate_tier_reports(
+    df: pd.DataFrame,
+    feature_importance,
+    portfolio_metrics: dict,
+    tier: Optional[str] = "High",
+    batch_size: int = 8,
+    max_new_tokens: int = 400,
+    workers: int = 1,
+    output_dir: str = DEFAULT_REPORT_DIR,
+    generate: Generator = _llm_generate,
+) -> dict:
+    """
+    Writes an LLM underwriting report for every merchant in tier (all
+    merchants when tier is None), riskiest first, to
+    <output_dir>/<merchant_id>_llm_report.txt.
+
+    Prompts go through the model batch_size at a time. With workers > 1
+    each worker process loads its own model copy and gets an equal share
+    of the CPU threads; at most two batches per worker are in flight, so
+    memory stays bounded however large the tier is. Each batch is written
+    as soon as it completes.
+
+    generate must be a module-level function when workers > 1.
+    """
+
+    selected = df if tier is None else df[df["risk_tier"] == tier]
+    selected = selected.sort_values("risk_probability", ascending=False)
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    batches = _prompt_batches(selected, feature_importance, portfolio_metrics, batch_size)
+    written = 0
+    start = time.perf_counter()
+
+    def save(merchant_ids, texts):
+        nonlocal written
+        for merchant_id, text in zip(merchant_ids, texts):
+            _write_report(report_path(output_dir, merchant_id), text)
+        written += len(texts)
+        logger.info(f"Wrote {written}/{len(selected)} {tier or 'all'} reports")
+
+    if workers <= 1:
+        for merchant_ids, prompts in batches:
+            save(merchant_ids, generate(prompts, max_new_tokens, batch_size))
+    else:
+        threads = max(1, (os.cpu_count() or 1) // workers)
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(generate, threads)
+        ) as pool:
+            pending = set()
+
+            for merchant_ids, prompts in batches:
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        save(*future.result())
+
+                pending.add(pool.submit(_run_batch, merchant_ids, prompts, max_new_tokens, batch_size))
+
+            for future in wait(pending).done:
+                save(*future.result())
+
+    seconds = time.perf_counter() - start
+
+    return {
+        "tier": tier,
+        "reports": written,
+        "seconds": seconds,
+        "reports_per_minute": written / seconds * 60 if seconds else 0.0,
+        "output_dir": output_dir,
+    }
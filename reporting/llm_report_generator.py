@@ -1,48 +1,174 @@
-from transformers import pipeline
+import os
+import re
+import threading
+from typing import List, Optional, Union
 
-# Load model once (downloads first time only)
-llm = pipeline(
-    "text-generation",
-    model="google/flan-t5-small"
-)
+from reporting.prompts import build_underwriting_prompt
+from reporting.report_cache import ReportCache, get_report_cache, report_cache_key
 
-def generate_llm_underwriting_report(merchant_row, feature_importance, portfolio_metrics):
+# "transformers" (default) or "template"; read when the backend is first used
+BACKEND_ENV_VAR = "LLM_REPORT_BACKEND"
+
+DEFAULT_MODEL = "google/flan-t5-small"
+
+
+# -----------------------------
+# Backends
+# -----------------------------
+
+class TransformersBackend:
+    """
+    Hugging Face text-generation pipeline. transformers is imported and
+    the model loaded (downloaded the first time) on the first generate call.
+    """
+
+    def __init__(self, model: str = DEFAULT_MODEL, task: str = "text-generation"):
+        self.model = model
+        self.task = task
+        self.name = f"transformers:{task}:{model}"
+        self._llm = None
+        self._lock = threading.Lock()
+
+    @property
+    def llm(self):
+        with self._lock:
+            if self._llm is None:
+                from transformers import pipeline
+                self._llm = pipeline(self.task, model=self.model)
+            return self._llm
+
+    def generate(self, prompts: List[str], max_new_tokens: int, batch_size: int) -> List[str]:
+        results = self.llm(
+            prompts,
+            max_new_tokens=max_new_tokens,
+            do_sample=False,
+            batch_size=batch_size,
+        )
+        return [result[0]["generated_text"] for result in results]
+
+    def count_tokens(self, texts: List[str]) -> int:
+        return sum(len(self.llm.tokenizer(text)["input_ids"]) for text in texts)
 
-    if feature_importance is not None:
-        top_drivers = "\n".join([
-        f"- {row['feature']}: coef={row['coefficient']:.4f}"
-        for _, row in feature_importance.head(3).iterrows()
-        ])
-    else:
-        top_drivers = "Feature importance data not available."
 
-    prompt = f"""
-    Generate a professional BNPL underwriting report.
+class TemplateBackend:
+    """
+    Deterministic report built from the fields in the prompt, no model.
+    For tests and offline runs; the same prompt always gives the same text.
+    """
+
+    RECOMMENDATIONS = {
+        "High": "Decline or require enhanced due diligence before onboarding.",
+        "Medium": "Approve with manual review and reduced exposure limits.",
+        "Low": "Approve with standard onboarding and monitoring.",
+    }
+
+    name = "template"
+
+    def _field(self, prompt: str, name: str) -> str:
+        match = re.search(rf"^\s*{name}:\s*(.*)$", prompt, re.MULTILINE)
+        return match.group(1).strip() if match else "n/a"
+
+    def generate(self, prompts: List[str], max_new_tokens: int, batch_size: int) -> List[str]:
+        reports = []
 
-    Merchant ID: {merchant_row['merchant_id']}
-    Country: {merchant_row['country']}
-    Risk Tier: {merchant_row['risk_tier']}
-    Risk Probability: {merchant_row['risk_probability']:.2f}
+        for prompt in prompts:
+            tier = self._field(prompt, "Risk Tier")
+            drivers = re.findall(r"^\s*- (\w+): (?:coef|contribution)=", prompt, re.MULTILINE)
 
-    Top Risk Drivers:
-    {top_drivers}
+            report = (
+                f"Underwriting report for merchant {self._field(prompt, 'Merchant ID')} "
+                f"({self._field(prompt, 'Country')}).\n"
+                f"Risk summary: {tier} risk tier with risk probability "
+                f"{self._field(prompt, 'Risk Probability')} against a portfolio average of "
+                f"{self._field(prompt, 'Portfolio Average Risk')}.\n"
+                f"Key red flags: {', '.join(drivers) or 'none identified by the model'}; "
+                f"{self._field(prompt, 'Dispute Count')} disputes on "
+                f"{self._field(prompt, 'Transactions')} transactions.\n"
+                f"Recommendation: {self.RECOMMENDATIONS.get(tier, 'Manual review recommended.')}\n"
+            )
+            # Honour the token budget the way a model would, counting words
+            reports.append(" ".join(report.split(" ")[:max_new_tokens]))
 
-    Monthly Volume: {merchant_row['monthly_volume']}
-    Transactions: {merchant_row['transaction_count']}
-    Dispute Count: {merchant_row['dispute_count']}
+        return reports
 
-    Portfolio Average Risk: {portfolio_metrics['average_risk_probability']:.2f}
+    def count_tokens(self, texts: List[str]) -> int:
+        return sum(len(text.split()) for text in texts)
 
-    Provide:
-    - Risk summary
-    - Key red flags
-    - Recommendation
+
+BACKENDS = {
+    "transformers": TransformersBackend,
+    "template": TemplateBackend,
+}
+
+_backend = None
+
+
+def get_backend():
+    """
+    Process-wide backend, created on first use from LLM_REPORT_BACKEND.
     """
 
-    result = llm(
-        prompt,
-        max_new_tokens=400,
-        do_sample=False
-    )
+    global _backend
+    if _backend is None:
+        name = os.environ.get(BACKEND_ENV_VAR, "transformers")
+        if name not in BACKENDS:
+            raise ValueError(f"Unknown {BACKEND_ENV_VAR} {name!r}; expected one of {sorted(BACKENDS)}")
+        _backend = BACKENDS[name]()
+    return _backend
+
+
+def set_backend(backend: Optional[Union[str, object]]) -> None:
+    """
+    Swaps the backend: a name from BACKENDS, an object with a name and
+    generate() / count_tokens(), or None to re-read LLM_REPORT_BACKEND on next use.
+    """
+
+    global _backend
+    _backend = BACKENDS[backend]() if isinstance(backend, str) else backend
+
+
+# -----------------------------
+# Report generation
+# -----------------------------
+
+def generate_llm_reports(
+    prompts: List[str],
+    max_new_tokens: int = 400,
+    batch_size: int = 8,
+    cache: Optional[ReportCache] = None,
+) -> List[str]:
+    """
+    Runs many prompts through the backend, batch_size prompts per forward
+    pass. Decoding is greedy, so reports are cached by prompt, model and
+    generation parameters and only cache misses reach the model.
+    """
+
+    backend = get_backend()
+    cache = cache or get_report_cache()
+
+    # batch_size only changes how work is grouped, not the output
+    params = {"max_new_tokens": max_new_tokens, "do_sample": False}
+    keys = [report_cache_key(prompt, backend.name, params) for prompt in prompts]
+    reports = [cache.get(key) for key in keys]
+
+    # Identical prompts within one call are generated once
+    missing = {key: prompt for key, prompt, report in zip(keys, prompts, reports) if report is None}
+
+    if missing:
+        generated = dict(zip(missing, backend.generate(list(missing.values()), max_new_tokens, batch_size)))
+        for key, text in generated.items():
+            cache.put(key, text)
+        reports = [generated.get(key, report) for key, report in zip(keys, reports)]
+
+    return reports
+
+
+def count_tokens(texts: List[str]) -> int:
+    return get_backend().count_tokens(texts)
+
+
+def generate_llm_underwriting_report(merchant_row, feature_importance, portfolio_metrics):
+
+    prompt = build_underwriting_prompt(merchant_row, feature_importance, portfolio_metrics)
 
-    return result[0]["generated_text"]
\ No newline at end of file
+    return generate_llm_reports([prompt], max_new_tokens=400, batch_size=1)[0]
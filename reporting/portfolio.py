@@ -0,0 +1,354 @@
+import os
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+
+TIERS = ["High", "Medium", "Low"]
+
+DEFAULT_BINS = 1_000
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+
+GroupBy = Optional[Union[str, Sequence[str]]]
+
+
+def _group_columns(by: GroupBy) -> List[str]:
+    if by is None:
+        return []
+    return [by] if isinstance(by, str) else list(by)
+
+
+def _statistic(name: str) -> property:
+    # Rows of one statistic for the groups seen so far (capacity is larger)
+    return property(lambda self: self._stats[name][:len(self._index)])
+
+
+class PortfolioAccumulator:
+    """
+    Mergeable portfolio statistics over scored merchants, optionally per
+    group (e.g. by="country" or by=["region", "risk_tier"]).
+
+    Every statistic is a sum per group: merchant and tier counts, summed
+    probabilities, predicted high-risk count, volume, volume x probability
+    and a fixed-width probability histogram (for quantiles within 1 / bins,
+    bins * 8 bytes per group).
+    update() folds in a chunk with one bincount per statistic, and two
+    accumulators over different chunks merge() into the same result as
+    one over all rows, so chunks can be aggregated in any order or in
+    parallel.
+    """
+
+    merchants = _statistic("merchants")
+    tiers = _statistic("tiers")
+    predicted_high_risk = _statistic("predicted_high_risk")
+    probability_sum = _statistic("probability_sum")
+    volume = _statistic("volume")
+    volume_at_risk = _statistic("volume_at_risk")
+    histogram = _statistic("histogram")
+
+    def __init__(self, by: GroupBy = None, bins: int = DEFAULT_BINS):
+        self.by = _group_columns(by)
+        self.bins = bins
+
+        self._index: Dict[tuple, int] = {}
+        self._stats = {
+            "merchants": np.zeros(0, dtype=np.int64),
+            "tiers": np.zeros((0, len(TIERS)), dtype=np.int64),
+            "predicted_high_risk": np.zeros(0, dtype=np.int64),
+            "probability_sum": np.zeros(0),
+            "volume": np.zeros(0),
+            "volume_at_risk": np.zeros(0),
+            "histogram": np.zeros((0, bins), dtype=np.int64),
+        }
+
+    # -----------------------------
+    # Accumulation
+    # -----------------------------
+
+    def _reserve(self, groups: int) -> None:
+        # Capacity doubles, so adding groups one chunk at a time stays linear
+        capacity = len(self._stats["merchants"])
+        if groups <= capacity:
+            return
+
+        capacity = max(groups, 2 * capacity, 8)
+        for name, values in self._stats.items():
+            grown = np.zeros((capacity,) + values.shape[1:], dtype=values.dtype)
+            grown[:len(values)] = values
+            self._stats[name] = grown
+
+    def _slots(self, keys: List[tuple]) -> np.ndarray:
+        # Global row for each key, registering unseen groups
+        for key in keys:
+            if key not in self._index:
+                self._index[key] = len(self._index)
+
+        self._reserve(len(self._index))
+        return np.array([self._index[key] for key in keys], dtype=np.int64)
+
+    def _add(self, keys: List[tuple], merchants, tiers, predicted, probability_sum, volume, volume_at_risk, histogram):
+        slots = self._slots(keys)
+        stats = self._stats
+
+        # Keys are unique within one call, so plain fancy-index += is safe
+        stats["merchants"][slots] += merchants
+        stats["tiers"][slots] += tiers
+        stats["predicted_high_risk"][slots] += predicted
+        stats["probability_sum"][slots] += probability_sum
+        stats["volume"][slots] += volume
+        stats["volume_at_risk"][slots] += volume_at_risk
+        if histogram is not None:
+            stats["histogram"][slots] += histogram
+
+    def _add_histogram(self, keys: List[tuple], codes: np.ndarray, bucket: np.ndarray) -> None:
+        # Dense per-chunk counts only when they are no bigger than the chunk;
+        # many groups are counted sparsely instead of allocating groups x bins
+        cells = codes * self.bins + bucket
+        slots = self._slots(keys)
+
+        if len(keys) * self.bins <= 4 * len(cells):
+            counts = np.bincount(cells, minlength=len(keys) * self.bins).reshape(len(keys), -1)
+            self._stats["histogram"][slots] += counts
+        else:
+            cells, counts = np.unique(cells, return_counts=True)
+            flat = self._stats["histogram"].reshape(-1)
+            np.add.at(flat, slots[cells // self.bins] * self.bins + cells % self.bins, counts)
+
+    def _group_codes(self, df: pd.DataFrame):
+        # Dense group code per row plus the key tuple of each code; NaN is its own group
+        codes = np.zeros(len(df), dtype=np.int64)
+        if not self.by:
+            return codes, [()]
+
+        levels = []
+        for column in self.by:
+            column_codes, uniques = pd.factorize(df[column], use_na_sentinel=False)
+            codes = codes * len(uniques) + column_codes
+            # One canonical missing key, so NaN groups from different chunks merge
+            levels.append(np.array([None if pd.isna(v) else v for v in uniques], dtype=object))
+
+        # Several columns give sparse combined codes; densify them
+        if len(levels) > 1:
+            codes, combined = pd.factorize(codes)
+        else:
+            combined = np.arange(len(levels[0]))
+
+        parts = []
+        for uniques in reversed(levels):
+            parts.append(uniques[combined % len(uniques)])
+            combined = combined // len(uniques)
+
+        return codes.astype(np.int64), list(zip(*reversed(parts)))
+
+    def update(self, df: pd.DataFrame) -> "PortfolioAccumulator":
+        """
+        Folds a scored chunk (risk_probability, risk_tier, monthly_volume
+        and, when present, predicted_high_risk) into the totals.
+        """
+
+        if not len(df):
+            return self
+
+        codes, keys = self._group_codes(df)
+
+        groups = len(keys)
+        probability = df["risk_probability"].to_numpy(dtype=np.float64)
+        volume = df["monthly_volume"].to_numpy(dtype=np.float64)
+
+        tier = pd.Categorical(df["risk_tier"], categories=TIERS).codes.astype(np.int64)
+        known = tier >= 0
+
+        predicted = (
+            df["predicted_high_risk"].to_numpy(dtype=np.float64)
+            if "predicted_high_risk" in df else np.zeros(len(df))
+        )
+
+        bucket = np.minimum((probability * self.bins).astype(np.int64), self.bins - 1)
+
+        self._add(
+            keys,
+            np.bincount(codes, minlength=groups),
+            np.bincount(codes[known] * len(TIERS) + tier[known], minlength=groups * len(TIERS)).reshape(groups, -1),
+            np.bincount(codes, weights=predicted, minlength=groups).astype(np.int64),
+            np.bincount(codes, weights=probability, minlength=groups),
+            np.bincount(codes, weights=volume, minlength=groups),
+            np.bincount(codes, weights=volume * probability, minlength=groups),
+            None,
+        )
+        self._add_histogram(keys, codes, bucket)
+
+        return self
+
+    def merge(self, other: "PortfolioAccumulator") -> "PortfolioAccumulator":
+        """
+        Adds another accumulator's totals (same grouping and bins) into this one.
+        """
+
+        if other.by != self.by or other.bins != self.bins:
+            raise ValueError("Can only merge accumulators with the same grouping and bins")
+
+        keys = list(other._index)
+        if keys:
+            self._add(
+                keys, other.merchants, other.tiers, other.predicted_high_risk,
+                other.probability_sum, other.volume, other.volume_at_risk, other.histogram,
+            )
+
+        return self
+
+    # -----------------------------
+    # Results
+    # -----------------------------
+
+    def _quantiles(self, quantiles: Sequence[float]) -> np.ndarray:
+        # Linear interpolation inside the histogram bin holding each rank
+        cumulative = np.cumsum(self.histogram, axis=1)
+        result = np.full((len(self._index), len(quantiles)), np.nan)
+
+        for g in range(len(self._index)):
+            total = cumulative[g, -1]
+            if not total:
+                continue
+
+            for i, q in enumerate(quantiles):
+                rank = q * total
+                b = min(int(np.searchsorted(cumulative[g], rank)), self.bins - 1)
+                before = cumulative[g, b - 1] if b else 0
+                inside = self.histogram[g, b]
+                fraction = (rank - before) / inside if inside else 0.0
+                result[g, i] = (b + fraction) / self.bins
+
+        return result
+
+    def frame(self, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> pd.DataFrame:
+        """
+        One row per group (or a single row without grouping).
+        """
+
+        merchants = np.maximum(self.merchants, 1)
+        volume = np.where(self.volume > 0, self.volume, np.nan)
+
+        frame = pd.DataFrame({
+            "merchants": self.merchants,
+            "num_high_risk": self.tiers[:, 0],
+            "num_medium_risk": self.tiers[:, 1],
+            "num_low_risk": self.tiers[:, 2],
+            "predicted_high_risk": self.predicted_high_risk,
+            "expected_high_risk_merchants": self.probability_sum,
+            "average_risk_probability": self.probability_sum / merchants,
+            "total_volume": self.volume,
+            "expected_volume_at_risk": self.volume_at_risk,
+            "exposure_weighted_risk": self.volume_at_risk / volume,
+        })
+
+        for q, values in zip(quantiles, self._quantiles(quantiles).T):
+            frame[f"p{q * 100:g}_risk_probability"] = values
+
+        if self.by:
+            index = pd.MultiIndex.from_tuples(list(self._index), names=self.by)
+            frame.index = index.get_level_values(0) if len(self.by) == 1 else index
+            frame = frame.sort_index()
+
+        return frame
+
+    def metrics(self, quantiles: Sequence[float] = DEFAULT_QUANTILES) -> dict:
+        """
+        Whole-portfolio totals as a plain dict (groups are summed first).
+        """
+
+        total = PortfolioAccumulator(bins=self.bins)
+        total._add(
+            [()],
+            self.merchants.sum(keepdims=True),
+            self.tiers.sum(axis=0, keepdims=True),
+            self.predicted_high_risk.sum(keepdims=True),
+            self.probability_sum.sum(keepdims=True),
+            self.volume.sum(keepdims=True),
+            self.volume_at_risk.sum(keepdims=True),
+            self.histogram.sum(axis=0, keepdims=True),
+        )
+
+        return total.frame(quantiles).to_dict("records")[0]
+
+
+# -----------------------------
+# Entry points
+# -----------------------------
+
+def portfolio_metrics(df: pd.DataFrame, bins: int = DEFAULT_BINS) -> dict:
+    """
+    Tier counts, expected and predicted high-risk counts, average and
+    quantile risk probability, and volume-weighted exposure for df.
+    """
+
+    return PortfolioAccumulator(bins=bins).update(df).metrics()
+
+
+def portfolio_breakdown(df: pd.DataFrame, by: GroupBy = "risk_tier", bins: int = DEFAULT_BINS) -> pd.DataFrame:
+    """
+    The same metrics per group, e.g. by="country" or by=["region", "risk_tier"].
+    """
+
+    return PortfolioAccumulator(by, bins).update(df).frame()
+
+
+def _accumulate(chunk: pd.DataFrame, by: GroupBy, bins: int) -> PortfolioAccumulator:
+    return PortfolioAccumulator(by, bins).update(chunk)
+
+
+def aggregate_chunks(
+    chunks: Iterable[pd.DataFrame],
+    by: GroupBy = None,
+    bins: int = DEFAULT_BINS,
+    n_jobs: int = 1,
+) -> PortfolioAccumulator:
+    """
+    Accumulates scored chunks (e.g. from a chunked reader) and returns the
+    merged accumulator. With n_jobs != 1 chunks are aggregated on joblib
+    threads (the numpy kernels release the GIL and chunks are not copied)
+    and only the small per-chunk accumulators are combined.
+    """
+
+    total = PortfolioAccumulator(by, bins)
+
+    if n_jobs == 1:
+        for chunk in chunks:
+            total.update(chunk)
+        return total
+
+    import joblib
+
+    parts = joblib.Parallel(n_jobs=n_jobs, prefer="threads", return_as="generator")(
+        joblib.delayed(_accumulate)(chunk, by, bins) for chunk in chunks
+    )
+    for part in parts:
+        total.merge(part)
+
+    return total
+
+
+def aggregate_scored_table(
+    root: Optional[str] = None,
+    by: GroupBy = None,
+    batch_size: int = 1_000_000,
+    bins: int = DEFAULT_BINS,
+) -> PortfolioAccumulator:
+    """
+    Aggregates the persisted scored table batch by batch, reading only the
+    columns the metrics and grouping need. root defaults to the parquet
+    store's DEFAULT_ROOT.
+    """
+
+    import pyarrow.dataset as ds
+
+    from storage.parquet_store import DEFAULT_ROOT, SCORED_TABLE
+
+    dataset = ds.dataset(os.path.join(root or DEFAULT_ROOT, SCORED_TABLE), format="parquet", partitioning="hive")
+    wanted = ["risk_probability", "risk_tier", "monthly_volume", "predicted_high_risk"] + _group_columns(by)
+    columns = [c for c in dict.fromkeys(wanted) if c in dataset.schema.names]
+
+    return aggregate_chunks(
+        (batch.to_pandas() for batch in dataset.to_batches(columns=columns, batch_size=batch_size)),
+        by, bins,
+    )
@@ -0,0 +1,56 @@
+from model.explain import has_drivers, merchant_drivers
+
+
+def format_top_drivers(feature_importance, n: int = 3) -> str:
+
+    if feature_importance is None:
+        return "Feature importance data not available."
+
+    return "\n".join([
+        f"- {row['feature']}: coef={row['coefficient']:.4f}"
+        for _, row in feature_importance.head(n).iterrows()
+    ])
+
+
+def format_merchant_drivers(merchant_row) -> str:
+    return "\n".join(
+        f"- {feature}: contribution={value:+.4f}" for feature, value in merchant_drivers(merchant_row)
+    )
+
+
+def build_underwriting_prompt(merchant_row, feature_importance, portfolio_metrics, top_drivers=None):
+    """
+    Underwriting prompt for one merchant. Rows scored with explain_risk
+    list their own drivers; otherwise the global feature importance is
+    used. Pass top_drivers (from format_top_drivers) when building many
+    prompts with the same feature importance, so it is formatted once.
+    """
+
+    if top_drivers is None:
+        top_drivers = (
+            format_merchant_drivers(merchant_row) if has_drivers(merchant_row)
+            else format_top_drivers(feature_importance)
+        )
+
+    return f"""
+    Generate a professional BNPL underwriting report.
+
+    Merchant ID: {merchant_row['merchant_id']}
+    Country: {merchant_row['country']}
+    Risk Tier: {merchant_row['risk_tier']}
+    Risk Probability: {merchant_row['risk_probability']:.2f}
+
+    Top Risk Drivers:
+    {top_drivers}
+
+    Monthly Volume: {merchant_row['monthly_volume']}
+    Transactions: {merchant_row['transaction_count']}
+    Dispute Count: {merchant_row['dispute_count']}
+
+    Portfolio Average Risk: {portfolio_metrics['average_risk_probability']:.2f}
+
+    Provide:
+    - Risk summary
+    - Key red flags
+    - Recommendation
+    """
@@ -0,0 +1,216 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_CACHE_DIR = "data/cache/reports"
+DEFAULT_MEMORY_ITEMS = 1024
+DEFAULT_MAX_DISK_BYTES = 256 * 2 ** 20
+
+# Eviction frees space down to this fraction of the cap, so a full cache
+# is not rescanned on every put
+EVICTION_LOW_WATER = 0.9
+
+# Overrides the disk location; an empty value keeps the cache in memory only
+CACHE_DIR_ENV_VAR = "LLM_REPORT_CACHE_DIR"
+
+
+def report_cache_key(prompt: str, model: str, params: dict) -> str:
+    """
+    Content address of one generation: with greedy decoding the same
+    prompt, model and parameters always produce the same text.
+    """
+
+    payload = json.dumps({"prompt": prompt, "model": model, "params": params}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ReportCache:
+    """
+    Generated reports by content key: an in-memory LRU of memory_items
+    entries in front of a directory of text files capped at
+    max_disk_bytes. When the cap is exceeded, the least recently used
+    files (by mtime, refreshed on every hit) are deleted until usage is
+    back under 90% of the cap.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        memory_items: int = DEFAULT_MEMORY_ITEMS,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+    ):
+        self.cache_dir = cache_dir or None
+        self.memory_items = memory_items
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._disk_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    # -----------------------------
+    # Memory layer
+    # -----------------------------
+
+    def _remember(self, key: str, text: str) -> None:
+        with self._lock:
+            self._memory[key] = text
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_items:
+                self._memory.popitem(last=False)
+
+    # -----------------------------
+    # Disk layer
+    # -----------------------------
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.txt")
+
+    def _disk_files(self):
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                if name.endswith(".txt"):
+                    yield os.path.join(root, name)
+
+    def _disk_usage(self) -> int:
+        # Scanned once per process, then tracked incrementally
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(os.path.getsize(path) for path in self._disk_files())
+        return self._disk_bytes
+
+    def _evict(self) -> None:
+        files = []
+        for path in self._disk_files():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        self._disk_bytes = sum(size for _, size, _ in files)
+        target = self.max_disk_bytes * EVICTION_LOW_WATER
+
+        for _, size, path in sorted(files):
+            if self._disk_bytes <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # another process evicted it first
+            self._disk_bytes -= size
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                text = f.read()
+        except FileNotFoundError:
+            return None
+
+        # Mark as recently used for eviction
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return text
+
+    def _write_disk(self, key: str, text: str) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        data = text.encode("utf-8")
+
+        # Initial scan before this file lands, so it isn't counted twice
+        with self._lock:
+            self._disk_usage()
+
+        # A private temp file per writer, so processes writing the same key don't collide
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+
+            try:
+                replaced = os.path.getsize(path)
+            except FileNotFoundError:
+                replaced = 0
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+
+        with self._lock:
+            self._disk_bytes = self._disk_usage() + len(data) - replaced
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict()
+
+    # -----------------------------
+    # Public API
+    # -----------------------------
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            text = self._memory.get(key)
+            if text is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return text
+
+        text = self._read_disk(key) if self.cache_dir else None
+
+        with self._lock:
+            if text is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+
+        self._remember(key, text)
+        return text
+
+    def put(self, key: str, text: str) -> None:
+        self._remember(key, text)
+        if self.cache_dir:
+            self._write_disk(key, text)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "lookups": lookups,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+                "memory_items": len(self._memory),
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+
+_default_cache: Optional[ReportCache] = None
+
+
+def get_report_cache() -> ReportCache:
+    """
+    Process-wide report cache; LLM_REPORT_CACHE_DIR overrides its directory.
+    """
+
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ReportCache(os.environ.get(CACHE_DIR_ENV_VAR, DEFAULT_CACHE_DIR))
+    return _default_cache
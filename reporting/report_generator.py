@@ -1,39 +1,105 @@
-def generate_underwriting_report(row, feature_importance):
+from itertools import repeat
+from typing import Iterator, Optional, Tuple
 
-    report = f"""
-==============================
-MERCHANT RISK ASSESSMENT
-==============================
+import pandas as pd
 
-Merchant ID: {row['merchant_id']}
-Country: {row['country']}
+from model.explain import DEFAULT_TOP_K, contribution_column, driver_column, has_drivers, merchant_drivers
 
---- Behavioral Model ---
-Risk Probability: {row['risk_probability']:.3f}
-Risk Tier: {row['risk_tier']}
 
---- Top Risk Drivers ---
-"""
+RULE = "=============================="
 
-    for _, feature in feature_importance.head(3).iterrows():
-        report += f"- {feature['feature']} (coef: {feature['coefficient']:.4f})\n"
+RECOMMENDATIONS = {
+    "High": "Enhanced due diligence required.\n",
+    "Medium": "Manual review recommended.\n",
+}
+DEFAULT_RECOMMENDATION = "Standard onboarding.\n"
 
-    report += f"""
---- Transaction Metrics ---
-Monthly Volume: {row['monthly_volume']}
-Transaction Count: {row['transaction_count']}
-Dispute Count: {row['dispute_count']}
+# Fixed text between the per-merchant fields, in order
+_HEADER = f"\n{RULE}\nMERCHANT RISK ASSESSMENT\n{RULE}\n\nMerchant ID: "
+_COUNTRY = "\nCountry: "
+_PROBABILITY = "\n\n--- Behavioral Model ---\nRisk Probability: "
+_TIER = "\nRisk Tier: "
+_DRIVERS = "\n\n--- Top Risk Drivers ---\n"
+_VOLUME = "\n--- Transaction Metrics ---\nMonthly Volume: "
+_TRANSACTIONS = "\nTransaction Count: "
+_DISPUTES = "\nDispute Count: "
+_RECOMMENDATION = "\n\n--- Final Recommendation ---\n"
+_FOOTER = f"\n{RULE}\n"
 
---- Final Recommendation ---
-"""
 
-    if row["risk_tier"] == "High":
-        report += "Enhanced due diligence required.\n"
-    elif row["risk_tier"] == "Medium":
-        report += "Manual review recommended.\n"
-    else:
-        report += "Standard onboarding.\n"
+def format_driver_lines(feature_importance, n: int = 3) -> str:
+    return "".join(
+        f"- {feature['feature']} (coef: {feature['coefficient']:.4f})\n"
+        for _, feature in feature_importance.head(n).iterrows()
+    )
+
+
+def format_merchant_driver_lines(drivers) -> str:
+    """
+    Driver lines for one merchant's own (feature, contribution) pairs.
+    """
+
+    return "".join(f"- {feature} (contribution: {value:+.4f})\n" for feature, value in drivers)
+
+
+def _render(merchant_id, country, probability, tier, volume, transactions, disputes, drivers: str) -> str:
+    return "".join((
+        _HEADER, f"{merchant_id}",
+        _COUNTRY, f"{country}",
+        _PROBABILITY, f"{probability:.3f}",
+        _TIER, f"{tier}",
+        _DRIVERS, drivers,
+        _VOLUME, f"{volume}",
+        _TRANSACTIONS, f"{transactions}",
+        _DISPUTES, f"{disputes}",
+        _RECOMMENDATION, RECOMMENDATIONS.get(tier, DEFAULT_RECOMMENDATION),
+        _FOOTER,
+    ))
+
 
-    report += "\n==============================\n"
+def generate_underwriting_report(row, feature_importance):
+
+    return _render(
+        row["merchant_id"],
+        row["country"],
+        row["risk_probability"],
+        row["risk_tier"],
+        row["monthly_volume"],
+        row["transaction_count"],
+        row["dispute_count"],
+        format_merchant_driver_lines(merchant_drivers(row)) if has_drivers(row)
+        else format_driver_lines(feature_importance),
+    )
+
+
+def iter_underwriting_reports(
+    df: pd.DataFrame, feature_importance, tier: Optional[str] = None
+) -> Iterator[Tuple[str, str]]:
+    """
+    Yields (merchant_id, report) for every merchant, or only those in
+    tier, with the same text as generate_underwriting_report. Columns are
+    read as arrays, not rows; without per-merchant driver columns the
+    global driver section is formatted once.
+    """
+
+    if tier is not None:
+        df = df[df["risk_tier"] == tier]
+
+    columns = [
+        df[c].to_numpy()
+        for c in ["merchant_id", "country", "risk_probability", "risk_tier",
+                  "monthly_volume", "transaction_count", "dispute_count"]
+    ]
+
+    if has_drivers(df):
+        ranks = [rank for rank in range(1, DEFAULT_TOP_K + 1) if driver_column(rank) in df]
+        pairs = zip(*(
+            zip(df[driver_column(rank)].to_numpy(), df[contribution_column(rank)].to_numpy())
+            for rank in ranks
+        ))
+        drivers = (format_merchant_driver_lines(merchant) for merchant in pairs)
+    else:
+        drivers = repeat(format_driver_lines(feature_importance))
 
-    return report
\ No newline at end of file
+    for (merchant_id, *fields), merchant_drivers_text in zip(zip(*columns), drivers):
+        yield merchant_id, _render(merchant_id, *fields, merchant_drivers_text)
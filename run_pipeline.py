@@ -1,11 +1,8 @@
 from ingestion.csv_loader import load_merchants_csv
-from ingestion.simulated_api_client import fetch_internal_risk
 import pandas as pd
-from ingestion.rest_countries_client import fetch_country_metadata
-import asyncio
-from ingestion.pdf_processor import extract_pdf_text_async
-from ingestion.scraper import scrape_claritypay
+from ingestion.country_cache import enrich_with_country_cache, get_country_cache
 
+import functools
 import logging
 
 logging.basicConfig(
@@ -13,202 +10,328 @@ logging.basicConfig(
     format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
-def enrich_with_internal_api(df: pd.DataFrame) -> pd.DataFrame:
-    enriched_rows = []
+def enrich_with_internal_api(
+    df: pd.DataFrame, concurrency: int = 8, batch_size: int = 1000
+) -> pd.DataFrame:
+    from ingestion.async_risk_client import fetch_internal_risk_frame
 
-    for _, row in df.iterrows():
-        merchant_id = row["merchant_id"]
-
-        api_data = fetch_internal_risk(merchant_id)
+    # Fetch merchants in concurrent /risk/batch chunks, then join on merchant_id
+    api_df = fetch_internal_risk_frame(
+        df["merchant_id"].tolist(), concurrency=concurrency, batch_size=batch_size
+    )
 
-        enriched_row = row.to_dict()
+    return join_on_key(df, api_df, "merchant_id")
 
-        enriched_row["internal_risk_flag"] = api_data["internal_risk_flag"]
-        enriched_row["last_30d_volume"] = api_data["transaction_summary"]["last_30d_volume"]
-        enriched_row["last_30d_txn_count"] = api_data["transaction_summary"]["last_30d_txn_count"]
-        enriched_row["avg_ticket_size"] = api_data["transaction_summary"]["avg_ticket_size"]
-        enriched_row["last_review_date"] = api_data.get("last_review_date")
 
-        enriched_rows.append(enriched_row)
+def enrich_with_country_data(df: pd.DataFrame) -> pd.DataFrame:
 
-    return pd.DataFrame(enriched_rows)
+    # O(unique countries): cached lookups joined back onto every merchant row
+    return enrich_with_country_cache(df)
 
 
-def enrich_with_country_data(df: pd.DataFrame) -> pd.DataFrame:
-    enriched_rows = []
+from model.explain import explain_risk
+from model.train import train_risk_model
+from model.predict import predict_risk
+from model.registry import get_model
+from features.feature_pipeline import join_on_key, build_feature_frame
+from features.text_signals import document_term_counts, merchant_term_counts
+from features.registry import MODEL_FEATURES, TARGET, compute_features
+from pipeline.executor import PipelineExecutor, Stage
+from reporting.portfolio import portfolio_breakdown, portfolio_metrics
 
-    for _, row in df.iterrows():
-        country_data = fetch_country_metadata(row["country"])
+# ---- Portfolio-level aggregation ----
+def compute_portfolio_metrics(df):
+    # Tier counts, expected / predicted high-risk, quantiles and exposure in one pass
+    return portfolio_metrics(df)
 
-        enriched_row = row.to_dict()
-        enriched_row.update(country_data)
+# ---- Stage DAG ----
+# aiohttp, pdfplumber, requests and pyarrow are imported by the stages that
+# use them, so importing this module stays cheap
 
-        enriched_rows.append(enriched_row)
+def _fetch_internal_risk(merchants):
+    from ingestion.async_risk_client import fetch_internal_risk_frame
 
-    return pd.DataFrame(enriched_rows)
+    return fetch_internal_risk_frame(
+        merchants["merchant_id"].tolist(), concurrency=8, batch_size=1000
+    )
 
 
-from model.train import train_risk_model
-from model.predict import predict_risk
+def _fetch_country_metadata(merchants):
+    return get_country_cache().prefetch_frame(merchants["country"].dropna().unique())
 
-def extract_pdf_risk_signal(pdf_text):
 
-    if not pdf_text:
-        return 0.0
+async def _extract_pdf(pdf_path):
+    from ingestion.pdf_processor import extract_pdf_text_async
 
-    keywords = ["fraud", "lawsuit", "bankruptcy"]
-    return sum(word in pdf_text.lower() for word in keywords) / len(keywords)
+    return await extract_pdf_text_async(pdf_path)
 
 
-def build_external_features(df, pdf_text, scrape_data):
+def _scrape():
+    from ingestion.scraper import scrape_claritypay
 
-    # ---- PDF Risk Signals ----
-    df["pdf_mentions_refunds"] = int("refund" in pdf_text.lower())
-    df["pdf_mentions_chargeback"] = int("chargeback" in pdf_text.lower())
-    df["pdf_mentions_complaint"] = int("complaint" in pdf_text.lower())
+    return scrape_claritypay()
 
-    # ---- Web Scrape Signals ----
-    df["num_value_props"] = len(scrape_data.get("value_propositions", []))
-    df["num_public_stats"] = len(scrape_data.get("public_stats", []))
-    df["num_partners"] = len(scrape_data.get("partners", []))
 
-    # ---- Internal API Signals ----
-    # df["internal_flag_numeric"] = df["internal_risk_flag"].astype(int)
-    RISK_FLAG_MAP = {
-    "low": 0,
-    "medium": 1,
-    "high": 2
-    }
+def _document_signals(documents_dir):
+    from ingestion.document_processor import extract_documents
 
-    # Validate unknown categories
-    unknown_flags = set(df["internal_risk_flag"].dropna().unique()) - set(RISK_FLAG_MAP.keys())
+    # Per-merchant PDFs are optional; without them every merchant shares the summary PDF
+    if not documents_dir:
+        return None
+    return merchant_term_counts(document_term_counts(extract_documents(documents_dir)))
 
-    if unknown_flags:
-        print(f"WARNING: Unknown internal risk flags found: {unknown_flags}")
 
-    df["internal_flag_numeric"] = (
-        df["internal_risk_flag"]
-            .map(RISK_FLAG_MAP)
+def _build_features(merchants, internal_df, country_df, pdf_text, scrape_data, document_signals):
+    df = build_feature_frame(
+        merchants, internal_df, country_df, pdf_text, scrape_data, document_signals
     )
 
-    # Optional: Fill missing safely
-    df["internal_flag_numeric"] = df["internal_flag_numeric"].fillna(1)
+    # Model inputs computed once here, from the enriched inputs rather than any
+    # derived columns carried in the CSV; training and scoring reuse them
+    return compute_features(df, MODEL_FEATURES + [TARGET], recompute=True)
 
-    # ---- Country Risk Proxy ----
-    df["is_high_risk_region"] = df["region"].isin(
-        ["Africa", "South America"]
-    ).astype(int)
 
+def _train_model(df):
+    _, feature_importance = train_risk_model(df)
+    # The version just published: estimator plus the threshold, tier cutoffs
+    # and training baseline the scoring service also reads
+    return get_model(), feature_importance
 
 
-    pdf_risk_signal = extract_pdf_risk_signal(pdf_text)
-    df["pdf_risk_signal"] = pdf_risk_signal
+def _score(df, model):
+    # Tiers and drivers use the published artifact, exactly as the scoring service does
+    df = predict_risk(df, model=model)
+    # Per-merchant drivers for the reports, in one pass over the portfolio
+    return explain_risk(df, model=model)
 
-    return df
 
-def compute_country_risk(df: pd.DataFrame) -> pd.DataFrame:
+def _persist(df):
+    from storage.parquet_store import write_feature_table, write_scored_merchants
 
-    if {"chargeback_rate", "fraud_rate"}.issubset(df.columns):
+    # Columnar snapshots for reporting / retraining slices
+    write_feature_table(df)
+    write_scored_merchants(df)
 
-        country_risk = (
-            df.groupby("country")[["chargeback_rate", "fraud_rate"]]
-            .mean()
-            .mean(axis=1)
-        )
 
-        df["country_risk_score"] = df["country"].map(country_risk)
+def _search_model(df):
+    from model.search import search_risk_model
 
-    else:
-        df["country_risk_score"] = 0.0
+    _, feature_importance, _ = search_risk_model(df)
+    return get_model(), feature_importance
 
-    return df
 
-# ---- Portfolio-level aggregation ----
-def compute_portfolio_metrics(df):
-    portfolio_metrics = {}
+def _score_incremental(merchants, pdf_text, scrape_data, state_dir, **options):
+    from pipeline.incremental import DEFAULT_STATE_DIR, run_incremental
 
-    # Count of merchants by tier
-    portfolio_metrics['num_high_risk'] = (df['risk_tier'] == 'High').sum()
-    portfolio_metrics['num_medium_risk'] = (df['risk_tier'] == 'Medium').sum()
-    portfolio_metrics['num_low_risk'] = (df['risk_tier'] == 'Low').sum()
+    # Scores with the published model; only new, edited or expired merchants hit the API
+    return run_incremental(
+        merchants, state_dir=state_dir or DEFAULT_STATE_DIR,
+        pdf_text=pdf_text, scrape_data=scrape_data, **options,
+    )
 
-    # Expected number of high-risk merchants (sum of probabilities)
-    portfolio_metrics['expected_high_risk_merchants'] = df['risk_probability'].sum()
 
-    # Average probability across portfolio
-    portfolio_metrics['average_risk_probability'] = df['risk_probability'].mean()
+def build_pipeline_stages(csv_path, pdf_path, persist=True, search=False):
+    """
+    Declares every pipeline stage with its inputs and outputs. The CSV
+    enrichment calls, PDF and document extraction and web scrape do not
+    depend on each other and run concurrently. search swaps the single
+    fit for the cross-validated model search.
+    """
+
+    stages = [
+        Stage("load_csv", load_merchants_csv, ["csv_path"], ["merchants"]),
+        Stage("internal_api", _fetch_internal_risk, ["merchants"], ["internal_df"]),
+        Stage("country_api", _fetch_country_metadata, ["merchants"], ["country_df"]),
+        Stage("pdf", _extract_pdf, ["pdf_path"], ["pdf_text"]),
+        Stage("documents", _document_signals, ["documents_dir"], ["document_signals"]),
+        Stage("scrape", _scrape, [], ["scrape_data"]),
+        Stage(
+            "features", _build_features,
+            ["merchants", "internal_df", "country_df", "pdf_text", "scrape_data", "document_signals"],
+            ["features"],
+        ),
+        Stage("train", _search_model if search else _train_model, ["features"], ["model", "feature_importance"]),
+        Stage("score", _score, ["features", "model"], ["scored"]),
+        Stage("portfolio", compute_portfolio_metrics, ["scored"], ["portfolio_metrics"]),
+    ]
+
+    if persist:
+        stages.append(Stage("persist", _persist, ["scored"], []))
+
+    return stages
+
+
+def build_incremental_stages(persist=True, **options):
+    """
+    Stages of a nightly incremental run: no training, and enrichment and
+    scoring only for merchants that changed since the state in state_dir.
+    options are passed on to pipeline.incremental.run_incremental.
+    """
+
+    stages = [
+        Stage("load_csv", load_merchants_csv, ["csv_path"], ["merchants"]),
+        Stage("pdf", _extract_pdf, ["pdf_path"], ["pdf_text"]),
+        Stage("scrape", _scrape, [], ["scrape_data"]),
+        Stage(
+            "incremental", functools.partial(_score_incremental, **options),
+            ["merchants", "pdf_text", "scrape_data", "state_dir"],
+            ["scored", "incremental_summary"],
+        ),
+    ]
+
+    if persist:
+        stages.append(Stage("persist", _persist, ["scored"], []))
+
+    return stages
+
+
+def run_pipeline(
+    csv_path="data/merchants.csv",
+    pdf_path="data/sample_merchant_summary.pdf",
+    persist=True,
+    max_workers=8,
+    documents_dir=None,
+    search=False,
+):
+    """
+    Runs the full pipeline without the interactive report loop and
+    returns a PipelineResult: result["scored"], result["model"] (the
+    published artifact: estimator, threshold, tier cutoffs, baseline),
+    result["feature_importance"], result["portfolio_metrics"], plus
+    per-stage timings and the critical path.
+
+    documents_dir optionally points at per-merchant PDFs (named
+    <merchant_id>_*.pdf) whose keyword signals override the shared PDF.
+    search=True picks the model by parallel k-fold CV (model/search.py).
+    """
+
+    executor = PipelineExecutor(
+        build_pipeline_stages(csv_path, pdf_path, persist, search), max_workers=max_workers
+    )
 
-    return portfolio_metrics
+    return executor.run(
+        {"csv_path": csv_path, "pdf_path": pdf_path, "documents_dir": documents_dir}
+    )
 
-if __name__ == "__main__":
 
-    # 1️⃣ Load CSV
-    df = load_merchants_csv("data/merchants.csv")
-    print("CSV Loaded")
+def run_incremental_pipeline(
+    csv_path="data/merchants.csv",
+    pdf_path="data/sample_merchant_summary.pdf",
+    state_dir=None,
+    persist=True,
+    max_workers=8,
+    **options,
+):
+    """
+    Re-scores only what changed since the last incremental run, using the
+    currently published model (run the full pipeline once to train it).
+    Returns a PipelineResult with result["scored"] and
+    result["incremental_summary"]: new / edited / removed / rescored
+    counts and the delta-maintained portfolio metrics.
+    """
 
-    df = enrich_with_internal_api(df)
-    print("Internal API enrichment complete")
+    executor = PipelineExecutor(build_incremental_stages(persist, **options), max_workers=max_workers)
 
-    df = enrich_with_country_data(df)
-    print("Country enrichment complete")
+    return executor.run({"csv_path": csv_path, "pdf_path": pdf_path, "state_dir": state_dir})
 
-    # Process PDF asynchronously
-    print("Processing merchant summary PDF...")
-    pdf_text = asyncio.run(
-        extract_pdf_text_async("data/sample_merchant_summary.pdf")
+
+if __name__ == "__main__":
+
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Merchant risk pipeline")
+    parser.add_argument("--report-tier", help="write LLM reports for every merchant in this tier and exit")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--max-new-tokens", type=int, default=400)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--render-reports", choices=["files", "jsonl", "tar"],
+        help="render template reports for the portfolio (or --render-tier) and exit",
+    )
+    parser.add_argument("--render-tier")
+    parser.add_argument("--search", action="store_true", help="choose the model by parallel k-fold CV")
+    parser.add_argument(
+        "--train-stream", metavar="FEATURES",
+        help="train out of core on a feature table (CSV or Parquet) in --chunksize chunks and exit",
     )
-    scrape_data = scrape_claritypay()
-
-    df = build_external_features(df, pdf_text, scrape_data)
-    print("External features built")
-
-    # Behavioral rates
-    df["transaction_count"] = df["transaction_count"].replace(0, 1)
-    df["chargeback_rate"] = df["dispute_count"] / df["transaction_count"]
-    df["fraud_rate"] = df["chargeback_rate"] * 0.6
-    print("Behavioral rates created")
-
-    # ✅ ADD THIS LINE
-    df = compute_country_risk(df)
-    print("Country risk computed")
-
-    # Now composite risk score
-    df["risk_score"] = (
-        0.4 * df["chargeback_rate"] +
-        0.3 * df["fraud_rate"] +
-        0.2 * df["internal_flag_numeric"] +
-        0.1 * df["country_risk_score"]
+    parser.add_argument("--chunksize", type=int, default=50_000)
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="re-score only merchants changed since the last incremental run, with the published model, and exit",
     )
+    parser.add_argument("--state-dir", help="state kept between incremental runs (default data/state)")
+    args = parser.parse_args()
 
-    # 2️⃣ Train Behavioral Model
-    model, feature_importance = train_risk_model(df)
+    if args.train_stream:
+        from model.streaming_train import train_risk_model_streaming
 
-    print("\nTraining Complete\n")
+        train_risk_model_streaming(args.train_stream, chunksize=args.chunksize)
+        raise SystemExit(0)
 
-    # 3️⃣ Generate Predictions
-    df = predict_risk(df)
+    if args.incremental:
+        result = run_incremental_pipeline(state_dir=args.state_dir)
+        summary = result["incremental_summary"]
 
-    # 4️⃣ Map Probability → Tier
-    def map_risk_tier(p):
-        if p > 0.7:
-            return "High"
-        elif p > 0.3:
-            return "Medium"
-        return "Low"
+        print("\nStage timings:")
+        print(result.format_timings())
+        print(
+            f"\nRe-scored {summary['rescored']} merchants ({summary['new']} new, {summary['edited']} edited), "
+            f"re-enriched {summary['enriched']}, reused {summary['reused']}, removed {summary['removed']}"
+        )
+        print("\n--- Portfolio-level Risk Metrics ---")
+        for k, v in summary["metrics"].items():
+            print(f"{k}: {v}")
+        raise SystemExit(0)
+
+    result = run_pipeline(search=args.search)
 
-    df["risk_tier"] = df["risk_probability"].apply(map_risk_tier)
+    print("\nStage timings:")
+    print(result.format_timings())
+
+    df = result["scored"]
+    model = result["model"]
+    feature_importance = result["feature_importance"]
 
     print("\nSample Predictions:")
     print(df[["merchant_id", "risk_probability", "risk_tier"]].head())
 
-    from reporting.llm_report_generator import generate_llm_underwriting_report
     import os
 
-    # Compute portfolio-level metrics once
-    portfolio_metrics = {
-        "expected_high_risk_merchants": df['predicted_high_risk'].sum(),
-        "average_risk_probability": df['risk_probability'].mean()
-    }
+    # Computed once by the portfolio stage
+    portfolio_metrics = result["portfolio_metrics"]
+
+    print("\nPortfolio by region:")
+    print(portfolio_breakdown(df, by="region")[
+        ["merchants", "num_high_risk", "average_risk_probability", "exposure_weighted_risk"]
+    ])
+
+    if args.render_reports:
+        from reporting.bulk_reports import render_portfolio_reports
+
+        summary = render_portfolio_reports(
+            df, feature_importance, args.render_reports, tier=args.render_tier
+        )
+        print(f"Rendered {summary['reports']} reports to {summary['output']} in {summary['seconds']:.2f}s")
+        raise SystemExit(0)
+
+    if args.report_tier:
+        from reporting.batch_reports import generate_tier_reports
+
+        summary = generate_tier_reports(
+            df, feature_importance, portfolio_metrics,
+            tier=args.report_tier,
+            batch_size=args.batch_size,
+            max_new_tokens=args.max_new_tokens,
+            workers=args.workers,
+        )
+        print(
+            f"Wrote {summary['reports']} {args.report_tier} reports to {summary['output_dir']} "
+            f"({summary['reports_per_minute']:.1f} reports/min)"
+        )
+        raise SystemExit(0)
+
+    from reporting.llm_report_generator import generate_llm_underwriting_report
+    from reporting.report_cache import get_report_cache
 
     print("\nPipeline complete. You can now generate an LLM underwriting report for any merchant.\n")
 
@@ -216,6 +339,11 @@ if __name__ == "__main__":
         merchant_id_to_report = input("Enter Merchant ID (or 'exit' to quit): ").strip()
         
         if merchant_id_to_report.lower() == "exit":
+            stats = get_report_cache().stats()
+            print(
+                f"Report cache: {stats['lookups']} lookups, hit rate {stats['hit_rate']:.0%} "
+                f"({stats['memory_hits']} memory, {stats['disk_hits']} disk)"
+            )
             print("Exiting LLM report generator.")
             break
         
@@ -245,9 +373,8 @@ if __name__ == "__main__":
 
 
     # Usage
-    portfolio_metrics = compute_portfolio_metrics(df)
     print("\n--- Portfolio-level Risk Metrics ---")
-    for k, v in portfolio_metrics.items():
+    for k, v in result["portfolio_metrics"].items():
         print(f"{k}: {v}")
 
 
@@ -0,0 +1,232 @@
+from collections import OrderedDict
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+import threading
+import time
+
+import pandas as pd
+
+from features.feature_pipeline import build_external_features
+from ingestion.async_risk_client import fetch_internal_risk_frame
+from ingestion.simulated_api_client import BASE_URL
+from ingestion.country_cache import CountryMetadataCache, enrich_with_country_cache, get_country_cache
+from model.explain import explain_risk, merchant_drivers
+from model.predict import predict_risk
+from model.registry import MODEL_PATH, get_model
+
+app = FastAPI(title="Merchant Risk Scoring API")
+
+
+# -----------------------------
+# Pydantic Models
+# -----------------------------
+
+class MerchantScoreRequest(BaseModel):
+    merchant_id: str
+    country: str
+    monthly_volume: float = Field(..., ge=0)
+    dispute_count: int = Field(..., ge=0)
+    transaction_count: int = Field(..., gt=0)
+
+    # Internal API fields; fetched (and cached) when not supplied
+    internal_risk_flag: Optional[str] = None
+    last_30d_volume: Optional[float] = Field(None, ge=0)
+    last_30d_txn_count: Optional[int] = Field(None, ge=0)
+    avg_ticket_size: Optional[float] = Field(None, ge=0)
+
+
+class RiskDriver(BaseModel):
+    feature: str
+    contribution: float
+
+
+class MerchantScoreResponse(BaseModel):
+    merchant_id: str
+    risk_probability: float
+    predicted_high_risk: int
+    risk_tier: str
+    # This merchant's top risk drivers (log-odds vs the training baseline)
+    top_drivers: List[RiskDriver] = []
+
+
+class BatchScoreRequest(BaseModel):
+    merchants: List[MerchantScoreRequest] = Field(..., min_length=1)
+
+
+class BatchScoreResponse(BaseModel):
+    results: List[MerchantScoreResponse]
+
+
+# -----------------------------
+# In-memory service state
+# -----------------------------
+
+INTERNAL_FIELDS = ["internal_risk_flag", "last_30d_volume", "last_30d_txn_count", "avg_ticket_size"]
+
+_state = {
+    "model_path": MODEL_PATH,
+    "model": None,
+    "internal_api_url": BASE_URL,
+    "country_cache": None,
+    "pdf_text": "",
+    "scrape_data": {},
+}
+
+
+class InternalRiskCache:
+    """
+    Bounded LRU of internal API rows keyed by merchant_id. Entries older
+    than ttl_seconds are refetched, and the least recently used entries
+    are dropped past max_entries, so arbitrary client ids can't grow it.
+    """
+
+    def __init__(self, max_entries: int = 100_000, ttl_seconds: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._rows: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_many(self, merchant_ids: List[str]) -> Dict[str, dict]:
+        now = time.monotonic()
+        found = {}
+
+        with self._lock:
+            for merchant_id in merchant_ids:
+                entry = self._rows.get(merchant_id)
+                if entry is None:
+                    continue
+                if now - entry[0] >= self.ttl_seconds:
+                    del self._rows[merchant_id]
+                    continue
+                self._rows.move_to_end(merchant_id)
+                found[merchant_id] = entry[1]
+
+        return found
+
+    def put_many(self, rows: List[dict]) -> None:
+        now = time.monotonic()
+
+        with self._lock:
+            for row in rows:
+                self._rows[row["merchant_id"]] = (now, row)
+                self._rows.move_to_end(row["merchant_id"])
+            while len(self._rows) > self.max_entries:
+                self._rows.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rows.clear()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+_internal_cache = InternalRiskCache()
+
+
+def configure_service(
+    model=None,
+    model_path: str = MODEL_PATH,
+    country_cache: Optional[CountryMetadataCache] = None,
+    internal_api_url: str = BASE_URL,
+    pdf_text: str = "",
+    scrape_data: Optional[dict] = None,
+) -> None:
+    """
+    Sets what the service scores with. By default the model comes from
+    the process-wide registry (reloaded only when the artifact changes)
+    and country metadata from the shared country cache.
+    """
+
+    _state.update(
+        model=model,
+        model_path=model_path,
+        country_cache=country_cache,
+        internal_api_url=internal_api_url,
+        pdf_text=pdf_text,
+        scrape_data=scrape_data or {},
+    )
+    _internal_cache.clear()
+
+
+def _internal_risk_rows(merchant_ids: List[str]) -> pd.DataFrame:
+    rows = _internal_cache.get_many(merchant_ids)
+
+    missing = [m for m in merchant_ids if m not in rows]
+    if missing:
+        fetched = fetch_internal_risk_frame(
+            missing, base_url=_state["internal_api_url"], batch_size=1000
+        ).to_dict("records")
+        _internal_cache.put_many(fetched)
+        rows.update((row["merchant_id"], row) for row in fetched)
+
+    return pd.DataFrame([rows[m] for m in merchant_ids])
+
+
+def score_merchants(merchants: List[MerchantScoreRequest]) -> pd.DataFrame:
+    """
+    Runs the same enrichment, feature and predict_risk logic as the
+    batch pipeline over the request rows.
+    """
+
+    df = pd.DataFrame([m.model_dump() for m in merchants])
+
+    if df["merchant_id"].duplicated().any():
+        raise HTTPException(status_code=400, detail="Duplicate merchant_id in request")
+
+    # Only merchants without caller-supplied internal fields hit the API
+    needs_api = df[INTERNAL_FIELDS].isnull().any(axis=1)
+    if needs_api.any():
+        api_df = _internal_risk_rows(df.loc[needs_api, "merchant_id"].tolist())
+        api_df = api_df.set_index("merchant_id")
+
+        for field in INTERNAL_FIELDS:
+            df[field] = df[field].fillna(df["merchant_id"].map(api_df[field]))
+
+    df = enrich_with_country_cache(df, _state["country_cache"] or get_country_cache())
+    df = build_external_features(df, _state["pdf_text"], _state["scrape_data"])
+
+    model = _state["model"] or get_model(_state["model_path"])
+
+    df = predict_risk(df, model=model)
+
+    return explain_risk(df, model=model)
+
+
+RESPONSE_FIELDS = ["merchant_id", "risk_probability", "predicted_high_risk", "risk_tier"]
+
+
+def _responses(df: pd.DataFrame) -> List[MerchantScoreResponse]:
+    driver_columns = [c for c in df.columns if c.startswith("driver_")]
+
+    return [
+        MerchantScoreResponse(
+            **{field: row[field] for field in RESPONSE_FIELDS},
+            top_drivers=[RiskDriver(feature=f, contribution=v) for f, v in merchant_drivers(row)],
+        )
+        for row in df[RESPONSE_FIELDS + driver_columns].to_dict("records")
+    ]
+
+
+# -----------------------------
+# Endpoints
+# -----------------------------
+
+@app.post("/score", response_model=MerchantScoreResponse)
+def score_merchant(request: MerchantScoreRequest):
+
+    if not request.merchant_id.startswith("M"):
+        raise HTTPException(status_code=400, detail="Invalid merchant_id")
+
+    return _responses(score_merchants([request]))[0]
+
+
+@app.post("/score/batch", response_model=BatchScoreResponse)
+def score_merchant_batch(request: BatchScoreRequest):
+
+    invalid_ids = [m.merchant_id for m in request.merchants if not m.merchant_id.startswith("M")]
+    if invalid_ids:
+        raise HTTPException(status_code=400, detail=f"Invalid merchant_id values: {invalid_ids[:10]}")
+
+    return BatchScoreResponse(results=_responses(score_merchants(request.merchants)))
@@ -1,6 +1,7 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import date
 import random
 
@@ -24,31 +25,76 @@ class MerchantRiskResponse(BaseModel):
     last_review_date: Optional[date]
 
 
+class MerchantRiskBatchRequest(BaseModel):
+    merchant_ids: List[str] = Field(..., min_length=1)
+
+
 # -----------------------------
 # Mock Logic
 # -----------------------------
 
 VALID_RISK_FLAGS = ["low", "medium", "high"]
+MAX_BATCH_SIZE = 50_000
+STREAM_BLOCK_SIZE = 500
 
 
-@app.get("/risk/{merchant_id}", response_model=MerchantRiskResponse)
-def get_merchant_risk(merchant_id: str):
-
-    if not merchant_id.startswith("M"):
-        raise HTTPException(status_code=400, detail="Invalid merchant_id")
+def _simulate_merchant_risk(merchant_id: str) -> dict:
 
     # Simulated random data
     last_30d_volume = round(random.uniform(10000, 200000), 2)
     last_30d_txn_count = random.randint(100, 5000)
     avg_ticket_size = round(last_30d_volume / last_30d_txn_count, 2)
 
-    return MerchantRiskResponse(
-        merchant_id=merchant_id,
-        internal_risk_flag=random.choice(VALID_RISK_FLAGS),
-        transaction_summary={
+    return {
+        "merchant_id": merchant_id,
+        "internal_risk_flag": random.choice(VALID_RISK_FLAGS),
+        "transaction_summary": {
             "last_30d_volume": last_30d_volume,
             "last_30d_txn_count": last_30d_txn_count,
             "avg_ticket_size": avg_ticket_size,
         },
-        last_review_date=date.today(),
-    )
\ No newline at end of file
+        "last_review_date": date.today().isoformat(),
+    }
+
+
+@app.get("/risk/{merchant_id}", response_model=MerchantRiskResponse)
+def get_merchant_risk(merchant_id: str):
+
+    if not merchant_id.startswith("M"):
+        raise HTTPException(status_code=400, detail="Invalid merchant_id")
+
+    return MerchantRiskResponse(**_simulate_merchant_risk(merchant_id))
+
+
+@app.post("/risk/batch")
+def get_merchant_risk_batch(request: MerchantRiskBatchRequest):
+    """
+    Returns one MerchantRiskResponse payload per merchant as NDJSON,
+    in request order. Payloads are generated, validated against the
+    same model as the single-merchant endpoint and serialized lazily
+    while the response streams, so large batches never sit in memory.
+    """
+
+    if len(request.merchant_ids) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch size exceeds {MAX_BATCH_SIZE} merchants",
+        )
+
+    invalid_ids = [m for m in request.merchant_ids if not m.startswith("M")]
+    if invalid_ids:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid merchant_id values: {invalid_ids[:10]}",
+        )
+
+    def generate():
+        # Write lines in blocks; one socket write per payload dominates otherwise
+        ids = request.merchant_ids
+        for start in range(0, len(ids), STREAM_BLOCK_SIZE):
+            yield "".join(
+                MerchantRiskResponse(**_simulate_merchant_risk(merchant_id)).model_dump_json() + "\n"
+                for merchant_id in ids[start:start + STREAM_BLOCK_SIZE]
+            )
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
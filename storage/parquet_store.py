@@ -0,0 +1,184 @@
+import os
+import shutil
+import uuid
+from typing import List, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+DEFAULT_ROOT = "data/warehouse"
+
+FEATURE_TABLE = "features"
+SCORED_TABLE = "scored"
+
+# Low-cardinality text columns stored dictionary-encoded
+DICTIONARY_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+CATEGORICAL_COLUMNS = [
+    "country",
+    "region",
+    "subregion",
+    "internal_risk_flag",
+    "risk_tier",
+]
+
+SCORED_COLUMNS = {
+    "merchant_id": "string",
+    "country": "category",
+    "region": "category",
+    "monthly_volume": "float64",
+    "risk_score": "float64",
+    "risk_probability": "float64",
+    "predicted_high_risk": "int8",
+    "risk_tier": "category",
+    # Per-merchant drivers from model.explain.explain_risk
+    "driver_1": "category",
+    "driver_1_contribution": "float64",
+    "driver_2": "category",
+    "driver_2_contribution": "float64",
+    "driver_3": "category",
+    "driver_3_contribution": "float64",
+}
+
+
+def _table_path(root: str, table: str) -> str:
+    return os.path.join(root, table)
+
+
+def _to_arrow(df: pd.DataFrame) -> pa.Table:
+    # One fixed dictionary type for every write: pandas picks int8 or int16
+    # codes per frame, and appended files with different widths can't be read back together
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    for name in CATEGORICAL_COLUMNS + [c for c, dtype in SCORED_COLUMNS.items() if dtype == "category"]:
+        i = table.schema.get_field_index(name)
+        if i >= 0 and table.schema.field(i).type != DICTIONARY_TYPE:
+            column = table.column(i).cast(pa.string()).dictionary_encode()
+            table = table.set_column(i, pa.field(name, DICTIONARY_TYPE), column)
+
+    return table
+
+
+def write_table(
+    df: pd.DataFrame,
+    table: str,
+    root: str = DEFAULT_ROOT,
+    partition_cols: Sequence[str] = (),
+    mode: str = "overwrite",
+) -> str:
+    """
+    Writes df as a (optionally hive-partitioned) Parquet dataset under
+    root/table. mode="overwrite" replaces the table; mode="append" adds
+    new files next to existing ones (e.g. one write per streamed chunk).
+    """
+
+    if mode not in ("overwrite", "append"):
+        raise ValueError(f"Unknown write mode: {mode}")
+
+    path = _table_path(root, table)
+    arrow_table = _to_arrow(df)
+
+    # Overwrites are built next to the table and swapped in, so a crash
+    # mid-write leaves the previous table intact
+    target = f"{path}.tmp-{uuid.uuid4().hex}" if mode == "overwrite" else path
+    os.makedirs(target, exist_ok=True)
+
+    try:
+        pq.write_to_dataset(
+            arrow_table,
+            root_path=target,
+            partition_cols=list(partition_cols) or None,
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+    except Exception:
+        if target != path:
+            shutil.rmtree(target, ignore_errors=True)
+        raise
+
+    if target != path:
+        previous = f"{path}.old-{uuid.uuid4().hex}"
+        if os.path.exists(path):
+            os.replace(path, previous)
+        os.replace(target, path)
+        shutil.rmtree(previous, ignore_errors=True)
+
+    return path
+
+
+def read_table(
+    table: str,
+    root: str = DEFAULT_ROOT,
+    columns: Optional[List[str]] = None,
+    filters=None,
+) -> pd.DataFrame:
+    """
+    Reads root/table with column projection and predicate pushdown.
+
+    filters uses the pyarrow list-of-tuples form, e.g.
+    [("risk_tier", "==", "High"), ("country", "in", ["Kenya", "Brazil"])].
+    Filters on partition columns skip whole directories; others are
+    applied per row group using Parquet statistics.
+    """
+
+    path = _table_path(root, table)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No Parquet table at {path}")
+
+    return pq.read_table(path, columns=columns, filters=filters).to_pandas()
+
+
+# -----------------------------
+# Pipeline tables
+# -----------------------------
+
+def write_feature_table(df: pd.DataFrame, root: str = DEFAULT_ROOT, mode: str = "overwrite") -> str:
+    """
+    Persists the enriched feature frame, partitioned by country.
+    """
+
+    return write_table(df, FEATURE_TABLE, root, partition_cols=["country"], mode=mode)
+
+
+def write_scored_merchants(df: pd.DataFrame, root: str = DEFAULT_ROOT, mode: str = "overwrite") -> str:
+    """
+    Persists scored merchants with typed columns, partitioned by risk tier.
+    """
+
+    columns = [c for c in SCORED_COLUMNS if c in df.columns]
+    scored = df[columns].astype({c: SCORED_COLUMNS[c] for c in columns})
+
+    return write_table(scored, SCORED_TABLE, root, partition_cols=["risk_tier"], mode=mode)
+
+
+def read_scored_merchants(
+    root: str = DEFAULT_ROOT,
+    tiers: Optional[List[str]] = None,
+    countries: Optional[List[str]] = None,
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    Reads a slice of the scored portfolio, e.g. tiers=["High"] or
+    countries=["Kenya"], without loading the rest.
+    """
+
+    filters = []
+    if tiers:
+        filters.append(("risk_tier", "in", list(tiers)))
+    if countries:
+        filters.append(("country", "in", list(countries)))
+
+    return read_table(SCORED_TABLE, root, columns=columns, filters=filters or None)
+
+
+def read_feature_table(
+    root: str = DEFAULT_ROOT,
+    countries: Optional[List[str]] = None,
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+
+    filters = [("country", "in", list(countries))] if countries else None
+
+    return read_table(FEATURE_TABLE, root, columns=columns, filters=filters)
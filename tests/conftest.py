@@ -0,0 +1,249 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Report tests run offline against the deterministic backend unless a
+# real model is requested explicitly, and never touch data/cache
+os.environ.setdefault("LLM_REPORT_BACKEND", "template")
+os.environ.setdefault("LLM_REPORT_CACHE_DIR", tempfile.mkdtemp(prefix="report-cache-"))
+
+
+# -----------------------------
+# Synthetic inputs shared by tests
+# -----------------------------
+
+COUNTRIES = {
+    "United States": ("Americas", "North America"),
+    "Brazil": ("Americas", "South America"),
+    "Kenya": ("Africa", "Eastern Africa"),
+    "Germany": ("Europe", "Western Europe"),
+    "India": ("Asia", "Southern Asia"),
+}
+
+
+def _make_feature_frame(n, seed=0):
+    # Enriched modelling frame, as produced by build_feature_frame
+    from features.feature_pipeline import build_feature_frame
+
+    rng = np.random.default_rng(seed)
+    ids = [f"M{i:06d}" for i in range(n)]
+    transaction_count = rng.integers(50, 20000, n)
+
+    merchants = pd.DataFrame({
+        "merchant_id": ids,
+        "name": [f"Merchant {i}" for i in range(n)],
+        "country": np.array(list(COUNTRIES), dtype=object)[rng.integers(0, len(COUNTRIES), n)],
+        "registration_number": [f"REG{i:06d}" for i in range(n)],
+        "monthly_volume": rng.uniform(1_000, 500_000, n).round(2),
+        "dispute_count": rng.binomial(transaction_count, 0.003),
+        "transaction_count": transaction_count,
+    })
+
+    volume = rng.uniform(10000, 200000, n).round(2)
+    txn_count = rng.integers(100, 5000, n)
+    internal = pd.DataFrame({
+        "merchant_id": ids,
+        "internal_risk_flag": np.array(["low", "medium", "high"], dtype=object)[rng.integers(0, 3, n)],
+        "last_30d_volume": volume,
+        "last_30d_txn_count": txn_count,
+        "avg_ticket_size": (volume / txn_count).round(2),
+    })
+
+    countries = pd.DataFrame(
+        [(c, r, s) for c, (r, s) in COUNTRIES.items()], columns=["country", "region", "subregion"]
+    )
+    scrape_data = {"value_propositions": ["Pay over time"], "public_stats": ["$1B+ processed"], "partners": []}
+
+    return build_feature_frame(merchants, internal, countries, "Refunds rose; one chargeback pending.", scrape_data)
+
+
+def _make_merchants(n=50, seed=0, merchant_ids=None):
+    # Raw merchants CSV rows that pass schema validation
+    ids = [f"M{i:03d}" for i in range(n)] if merchant_ids is None else list(merchant_ids)
+    n = len(ids)
+
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "merchant_id": ids,
+        "name": "Shop",
+        "country": rng.choice(["Kenya", "Germany"], n),
+        "registration_number": "R1",
+        "monthly_volume": rng.uniform(1000, 9000, n).round(2),
+        "dispute_count": rng.integers(0, 30, n),
+        "transaction_count": rng.integers(100, 1000, n),
+    })
+
+
+def _write_merchants(path, n=50, seed=0, merchant_ids=None):
+    _make_merchants(n, seed, merchant_ids).to_csv(path, index=False)
+
+
+class _FakeInternalApi:
+    """
+    Stands in for fetch_internal_risk_frame: one payload per requested
+    merchant_id, with every call recorded.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    @property
+    def requested(self):
+        return [merchant_id for call in self.calls for merchant_id in call]
+
+    def __call__(self, merchant_ids, base_url=None, batch_size=None):
+        self.calls.append(list(merchant_ids))
+        n = len(merchant_ids)
+        return pd.DataFrame({
+            "merchant_id": list(merchant_ids),
+            "internal_risk_flag": "medium",
+            "last_30d_volume": np.full(n, 5000.0),
+            "last_30d_txn_count": np.full(n, 100),
+            "avg_ticket_size": np.full(n, 50.0),
+            "last_review_date": "2026-01-01",
+        })
+
+
+def _make_risk_model(n=300, seed=0):
+    # LogisticRegression on uniform [0, 1) MODEL_FEATURES (mean 0.5 each)
+    from sklearn.linear_model import LogisticRegression
+
+    from features.registry import MODEL_FEATURES
+
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(rng.random((n, len(MODEL_FEATURES))), columns=MODEL_FEATURES)
+    y = (X["dispute_rate"] + X["internal_flag_numeric"] + rng.normal(scale=0.2, size=n) > 1).astype(int)
+    return LogisticRegression().fit(X, y)
+
+
+def _write_text_pdf(path, pages):
+    # Minimal valid PDF with one text page per entry, enough for pdfplumber
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+
+    for text in pages:
+        lines = [line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") for line in text.split("\n")]
+        ops = "BT /F1 10 Tf 14 TL 40 800 Td " + " ".join(f"({line}) Tj T*" for line in lines) + " ET"
+        stream = ops.encode("latin-1", "replace")
+
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (len(objects))
+        )
+        page_ids.append(len(objects))
+
+    kids = " ".join(f"{i} 0 R" for i in page_ids).encode()
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+
+    with open(path, "wb") as f:
+        f.write(bytes(out))
+
+
+@pytest.fixture(scope="session")
+def make_feature_frame():
+    return _make_feature_frame
+
+
+@pytest.fixture(scope="session")
+def write_text_pdf():
+    return _write_text_pdf
+
+
+def _make_scored(n=20_000, seed=0):
+    # Scored portfolio as the score stage leaves it; some countries are missing
+    from features.feature_pipeline import assign_risk_tier
+
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "merchant_id": [f"M{i:03d}" for i in range(n)],
+        "country": rng.choice(["Kenya", "Brazil", "Germany", None], n),
+        "region": rng.choice(["Africa", "South America", "Europe"], n),
+        "risk_probability": rng.beta(2, 5, n),
+        "monthly_volume": rng.uniform(100, 1e5, n),
+        "transaction_count": rng.integers(1, 5000, n),
+        "dispute_count": rng.integers(0, 50, n),
+    })
+    df["risk_tier"] = assign_risk_tier(df["risk_probability"])
+    df["predicted_high_risk"] = (df["risk_probability"] > 0.25).astype(int)
+    return df
+
+
+def _make_model_inputs(n=600, seed=5):
+    # Raw columns the feature registry turns into MODEL_FEATURES and the target
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "merchant_id": [f"M{i}" for i in range(n)],
+        "monthly_volume": rng.uniform(1000, 50000, n),
+        "transaction_count": rng.integers(100, 5000, n),
+        "dispute_count": rng.integers(0, 20, n),
+        "avg_ticket_size": rng.uniform(5, 200, n),
+        "last_30d_volume": rng.uniform(10000, 200000, n),
+        "last_30d_txn_count": rng.integers(100, 5000, n),
+        "internal_flag_numeric": rng.integers(0, 3, n),
+        "is_high_risk_region": rng.integers(0, 2, n),
+        "pdf_mentions_refunds": 0,
+        "pdf_mentions_chargeback": 0,
+        "pdf_mentions_complaint": 0,
+        "num_value_props": 3,
+        "num_public_stats": 1,
+        "num_partners": 0,
+    })
+
+
+def _make_classification(n=500, seed=0, features=("a", "b", "c")):
+    # Standard normal features with a noisy linear target on the first three
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(rng.normal(size=(n, len(features))), columns=list(features))
+    weights = np.r_[[1.0, -1.0, 0.5], np.zeros(max(0, len(features) - 3))][:len(features)]
+    y = (X.to_numpy() @ weights + rng.normal(scale=0.3, size=n) > 0).astype(int)
+    return X, pd.Series(y)
+
+
+@pytest.fixture(scope="session")
+def make_scored():
+    return _make_scored
+
+
+@pytest.fixture(scope="session")
+def make_model_inputs():
+    return _make_model_inputs
+
+
+@pytest.fixture(scope="session")
+def make_classification():
+    return _make_classification
+
+
+@pytest.fixture(scope="session")
+def make_merchants():
+    return _make_merchants
+
+
+@pytest.fixture(scope="session")
+def write_merchants():
+    return _write_merchants
+
+
+@pytest.fixture(scope="session")
+def make_internal_api():
+    return _FakeInternalApi
+
+
+@pytest.fixture(scope="session")
+def make_risk_model():
+    return _make_risk_model
@@ -0,0 +1,114 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.linear_model import LogisticRegression
+
+from model.artifact_store import ModelStore
+from model.predict import predict_risk
+from model.registry import clear_model_cache, get_model
+
+
+@pytest.fixture
+def store(tmp_path):
+    clear_model_cache()
+    yield ModelStore(str(tmp_path / "models"))
+    clear_model_cache()
+
+
+def test_versions_are_content_addressed_with_metadata(store, make_classification):
+    X, y = make_classification()
+    model = LogisticRegression().fit(X, y)
+
+    version = store.publish(model, list(X.columns), metrics={"roc_auc": np.float64(0.9)}, training_seconds=1.5)
+
+    assert store.publish(model, list(X.columns), metrics={"roc_auc": 0.9}, training_seconds=9.0) == version
+    assert len(store.versions()) == 1
+    assert store.current() == version
+
+    metadata = store.metadata()
+    assert metadata["format"] == "linear"
+    assert metadata["features"] == ["a", "b", "c"]
+    assert metadata["threshold"] == 0.25
+    assert metadata["tier_cutoffs"] == {"high": 0.7, "medium": 0.3}
+    assert metadata["metrics"] == {"roc_auc": 0.9}
+    assert metadata["training_seconds"] == 1.5
+
+    # A different threshold scores differently, so it is a different version
+    assert store.publish(model, list(X.columns), threshold=0.5, activate=False) != version
+    assert store.current() == version
+
+
+def test_new_baseline_or_metrics_with_the_same_weights_is_a_new_version(store, make_classification):
+    from model.explain import explain_risk
+
+    X, y = make_classification()
+    model = LogisticRegression().fit(X, y)
+    features = list(X.columns)
+
+    first = store.publish(model, features, metrics={"roc_auc": 0.8}, baseline=[0.0, 0.0, 0.0])
+    retrained = store.publish(model, features, metrics={"roc_auc": 0.85}, baseline=[0.0, 0.0, 0.0])
+    rebased = store.publish(model, features, metrics={"roc_auc": 0.85}, baseline=X.mean())
+
+    assert len({first, retrained, rebased}) == 3
+    assert store.metadata(retrained)["metrics"] == {"roc_auc": 0.85}
+
+    # Explanations use the baseline published with the current version
+    df = explain_risk(X.copy(), model=store.load(), k=3)
+    expected = explain_risk(X.copy(), model=model, k=3, baseline=X.mean().to_numpy())
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_linear_weights_load_memory_mapped_and_score_like_sklearn(store, make_classification):
+    X, y = make_classification()
+    model = LogisticRegression().fit(X, y)
+    store.publish(model, list(X.columns))
+
+    artifact = store.load()
+
+    # The weights are a view of the mapped file, not a copy
+    base = artifact["scorer"].coef
+    while base.base is not None and not isinstance(base, np.memmap):
+        base = base.base
+    assert isinstance(base, np.memmap)
+
+    scored = predict_risk(X.copy(), model=artifact)
+    np.testing.assert_allclose(scored["risk_probability"], model.predict_proba(X)[:, 1], rtol=1e-12)
+
+
+def test_non_linear_models_are_stored_as_estimators(store, make_classification):
+    X, y = make_classification()
+    model = HistGradientBoostingClassifier(max_iter=10).fit(X, y)
+    store.publish(model, list(X.columns))
+
+    artifact = store.load()
+
+    assert artifact["metadata"]["format"] == "estimator"
+    np.testing.assert_allclose(
+        predict_risk(X.copy(), model=artifact)["risk_probability"], model.predict_proba(X)[:, 1]
+    )
+
+
+def test_switching_current_hot_swaps_the_registry_model(store, make_classification):
+    X, y = make_classification()
+    first = store.publish(LogisticRegression().fit(X, y), list(X.columns))
+    assert get_model(store.root)["version"] == first
+
+    second = store.publish(LogisticRegression().fit(X, 1 - y), list(X.columns), tier_cutoffs={"high": 0.9, "medium": 0.8})
+    artifact = get_model(store.root)
+    assert artifact["version"] == second
+    assert artifact is get_model(store.root)
+
+    scored = predict_risk(X.copy(), model_path=store.root)
+    assert set(scored.loc[scored["risk_probability"] <= 0.8, "risk_tier"]) <= {"Low"}
+
+    store.activate(first)
+    assert get_model(store.root)["version"] == first
+    assert not [name for name in os.listdir(store.root) if name.endswith(".tmp")]
+
+
+def test_activating_an_unknown_version_fails(store, make_classification):
+    with pytest.raises(ValueError):
+        store.activate("missing")
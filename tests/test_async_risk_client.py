@@ -0,0 +1,115 @@
+import asyncio
+import json
+import socket
+import threading
+
+import pytest
+from aiohttp import web
+
+from ingestion.async_risk_client import fetch_internal_risk_frame, fetch_internal_risk_frame_async
+
+
+def payload(merchant_id):
+    number = int(merchant_id[1:])
+    return {
+        "merchant_id": merchant_id,
+        "internal_risk_flag": ["low", "medium", "high"][number % 3],
+        "transaction_summary": {
+            "last_30d_volume": 1000.0 * number,
+            "last_30d_txn_count": number,
+            "avg_ticket_size": 1000.0,
+        },
+        "last_review_date": "2026-01-01",
+    }
+
+
+class FakeRiskApi:
+    """
+    Internal risk API on a background event loop. The first `failures`
+    requests answer 503; with `swap` set, batches answer the first and
+    last merchant in swapped positions.
+    """
+
+    def __init__(self, failures=0, swap=False):
+        self.failures = failures
+        self.swap = swap
+        self.requests = 0
+
+    async def _single(self, request):
+        self.requests += 1
+        if self.requests <= self.failures:
+            return web.Response(status=503)
+        # Small, varying delays so concurrent responses finish out of order
+        merchant_id = request.match_info["merchant_id"]
+        await asyncio.sleep(0.001 * (int(merchant_id[1:]) % 5))
+        return web.json_response(payload(merchant_id))
+
+    async def _batch(self, request):
+        self.requests += 1
+        if self.requests <= self.failures:
+            return web.Response(status=503)
+
+        ids = (await request.json())["merchant_ids"]
+        rows = [payload(m) for m in ids]
+        if self.swap:
+            rows[0], rows[-1] = rows[-1], rows[0]
+        return web.Response(text="".join(json.dumps(row) + "\n" for row in rows), content_type="application/x-ndjson")
+
+    def __enter__(self):
+        app = web.Application()
+        app.router.add_get("/risk/{merchant_id}", self._single)
+        app.router.add_post("/risk/batch", self._batch)
+
+        self._loop = asyncio.new_event_loop()
+        self._runner = web.AppRunner(app)
+        self._loop.run_until_complete(self._runner.setup())
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        self._loop.run_until_complete(web.SockSite(self._runner, sock).start())
+        port = sock.getsockname()[1]
+
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        return f"http://127.0.0.1:{port}"
+
+    def __exit__(self, *exc):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+IDS = [f"M{i}" for i in range(1, 41)]
+
+
+def test_sync_wrapper_returns_rows_in_request_order():
+    with FakeRiskApi() as url:
+        df = fetch_internal_risk_frame(IDS, base_url=url, concurrency=8)
+
+    assert df["merchant_id"].tolist() == IDS
+    assert df["last_30d_txn_count"].tolist() == list(range(1, 41))
+    assert df["internal_risk_flag"].tolist() == [payload(m)["internal_risk_flag"] for m in IDS]
+
+
+def test_batches_are_retried_and_keep_order():
+    api = FakeRiskApi(failures=2)
+    with api as url:
+        df = asyncio.run(fetch_internal_risk_frame_async(IDS, base_url=url, batch_size=7, backoff=0.001))
+
+    assert df["merchant_id"].tolist() == IDS
+    assert df["last_30d_volume"].tolist() == [1000.0 * i for i in range(1, 41)]
+    # 6 batches plus the two 503s
+    assert api.requests == 8
+
+
+def test_persistent_failures_raise_after_retries():
+    api = FakeRiskApi(failures=100)
+    with api as url, pytest.raises(RuntimeError, match="after 3 attempts"):
+        fetch_internal_risk_frame(IDS[:1], base_url=url, retries=2, backoff=0.001)
+
+    assert api.requests == 3
+
+
+def test_batch_payload_for_another_merchant_is_rejected():
+    with FakeRiskApi(swap=True) as url, pytest.raises(RuntimeError, match="was requested"):
+        fetch_internal_risk_frame(IDS, base_url=url, batch_size=10)
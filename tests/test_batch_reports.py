@@ -0,0 +1,30 @@
+import pandas as pd
+import pytest
+
+from reporting.batch_reports import generate_tier_reports, report_path
+
+
+def echo_generate(prompts, max_new_tokens, batch_size):
+    assert len(prompts) <= batch_size
+    return [f"REPORT {max_new_tokens}\n{prompt}" for prompt in prompts]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_writes_one_report_per_tier_merchant(tmp_path, make_scored, workers):
+    importance = pd.DataFrame({"feature": ["dispute_rate"], "coefficient": [1.5]})
+    df = make_scored(40, seed=3)
+    medium = df.loc[df["risk_tier"] == "Medium", "merchant_id"].tolist()
+
+    summary = generate_tier_reports(
+        df, importance, {"average_risk_probability": 0.4},
+        tier="Medium", batch_size=2, max_new_tokens=64, workers=workers,
+        output_dir=str(tmp_path), generate=echo_generate,
+    )
+
+    assert summary["reports"] == len(medium) > 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(f"{m}_llm_report.txt" for m in medium)
+
+    text = open(report_path(str(tmp_path), medium[1])).read()
+    assert text.startswith("REPORT 64")
+    assert f"Merchant ID: {medium[1]}" in text
+    assert "- dispute_rate: coef=1.5000" in text
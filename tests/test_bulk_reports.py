@@ -0,0 +1,76 @@
+import json
+import tarfile
+
+import pandas as pd
+
+from reporting.bulk_reports import render_portfolio_reports
+from reporting.report_generator import generate_underwriting_report, iter_underwriting_reports
+
+
+def legacy_report(row, feature_importance):
+    report = f"""
+==============================
+MERCHANT RISK ASSESSMENT
+==============================
+
+Merchant ID: {row['merchant_id']}
+Country: {row['country']}
+
+--- Behavioral Model ---
+Risk Probability: {row['risk_probability']:.3f}
+Risk Tier: {row['risk_tier']}
+
+--- Top Risk Drivers ---
+"""
+    for _, feature in feature_importance.head(3).iterrows():
+        report += f"- {feature['feature']} (coef: {feature['coefficient']:.4f})\n"
+    report += f"""
+--- Transaction Metrics ---
+Monthly Volume: {row['monthly_volume']}
+Transaction Count: {row['transaction_count']}
+Dispute Count: {row['dispute_count']}
+
+--- Final Recommendation ---
+"""
+    if row["risk_tier"] == "High":
+        report += "Enhanced due diligence required.\n"
+    elif row["risk_tier"] == "Medium":
+        report += "Manual review recommended.\n"
+    else:
+        report += "Standard onboarding.\n"
+    report += "\n==============================\n"
+    return report
+
+
+IMPORTANCE = pd.DataFrame({
+    "feature": ["dispute_rate", "avg_ticket_size", "monthly_volume", "num_partners"],
+    "coefficient": [2.5, -0.3, 0.01, 0.2],
+})
+
+
+def test_bulk_and_single_rendering_match_legacy_text(make_scored):
+    df = make_scored(50, seed=3)
+    bulk = dict(iter_underwriting_reports(df, IMPORTANCE))
+
+    for _, row in df.iterrows():
+        expected = legacy_report(row, IMPORTANCE)
+        assert generate_underwriting_report(row, IMPORTANCE) == expected
+        assert bulk[row["merchant_id"]] == expected
+
+
+def test_reports_stream_to_each_output_format(tmp_path, make_scored):
+    df = make_scored(50, seed=3)
+    high = set(df.loc[df["risk_tier"] == "High", "merchant_id"])
+
+    files = render_portfolio_reports(df, IMPORTANCE, "files", str(tmp_path / "files"), tier="High")
+    assert files["reports"] == len(high)
+    assert {p.name for p in (tmp_path / "files").iterdir()} == {f"{m}_report.txt" for m in high}
+
+    render_portfolio_reports(df, IMPORTANCE, "jsonl", str(tmp_path / "reports.jsonl"))
+    lines = [json.loads(line) for line in open(tmp_path / "reports.jsonl")]
+    assert [line["merchant_id"] for line in lines] == df["merchant_id"].tolist()
+
+    render_portfolio_reports(df, IMPORTANCE, "tar", str(tmp_path / "reports.tar.gz"))
+    with tarfile.open(tmp_path / "reports.tar.gz") as tar:
+        member = tar.extractfile("M000_report.txt").read().decode()
+    assert member == lines[0]["report"]
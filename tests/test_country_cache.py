@@ -0,0 +1,93 @@
+import pandas as pd
+
+from ingestion.country_cache import CountryMetadataCache, enrich_with_country_cache
+
+
+class CountingFetcher:
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    def __call__(self, country):
+        self.calls.append(country)
+        if self.fail:
+            raise ConnectionError("offline")
+        return {"region": f"{country}-region", "subregion": f"{country}-sub"}
+
+
+def test_enrichment_fetches_each_country_once(tmp_path):
+    fetcher = CountingFetcher()
+    cache = CountryMetadataCache(db_path=str(tmp_path / "c.sqlite"), fetcher=fetcher)
+
+    df = pd.DataFrame({
+        "merchant_id": ["M1", "M2", "M3", "M4"],
+        "country": ["Kenya", "Brazil", "Kenya", "Kenya"],
+    })
+
+    enriched = enrich_with_country_cache(df, cache)
+
+    assert sorted(fetcher.calls) == ["Brazil", "Kenya"]
+    assert enriched["merchant_id"].tolist() == df["merchant_id"].tolist()
+    assert enriched["region"].tolist() == ["Kenya-region", "Brazil-region", "Kenya-region", "Kenya-region"]
+
+
+def test_disk_store_survives_restart_and_serves_stale_when_offline(tmp_path):
+    db_path = str(tmp_path / "c.sqlite")
+
+    CountryMetadataCache(db_path=db_path, fetcher=CountingFetcher()).get("Kenya")
+
+    # Fresh process, entry still within TTL: no network call
+    fetcher = CountingFetcher(fail=True)
+    assert CountryMetadataCache(db_path=db_path, fetcher=fetcher).get("Kenya")["region"] == "Kenya-region"
+    assert fetcher.calls == []
+
+    # Expired entry and the API is down: the stale value is served
+    expired = CountryMetadataCache(db_path=db_path, ttl_seconds=0, fetcher=fetcher)
+    assert expired.get("Kenya")["region"] == "Kenya-region"
+    assert expired.get("Atlantis")["region"] == "Unknown"
+    assert fetcher.calls == ["Kenya", "Atlantis"]
+
+
+def test_failed_lookups_are_retried_and_memory_entries_expire(tmp_path):
+    fetcher = CountingFetcher(fail=True)
+    cache = CountryMetadataCache(db_path=str(tmp_path / "c.sqlite"), fetcher=fetcher)
+
+    assert cache.get("Kenya")["region"] == "Unknown"
+
+    # The API recovers: the fallback was not pinned in memory
+    fetcher.fail = False
+    assert cache.get("Kenya")["region"] == "Kenya-region"
+    assert fetcher.calls == ["Kenya", "Kenya"]
+
+    cache.get("Kenya")
+    assert fetcher.calls == ["Kenya", "Kenya"]
+
+    # With the TTL elapsed the in-process entry is refreshed too
+    cache.ttl_seconds = 0
+    cache.get("Kenya")
+    assert fetcher.calls == ["Kenya", "Kenya", "Kenya"]
+
+
+def test_cached_lookups_do_not_wait_for_a_slow_fetch(tmp_path):
+    import threading
+
+    started, release = threading.Event(), threading.Event()
+
+    def slow_fetcher(country):
+        if country == "Atlantis":
+            started.set()
+            release.wait(5)
+        return {"region": f"{country}-region", "subregion": f"{country}-sub"}
+
+    cache = CountryMetadataCache(db_path=str(tmp_path / "c.sqlite"), fetcher=slow_fetcher)
+    cache.get("Kenya")
+
+    slow = threading.Thread(target=cache.get, args=("Atlantis",))
+    slow.start()
+    assert started.wait(5)
+
+    # Served while the Atlantis fetch is still blocked
+    assert cache.get("Kenya")["region"] == "Kenya-region"
+
+    release.set()
+    slow.join()
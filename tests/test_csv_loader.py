@@ -0,0 +1,65 @@
+import pandas as pd
+import pytest
+
+from ingestion.csv_loader import iter_merchants_csv
+
+
+def test_streaming_reads_all_rows_in_chunks(tmp_path, write_merchants):
+    path = tmp_path / "merchants.csv"
+    write_merchants(path, merchant_ids=[f"M{i}" for i in range(25)])
+
+    chunks = list(iter_merchants_csv(path, chunksize=10))
+
+    assert [len(c) for c in chunks] == [10, 10, 5]
+    assert chunks[0]["transaction_count"].dtype == "int64"
+
+
+def test_streaming_detects_duplicates_across_chunks(tmp_path, write_merchants):
+    path = tmp_path / "merchants.csv"
+    write_merchants(path, merchant_ids=[f"M{i}" for i in range(15)] + ["M3"])
+
+    with pytest.raises(ValueError, match="across chunks"):
+        list(iter_merchants_csv(path, chunksize=10))
+
+
+def test_quarantine_keeps_valid_rows_and_writes_rejects(tmp_path, make_merchants):
+    path = tmp_path / "merchants.csv"
+    quarantine = tmp_path / "rejected.csv"
+    merchants = make_merchants(merchant_ids=[f"M{i}" for i in range(15)] + ["M3", "X1"])
+
+    # A non-numeric volume would fail the typed read without quarantine
+    merchants["monthly_volume"] = merchants["monthly_volume"].astype(object)
+    merchants.loc[1, "monthly_volume"] = "abc"
+    merchants.to_csv(path, index=False)
+
+    chunks = list(iter_merchants_csv(path, chunksize=10, quarantine_path=str(quarantine)))
+    rejected = pd.read_csv(quarantine)
+
+    assert sum(len(c) for c in chunks) == 14
+    assert chunks[0]["monthly_volume"].dtype == "float64"
+    assert chunks[0]["transaction_count"].dtype == "int64"
+    assert sorted(rejected["merchant_id"]) == ["M1", "M3", "X1"]
+    assert set(rejected["validation_errors"]) == {"monthly_volume_numeric", "merchant_id_unique", "merchant_id_prefix"}
+
+
+def test_cross_chunk_duplicates_are_found_in_every_earlier_chunk(tmp_path, write_merchants):
+    path = tmp_path / "merchants.csv"
+    ids = [f"M{i}" for i in range(100)]
+    write_merchants(path, merchant_ids=ids + ["M0", "M57", "M99"])
+
+    quarantine = tmp_path / "rejected.csv"
+    chunks = list(iter_merchants_csv(path, chunksize=7, quarantine_path=str(quarantine)))
+
+    assert sum(len(c) for c in chunks) == 100
+    assert sorted(pd.read_csv(quarantine)["merchant_id"]) == ["M0", "M57", "M99"]
+
+
+def test_fully_quarantined_chunk_does_not_break_later_chunks(tmp_path, write_merchants):
+    path = tmp_path / "merchants.csv"
+    write_merchants(path, merchant_ids=["X1", "X2", "X3", "M1", "M2", "M3", "M1"])
+
+    quarantine = tmp_path / "rejected.csv"
+    chunks = list(iter_merchants_csv(path, chunksize=3, quarantine_path=str(quarantine)))
+
+    assert sorted(pd.concat(chunks)["merchant_id"]) == ["M1", "M2", "M3"]
+    assert sorted(pd.read_csv(quarantine)["merchant_id"]) == ["M1", "X1", "X2", "X3"]
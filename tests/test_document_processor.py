@@ -0,0 +1,101 @@
+import asyncio
+
+import pandas as pd
+import pytest
+
+import ingestion.document_processor as document_processor
+from ingestion.document_processor import (
+    DocumentTextCache,
+    extract_documents,
+    iter_pdf_pages,
+    merchant_document_text,
+)
+from ingestion.pdf_processor import extract_pdf_text_async
+
+
+def test_pages_are_streamed_in_order(tmp_path, write_text_pdf):
+    path = tmp_path / "M1_summary.pdf"
+    write_text_pdf(path, ["first page refund", "second page fraud"])
+
+    pages = iter_pdf_pages(str(path))
+
+    assert next(pages) == "first page refund"
+    assert list(pages) == ["second page fraud"]
+
+
+def test_documents_map_to_merchants_and_hit_cache(tmp_path, monkeypatch, write_text_pdf):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    write_text_pdf(docs / "M1_q1.pdf", ["chargeback spike"])
+    write_text_pdf(docs / "M1_q2.pdf", ["clean quarter"])
+    write_text_pdf(docs / "M2_summary.pdf", ["refund policy"])
+    write_text_pdf(docs / "M3Report.pdf", ["no separator"])
+    write_text_pdf(docs / "notes.pdf", ["no merchant"])
+
+    cache = DocumentTextCache(str(tmp_path / "cache"))
+    first = extract_documents(str(docs), max_workers=2, cache=cache)
+
+    assert first["merchant_id"].tolist() == ["M1", "M1", "M2"]
+    assert first["text"].tolist() == ["chargeback spike", "clean quarter", "refund policy"]
+
+    per_merchant = merchant_document_text(first).set_index("merchant_id")["text"]
+    assert per_merchant["M1"] == "chargeback spike\nclean quarter"
+
+    # Unchanged files must come from the cache without starting a pool
+    def no_pool(*args, **kwargs):
+        raise AssertionError("cached documents were re-parsed")
+
+    monkeypatch.setattr(document_processor, "ProcessPoolExecutor", no_pool)
+    second = extract_documents(str(docs), cache=cache)
+
+    assert second.equals(first)
+
+
+def test_async_extraction_does_not_block_event_loop(tmp_path, write_text_pdf):
+    path = tmp_path / "M1.pdf"
+    write_text_pdf(path, ["hello"])
+
+    async def run():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        text = await extract_pdf_text_async(str(path))
+        task.cancel()
+        return text, ticks
+
+    text, ticks = asyncio.run(run())
+
+    assert text == "hello"
+    assert ticks > 0
+
+
+def test_unreadable_pdf_raises_runtime_error(tmp_path):
+    path = tmp_path / "M1.pdf"
+    path.write_bytes(b"not a pdf")
+
+    with pytest.raises(RuntimeError):
+        list(iter_pdf_pages(str(path)))
+
+
+def test_corrupt_document_is_recorded_without_failing_the_batch(tmp_path, write_text_pdf):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    write_text_pdf(docs / "M1_q1.pdf", ["chargeback spike"])
+    (docs / "M2_q1.pdf").write_bytes(b"not a pdf")
+
+    cache = DocumentTextCache(str(tmp_path / "cache"))
+    documents = extract_documents(str(docs), max_workers=1, cache=cache).set_index("merchant_id")
+
+    assert documents.loc["M1", "text"] == "chargeback spike"
+    assert pd.isna(documents.loc["M1", "error"])
+    assert documents.loc["M2", "text"] == ""
+    assert "Failed to process PDF" in documents.loc["M2", "error"]
+
+    # Failures are not cached, so a fixed file is parsed on the next run
+    assert cache.get(documents.loc["M2", "content_hash"]) is None
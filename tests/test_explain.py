@@ -0,0 +1,108 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.linear_model import LogisticRegression
+
+from model.explain import contribution_column, explain_risk, occlusion_attributions, top_k_drivers
+from model.fast_scorer import LinearScorer
+from reporting.prompts import build_underwriting_prompt
+from reporting.report_generator import generate_underwriting_report, iter_underwriting_reports
+
+FEATURES = ["a", "b", "c", "d"]
+
+
+@pytest.fixture
+def make_portfolio(make_classification):
+    def make(n=400, seed=0):
+        df, y = make_classification(n, seed, FEATURES)
+        df["merchant_id"] = [f"M{i:03d}" for i in range(n)]
+        df["country"] = "Kenya"
+        df["risk_tier"] = "High"
+        df["risk_probability"] = 0.5
+        df["monthly_volume"] = 1000.0
+        df["transaction_count"] = 100
+        df["dispute_count"] = 1
+        return df, y
+    return make
+
+
+def test_linear_contributions_sum_to_log_odds_vs_baseline(make_portfolio):
+    df, y = make_portfolio()
+    model = LogisticRegression().fit(df[FEATURES], y)
+    baseline = df[FEATURES].mean().to_numpy()
+
+    explain_risk(df, model=model, k=4)
+
+    scorer = LinearScorer.from_estimator(model)
+    expected = scorer.decision_function(df[FEATURES].to_numpy()) - scorer.decision_function(baseline[None, :])
+    total = sum(df[f"driver_{rank}_contribution"] for rank in range(1, 5))
+
+    np.testing.assert_allclose(total, expected, atol=1e-10)
+    # Merchants get their own drivers, not one global ranking
+    assert df["driver_1"].nunique() > 1
+
+
+def test_top_k_matches_a_full_sort_per_row():
+    rng = np.random.default_rng(1)
+    attributions = rng.normal(size=(200, 9))
+    features = [f"f{i}" for i in range(9)]
+
+    names, values = top_k_drivers(attributions, features, k=3)
+
+    order = np.argsort(-attributions, axis=1)[:, :3]
+    np.testing.assert_array_equal(names, np.array(features, dtype=object)[order])
+    np.testing.assert_array_equal(values, np.take_along_axis(attributions, order, axis=1))
+
+
+def test_tree_occlusion_matches_one_merchant_at_a_time(make_portfolio):
+    df, y = make_portfolio(n=300)
+    model = HistGradientBoostingClassifier(max_iter=20).fit(df[FEATURES], y)
+    X = df[FEATURES].to_numpy()
+    baseline = X.mean(axis=0)
+
+    attributions = occlusion_attributions(model, X, baseline, FEATURES)
+
+    def log_odds(row):
+        p = model.predict_proba(pd.DataFrame([row], columns=FEATURES))[0, 1]
+        return np.log(p / (1 - p))
+
+    row = X[7]
+    for j in range(len(FEATURES)):
+        occluded = row.copy()
+        occluded[j] = baseline[j]
+        np.testing.assert_allclose(attributions[7, j], log_odds(row) - log_odds(occluded), atol=1e-9)
+
+
+def test_reports_and_prompts_show_merchant_specific_drivers(make_portfolio):
+    df, y = make_portfolio(n=20)
+    explain_risk(df, model=LogisticRegression().fit(df[FEATURES], y))
+
+    reports = dict(iter_underwriting_reports(df, feature_importance=None))
+    row = df.iloc[3]
+
+    assert reports[row["merchant_id"]] == generate_underwriting_report(row, None)
+    assert f"- {row['driver_1']} (contribution: {row['driver_1_contribution']:+.4f})" in reports[row["merchant_id"]]
+
+    prompt = build_underwriting_prompt(row, None, {"average_risk_probability": 0.2})
+    assert f"- {row['driver_1']}: contribution=" in prompt
+
+
+def test_pipeline_scores_with_the_published_artifact(tmp_path, monkeypatch, make_model_inputs):
+    import run_pipeline
+    from model.predict import predict_risk
+    from model.registry import get_model
+
+    monkeypatch.chdir(tmp_path)
+    df = make_model_inputs()
+
+    model, _ = run_pipeline._train_model(df)
+    assert model is get_model() and "baseline" in model and "tier_cutoffs" in model
+
+    scored = run_pipeline._score(df.copy(), model)
+    served = explain_risk(predict_risk(df.copy(), model=get_model()), model=get_model())
+    pd.testing.assert_frame_equal(scored, served)
+
+    # Drivers are measured from the training baseline, not this frame's mean
+    frame_mean = explain_risk(df.copy(), model={k: v for k, v in model.items() if k != "baseline"})
+    assert not np.allclose(scored[contribution_column(1)], frame_mean[contribution_column(1)])
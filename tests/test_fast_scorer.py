@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+
+from model.fast_scorer import LinearScorer
+from model.predict import predict_risk
+
+
+def fitted_model(n=2000, n_features=14, seed=0):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(
+        rng.normal(size=(n, n_features)) * rng.uniform(1, 1e4, n_features),
+        columns=[f"f{i}" for i in range(n_features)],
+    )
+    y = (X["f0"] / X["f0"].std() + rng.normal(size=n) > 0.5).astype(int)
+    return LogisticRegression(max_iter=1000).fit(X, y), X
+
+
+def test_linear_scorer_matches_predict_proba():
+    model, X = fitted_model()
+    scorer = LinearScorer.from_estimator(model)
+
+    expected = model.predict_proba(X)[:, 1]
+
+    np.testing.assert_allclose(scorer.predict_proba(X.to_numpy()), expected, rtol=1e-12, atol=1e-15)
+    np.testing.assert_allclose(scorer.predict_proba(X.to_numpy()[:1]), expected[:1], rtol=1e-12)
+
+
+def test_scorer_round_trips_through_npz(tmp_path):
+    model, X = fitted_model()
+    scorer = LinearScorer.from_estimator(model)
+
+    scorer.save(tmp_path / "scorer.npz")
+    loaded = LinearScorer.load(tmp_path / "scorer.npz")
+
+    assert loaded.features == scorer.features
+    np.testing.assert_array_equal(loaded.predict_proba(X.to_numpy()), scorer.predict_proba(X.to_numpy()))
+
+
+def test_predict_risk_uses_same_probabilities_on_fast_path():
+    model, X = fitted_model()
+    df = X.copy()
+
+    scored = predict_risk(df, model=model)
+
+    np.testing.assert_allclose(scored["risk_probability"], model.predict_proba(X)[:, 1], rtol=1e-12)
+
+
+def test_scaled_pipeline_is_folded_into_one_weight_vector():
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+
+    _, X = fitted_model()
+    y = (X["f1"] > X["f1"].median()).astype(int)
+    model = make_pipeline(StandardScaler(), LogisticRegression(max_iter=1000)).fit(X, y)
+
+    scorer = LinearScorer.from_estimator(model)
+
+    assert scorer.features == list(X.columns)
+    np.testing.assert_allclose(scorer.predict_proba(X.to_numpy()), model.predict_proba(X)[:, 1], rtol=1e-9)
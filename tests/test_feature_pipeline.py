@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+
+from features.feature_pipeline import assign_risk_tier, build_feature_frame
+
+
+# -----------------------------
+# Row-wise reference (previous run_pipeline / predict logic)
+# -----------------------------
+
+def legacy_feature_frame(df, internal, countries, pdf_text, scrape_data):
+    rows = []
+    for _, row in df.iterrows():
+        api_data = internal[row["merchant_id"]]
+        enriched_row = row.to_dict()
+        enriched_row["internal_risk_flag"] = api_data["internal_risk_flag"]
+        enriched_row["last_30d_volume"] = api_data["transaction_summary"]["last_30d_volume"]
+        enriched_row["last_30d_txn_count"] = api_data["transaction_summary"]["last_30d_txn_count"]
+        enriched_row["avg_ticket_size"] = api_data["transaction_summary"]["avg_ticket_size"]
+        enriched_row["last_review_date"] = api_data.get("last_review_date")
+        rows.append(enriched_row)
+    df = pd.DataFrame(rows)
+
+    rows = []
+    for _, row in df.iterrows():
+        enriched_row = row.to_dict()
+        enriched_row.update(countries[row["country"]])
+        rows.append(enriched_row)
+    df = pd.DataFrame(rows)
+
+    df["pdf_mentions_refunds"] = int("refund" in pdf_text.lower())
+    df["pdf_mentions_chargeback"] = int("chargeback" in pdf_text.lower())
+    df["pdf_mentions_complaint"] = int("complaint" in pdf_text.lower())
+    df["num_value_props"] = len(scrape_data.get("value_propositions", []))
+    df["num_public_stats"] = len(scrape_data.get("public_stats", []))
+    df["num_partners"] = len(scrape_data.get("partners", []))
+    df["internal_flag_numeric"] = df["internal_risk_flag"].map({"low": 0, "medium": 1, "high": 2})
+    df["internal_flag_numeric"] = df["internal_flag_numeric"].fillna(1)
+    df["is_high_risk_region"] = df["region"].isin(["Africa", "South America"]).astype(int)
+    keywords = ["fraud", "lawsuit", "bankruptcy"]
+    df["pdf_risk_signal"] = sum(w in pdf_text.lower() for w in keywords) / len(keywords)
+
+    df["transaction_count"] = df["transaction_count"].replace(0, 1)
+    df["chargeback_rate"] = df["dispute_count"] / df["transaction_count"]
+    df["fraud_rate"] = df["chargeback_rate"] * 0.6
+
+    country_risk = df.groupby("country")[["chargeback_rate", "fraud_rate"]].mean().mean(axis=1)
+    df["country_risk_score"] = df["country"].map(country_risk)
+
+    df["risk_score"] = (
+        0.4 * df["chargeback_rate"] +
+        0.3 * df["fraud_rate"] +
+        0.2 * df["internal_flag_numeric"] +
+        0.1 * df["country_risk_score"]
+    )
+    return df
+
+
+def legacy_tier(p, high):
+    if p > high:
+        return "High"
+    elif p > 0.3:
+        return "Medium"
+    return "Low"
+
+
+def make_inputs(n=500, seed=7):
+    rng = np.random.default_rng(seed)
+    ids = [f"M{i:05d}" for i in range(n)]
+    country_names = ["Kenya", "Brazil", "Germany", "India"]
+
+    merchants = pd.DataFrame({
+        "merchant_id": ids,
+        "name": [f"Merchant {i}" for i in range(n)],
+        "country": rng.choice(country_names, n),
+        "registration_number": [f"R{i}" for i in range(n)],
+        "monthly_volume": rng.uniform(1000, 50000, n).round(2),
+        "dispute_count": rng.integers(0, 20, n),
+        "transaction_count": rng.integers(1, 5000, n),
+    })
+
+    flags = rng.choice(["low", "medium", "high", "unexpected"], n)
+    volume = rng.uniform(10000, 200000, n).round(2)
+    txn = rng.integers(100, 5000, n)
+    payloads = {
+        m: {
+            "internal_risk_flag": flags[i],
+            "transaction_summary": {
+                "last_30d_volume": volume[i],
+                "last_30d_txn_count": txn[i],
+                "avg_ticket_size": round(volume[i] / txn[i], 2),
+            },
+            "last_review_date": "2026-01-01",
+        }
+        for i, m in enumerate(ids)
+    }
+    internal_df = pd.DataFrame({
+        "merchant_id": ids,
+        "internal_risk_flag": [payloads[m]["internal_risk_flag"] for m in ids],
+        "last_30d_volume": volume,
+        "last_30d_txn_count": txn,
+        "avg_ticket_size": [payloads[m]["transaction_summary"]["avg_ticket_size"] for m in ids],
+        "last_review_date": "2026-01-01",
+    })
+
+    countries = {
+        "Kenya": {"region": "Africa", "subregion": "Eastern Africa"},
+        "Brazil": {"region": "Americas", "subregion": "South America"},
+        "Germany": {"region": "Europe", "subregion": "Western Europe"},
+        "India": {"region": "Asia", "subregion": "Southern Asia"},
+    }
+    country_df = pd.DataFrame([{"country": c, **v} for c, v in countries.items()])
+
+    return merchants, payloads, internal_df, countries, country_df
+
+
+def test_vectorized_feature_frame_matches_row_wise_pipeline():
+    merchants, payloads, internal_df, countries, country_df = make_inputs()
+    pdf_text = "Customer complaint about a Refund; no fraud found."
+    scrape_data = {"value_propositions": ["a", "b"], "public_stats": ["$1B+"], "partners": []}
+
+    expected = legacy_feature_frame(merchants, payloads, countries, pdf_text, scrape_data)
+    actual = build_feature_frame(merchants, internal_df, country_df, pdf_text, scrape_data)
+
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False, check_exact=True)
+
+
+def test_vectorized_tiers_match_scalar_mapping():
+    probs = pd.Series(np.r_[np.linspace(0, 1, 1001), [0.3, 0.6, 0.7, np.nan]])
+
+    for high in (0.6, 0.7):
+        expected = probs.apply(lambda p: legacy_tier(p, high)).tolist()
+        assert assign_risk_tier(probs, high=high).tolist() == expected
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+from features.registry import MODEL_FEATURES, compute_features
+
+
+def test_compute_features_keeps_api_values_and_adds_only_requested(make_model_inputs):
+    df = make_model_inputs()
+    api_ticket = df["avg_ticket_size"].copy()
+
+    compute_features(df, ["dispute_rate", "avg_ticket_size"])
+
+    pd.testing.assert_series_equal(df["avg_ticket_size"], api_ticket)
+    assert "dispute_rate" in df.columns
+    assert "high_risk" not in df.columns
+
+
+def test_avg_ticket_size_falls_back_when_api_column_missing(make_model_inputs):
+    df = make_model_inputs().drop(columns=["avg_ticket_size"])
+
+    compute_features(df, ["avg_ticket_size"])
+
+    np.testing.assert_allclose(df["avg_ticket_size"], df["monthly_volume"] / df["transaction_count"])
+
+
+def test_artifact_stores_feature_list_used_by_prediction(tmp_path, monkeypatch, make_model_inputs):
+    from model.train import train_risk_model
+    from model.predict import predict_risk
+    from model.registry import load_model
+
+    monkeypatch.chdir(tmp_path)
+    df = make_model_inputs()
+
+    train_risk_model(df)
+    artifact = load_model()
+    assert artifact["features"] == MODEL_FEATURES
+
+    scored = predict_risk(make_model_inputs())
+    assert scored["risk_probability"].between(0, 1).all()
+
+
+def test_derived_columns_are_rebuilt_on_request_and_fallback_fills_per_row(make_model_inputs):
+    df = make_model_inputs()
+    df["dispute_rate"] = 99.0  # stale, caller-supplied
+    df.loc[[0, 5], "avg_ticket_size"] = np.nan
+    api_ticket = df["avg_ticket_size"].copy()
+
+    compute_features(df, ["dispute_rate"])
+    assert (df["dispute_rate"] == 99.0).all()
+
+    compute_features(df, ["dispute_rate", "avg_ticket_size", "high_risk"], recompute=True)
+
+    np.testing.assert_allclose(df["dispute_rate"], df["dispute_count"] / df["transaction_count"])
+    np.testing.assert_allclose(df["high_risk"], df["dispute_rate"] > 0.002)
+
+    # API values are kept; only the missing rows use the monthly ratio
+    np.testing.assert_allclose(df["avg_ticket_size"].drop(index=[0, 5]), api_ticket.drop(index=[0, 5]))
+    np.testing.assert_allclose(
+        df.loc[[0, 5], "avg_ticket_size"], df.loc[[0, 5], "monthly_volume"] / df.loc[[0, 5], "transaction_count"]
+    )
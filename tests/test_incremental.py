@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+
+from features.registry import MODEL_FEATURES
+from ingestion.country_cache import CountryMetadataCache
+from pipeline.incremental import run_incremental
+
+
+def test_second_run_only_touches_changed_merchants(tmp_path, make_merchants, make_internal_api, make_risk_model):
+    regions = {"Kenya": "Africa", "Germany": "Europe"}
+    cache = CountryMetadataCache(
+        db_path=str(tmp_path / "c.sqlite"),
+        fetcher=lambda c: {"region": regions[c], "subregion": "-"},
+    )
+    api = make_internal_api()
+    model = make_risk_model()
+    kwargs = dict(state_dir=str(tmp_path / "state"), model=model,
+                  internal_risk_fetcher=api, country_cache=cache)
+
+    merchants = make_merchants()
+    first, summary = run_incremental(merchants, **kwargs)
+    assert summary["rescored"] == 50 and len(api.requested) == 50
+
+    api.calls.clear()
+    again, summary = run_incremental(merchants, **kwargs)
+    assert summary["rescored"] == 0 and api.requested == []
+    pd.testing.assert_series_equal(again["risk_probability"], first["risk_probability"])
+
+    edited = merchants.copy()
+    edited.loc[3, "dispute_count"] += 5
+    edited = pd.concat([edited.drop(index=7), make_merchants(51).tail(1)], ignore_index=True)
+
+    _, summary = run_incremental(edited, **kwargs)
+    assert sorted(api.requested) == ["M003", "M050"]
+    assert (summary["rescored"], summary["removed"]) == (2, 1)
+
+    # Delta-maintained metrics equal a full recomputation
+    full, _ = run_incremental(edited, **{**kwargs, "state_dir": str(tmp_path / "fresh")})
+    assert summary["metrics"]["num_high_risk"] == (full["risk_tier"] == "High").sum()
+    np.testing.assert_allclose(
+        summary["metrics"]["expected_high_risk_merchants"], full["risk_probability"].sum()
+    )
+
+
+def test_scoring_elsewhere_with_the_same_artifact_keeps_scores_cached(
+    tmp_path, make_merchants, make_internal_api, make_risk_model
+):
+    from model.predict import predict_risk
+
+    cache = CountryMetadataCache(db_path=str(tmp_path / "c.sqlite"), fetcher=lambda c: {"region": "Europe", "subregion": "-"})
+    artifact = {"model": make_risk_model(), "features": list(MODEL_FEATURES)}
+    kwargs = dict(state_dir=str(tmp_path / "state"), model=artifact,
+                  internal_risk_fetcher=make_internal_api(), country_cache=cache)
+
+    first, _ = run_incremental(make_merchants(), **kwargs)
+
+    # predict_risk caches a scorer on the artifact dict it is given
+    predict_risk(first.copy(), model=artifact)
+    assert "scorer" in artifact
+
+    _, summary = run_incremental(make_merchants(), **kwargs)
+    assert summary["rescored"] == 0
+
+
+def test_stale_internal_payloads_are_refetched(tmp_path, make_merchants, make_internal_api, make_risk_model):
+    cache = CountryMetadataCache(db_path=str(tmp_path / "c.sqlite"), fetcher=lambda c: {"region": "Europe", "subregion": "-"})
+    api = make_internal_api()
+    kwargs = dict(state_dir=str(tmp_path / "state"), model=make_risk_model(),
+                  internal_risk_fetcher=api, country_cache=cache)
+
+    run_incremental(make_merchants(), **kwargs)
+    api.calls.clear()
+
+    _, summary = run_incremental(make_merchants(), **kwargs)
+    assert api.requested == []
+
+    _, summary = run_incremental(make_merchants(), internal_max_age_seconds=0, **kwargs)
+    assert len(api.requested) == 50
+    assert summary["expired"] == 50
+    # Same payloads as before, so nothing needs re-scoring
+    assert summary["rescored"] == 0
+
+
+def test_pipeline_entry_point_runs_incrementally(
+    tmp_path, monkeypatch, write_text_pdf, make_merchants, make_internal_api, make_risk_model
+):
+    import run_pipeline
+
+    csv_path, pdf_path = tmp_path / "merchants.csv", tmp_path / "summary.pdf"
+    make_merchants().to_csv(csv_path, index=False)
+    write_text_pdf(pdf_path, ["Refunds rose; one chargeback pending."])
+    monkeypatch.setattr("ingestion.scraper.scrape_claritypay", lambda: {})
+
+    cache = CountryMetadataCache(db_path=str(tmp_path / "c.sqlite"), fetcher=lambda c: {"region": "Europe", "subregion": "-"})
+    api = make_internal_api()
+    kwargs = dict(csv_path=str(csv_path), pdf_path=str(pdf_path), state_dir=str(tmp_path / "state"), persist=False,
+                  model=make_risk_model(), internal_risk_fetcher=api, country_cache=cache)
+
+    first = run_pipeline.run_incremental_pipeline(**kwargs)
+    assert first["incremental_summary"]["rescored"] == 50 and len(first["scored"]) == 50
+
+    second = run_pipeline.run_incremental_pipeline(**kwargs)
+    assert second["incremental_summary"]["rescored"] == 0 and len(api.requested) == 50
+    assert second["incremental_summary"]["metrics"] == first["incremental_summary"]["metrics"]
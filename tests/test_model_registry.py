@@ -0,0 +1,69 @@
+import os
+
+import joblib
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+import model.registry as registry
+from model.registry import clear_model_cache, get_model, reload_model
+
+
+@pytest.fixture
+def artifact_path(tmp_path, make_classification):
+    X, y = make_classification()
+    path = str(tmp_path / "model.pkl")
+    joblib.dump({"model": LogisticRegression().fit(X, y), "features": list(X.columns)}, path)
+
+    clear_model_cache()
+    yield path
+    clear_model_cache()
+
+
+@pytest.fixture
+def digests(monkeypatch):
+    calls = []
+    digest = registry._digest
+
+    def counting(path):
+        calls.append(path)
+        return digest(path)
+
+    monkeypatch.setattr(registry, "_digest", counting)
+    return calls
+
+
+def test_repeated_calls_return_the_cached_artifact(artifact_path, digests):
+    first = get_model(artifact_path)
+
+    assert get_model(artifact_path) is first
+    assert len(digests) == 1
+    assert reload_model(artifact_path) is not first
+
+
+def test_touching_rehashes_but_keeps_the_unchanged_artifact(artifact_path, digests):
+    first = get_model(artifact_path)
+
+    stat = os.stat(artifact_path)
+    os.utime(artifact_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    # The changed mtime is noticed and the file re-hashed; same bytes, no reload
+    assert get_model(artifact_path) is first
+    assert len(digests) == 2
+
+    # The new mtime is remembered, so later calls are a stat again
+    assert get_model(artifact_path) is first
+    assert len(digests) == 2
+
+
+def test_replacing_the_artifact_reloads_it(artifact_path, make_classification):
+    first = get_model(artifact_path)
+
+    X, y = make_classification(seed=1)
+    tmp = f"{artifact_path}.tmp"
+    joblib.dump({"model": LogisticRegression(C=0.1).fit(X, y), "features": list(X.columns)}, tmp)
+    os.replace(tmp, artifact_path)
+
+    second = get_model(artifact_path)
+    assert second is not first
+    assert second["model"].C == 0.1
+    assert get_model(artifact_path) is second
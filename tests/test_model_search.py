@@ -0,0 +1,26 @@
+import numpy as np
+
+from model.predict import predict_risk
+from model.registry import load_model
+from model.search import Candidate, scaled_logistic_regression, search_risk_model
+
+
+def test_search_picks_best_cv_auc_and_saves_loadable_model(tmp_path, capsys, make_model_inputs):
+    from sklearn.dummy import DummyClassifier
+
+    candidates = [
+        Candidate("constant", DummyClassifier, {"strategy": "prior"}),
+        Candidate("logreg", scaled_logistic_regression, {"C": 1.0}),
+    ]
+    df = make_model_inputs()
+    path = str(tmp_path / "model.pkl")
+
+    model, importance, results = search_risk_model(df, candidates, n_splits=3, n_jobs=2, path=path)
+
+    assert list(results["candidate"]) == ["logreg", "constant"]
+    assert results.loc[1, "mean_auc"] == 0.5
+    assert (results[["fit_seconds", "wall_seconds"]] >= 0).all().all()
+    assert importance.iloc[0]["feature"] == "dispute_rate"
+
+    scored = predict_risk(df.copy(), model=load_model(path))
+    np.testing.assert_allclose(scored["risk_probability"], model.predict_proba(df[load_model(path)["features"]])[:, 1])
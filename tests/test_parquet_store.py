@@ -0,0 +1,81 @@
+import os
+
+import pandas as pd
+import pytest
+
+from storage.parquet_store import read_scored_merchants, write_scored_merchants
+
+
+def scored_frame():
+    return pd.DataFrame({
+        "merchant_id": ["M1", "M2", "M3", "M4"],
+        "country": ["Kenya", "Brazil", "Kenya", "India"],
+        "region": ["Africa", "Americas", "Africa", "Asia"],
+        "monthly_volume": [1000.0, 2000.0, 3000.0, 4000.0],
+        "risk_probability": [0.9, 0.1, 0.5, 0.8],
+        "predicted_high_risk": [1, 0, 1, 1],
+        "risk_tier": ["High", "Low", "Medium", "High"],
+        "scratch_column": 0,
+    })
+
+
+def test_scored_table_round_trip_with_pushdown(tmp_path):
+    write_scored_merchants(scored_frame(), root=str(tmp_path))
+
+    high = read_scored_merchants(
+        str(tmp_path), tiers=["High"], columns=["merchant_id", "risk_probability"]
+    )
+    assert sorted(high["merchant_id"]) == ["M1", "M4"]
+    assert list(high.columns) == ["merchant_id", "risk_probability"]
+
+    kenya = read_scored_merchants(str(tmp_path), countries=["Kenya"])
+    assert sorted(kenya["merchant_id"]) == ["M1", "M3"]
+    assert "scratch_column" not in kenya.columns
+    assert isinstance(kenya["country"].dtype, pd.CategoricalDtype)
+
+
+def test_append_mode_accumulates_chunks(tmp_path):
+    frame = scored_frame()
+
+    write_scored_merchants(frame.iloc[:2], root=str(tmp_path))
+    write_scored_merchants(frame.iloc[2:], root=str(tmp_path), mode="append")
+
+    assert len(read_scored_merchants(str(tmp_path))) == 4
+
+    write_scored_merchants(frame.iloc[:1], root=str(tmp_path))
+    assert len(read_scored_merchants(str(tmp_path))) == 1
+
+
+def test_appends_with_different_category_cardinalities_read_back(tmp_path):
+    many = pd.DataFrame({
+        "merchant_id": [f"M{i}" for i in range(300)],
+        "country": [f"Country {i}" for i in range(300)],
+        "risk_probability": 0.5,
+        "risk_tier": "High",
+    })
+
+    # Small chunk first and last, so file order can't hide a width mismatch
+    write_scored_merchants(scored_frame(), root=str(tmp_path))
+    write_scored_merchants(many, root=str(tmp_path), mode="append")
+    write_scored_merchants(scored_frame(), root=str(tmp_path), mode="append")
+
+    result = read_scored_merchants(str(tmp_path))
+    assert len(result) == 308
+    assert result["country"].nunique() == 303
+
+
+def test_failed_overwrite_keeps_previous_table(tmp_path, monkeypatch):
+    import storage.parquet_store as parquet_store
+
+    write_scored_merchants(scored_frame(), root=str(tmp_path))
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(parquet_store.pq, "write_to_dataset", fail)
+    with pytest.raises(OSError):
+        write_scored_merchants(scored_frame().iloc[:1], root=str(tmp_path))
+
+    monkeypatch.undo()
+    assert len(read_scored_merchants(str(tmp_path))) == 4
+    assert sorted(os.listdir(tmp_path)) == ["scored"]
@@ -0,0 +1,51 @@
+import asyncio
+import time
+
+import pytest
+
+from pipeline.executor import PipelineExecutor, Stage
+
+
+def slow(value, seconds=0.2):
+    time.sleep(seconds)
+    return value
+
+
+async def slow_async(value):
+    await asyncio.sleep(0.2)
+    return value
+
+
+def test_independent_stages_overlap_and_outputs_flow():
+    stages = [
+        Stage("a", lambda: slow(1), [], ["a"]),
+        Stage("b", lambda: slow(2), [], ["b"]),
+        Stage("c", slow_async, ["seed"], ["c"]),
+        Stage("sum", lambda a, b, c: (a + b + c, a * b * c), ["a", "b", "c"], ["total", "product"]),
+    ]
+
+    result = PipelineExecutor(stages).run({"seed": 3})
+
+    assert (result["total"], result["product"]) == (6, 6)
+    independent = [result.timings[name] for name in ("a", "b", "c")]
+    assert max(t.start for t in independent) < min(t.end for t in independent)
+    assert result.timings["sum"].start >= max(t.end for t in independent)
+    assert len(result.critical_path) == 2 and result.critical_path[-1] == "sum"
+    assert 0.2 <= result.critical_path_time <= result.wall_time
+
+
+def test_missing_inputs_and_cycles_are_rejected():
+    with pytest.raises(ValueError, match="nothing provides"):
+        PipelineExecutor([Stage("a", lambda x: x, ["x"], ["y"])]).run()
+
+    cycle = [Stage("a", lambda y: y, ["y"], ["x"]), Stage("b", lambda x: x, ["x"], ["y"])]
+    with pytest.raises(ValueError, match="Cycle"):
+        PipelineExecutor(cycle).run()
+
+
+def test_stage_failure_is_reported_by_name():
+    def boom():
+        raise KeyError("missing")
+
+    with pytest.raises(RuntimeError, match="Stage broken failed"):
+        PipelineExecutor([Stage("broken", boom, [], ["x"])]).run()
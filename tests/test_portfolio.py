@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from reporting.portfolio import (
+    PortfolioAccumulator,
+    aggregate_chunks,
+    aggregate_scored_table,
+    portfolio_breakdown,
+    portfolio_metrics,
+)
+from storage.parquet_store import write_scored_merchants
+
+
+def test_metrics_match_pandas(make_scored):
+    df = make_scored()
+    metrics = portfolio_metrics(df)
+
+    assert metrics["merchants"] == len(df)
+    assert metrics["num_high_risk"] == (df["risk_tier"] == "High").sum()
+    assert metrics["num_medium_risk"] == (df["risk_tier"] == "Medium").sum()
+    assert metrics["num_low_risk"] == (df["risk_tier"] == "Low").sum()
+    assert metrics["predicted_high_risk"] == df["predicted_high_risk"].sum()
+    assert metrics["expected_high_risk_merchants"] == pytest.approx(df["risk_probability"].sum())
+    assert metrics["average_risk_probability"] == pytest.approx(df["risk_probability"].mean())
+
+    weighted = np.average(df["risk_probability"], weights=df["monthly_volume"])
+    assert metrics["exposure_weighted_risk"] == pytest.approx(weighted)
+
+    for q in (0.5, 0.9, 0.99):
+        assert metrics[f"p{q * 100:g}_risk_probability"] == pytest.approx(df["risk_probability"].quantile(q), abs=1e-3)
+
+
+def test_breakdown_groups_by_several_columns(make_scored):
+    df = make_scored()
+    breakdown = portfolio_breakdown(df, by=["region", "risk_tier"])
+
+    expected = df.groupby(["region", "risk_tier"])["risk_probability"].agg(["size", "mean"])
+
+    assert breakdown.index.names == ["region", "risk_tier"]
+    np.testing.assert_array_equal(breakdown["merchants"], expected["size"])
+    np.testing.assert_allclose(breakdown["average_risk_probability"], expected["mean"])
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_chunked_and_parallel_accumulation_equals_one_pass(make_scored, n_jobs):
+    df = make_scored()
+    chunks = [df.iloc[start:start + 3_000] for start in range(0, len(df), 3_000)]
+
+    merged = aggregate_chunks(chunks, by="country", n_jobs=n_jobs).frame()
+    whole = PortfolioAccumulator("country").update(df).frame()
+
+    # Missing countries are one group across chunks
+    assert len(merged) == 4
+    pd.testing.assert_frame_equal(merged, whole, check_exact=False, rtol=1e-12)
+
+
+def test_merge_rejects_different_grouping():
+    with pytest.raises(ValueError):
+        PortfolioAccumulator("country").merge(PortfolioAccumulator("region"))
+
+
+def test_aggregates_the_persisted_scored_table(tmp_path, make_scored):
+    df = make_scored(5_000)
+    write_scored_merchants(df, str(tmp_path))
+
+    accumulator = aggregate_scored_table(str(tmp_path), by="risk_tier", batch_size=1_000)
+
+    assert accumulator.metrics() == pytest.approx(portfolio_metrics(df), nan_ok=True)
+    assert accumulator.frame().loc["High", "merchants"] == (df["risk_tier"] == "High").sum()
+
+
+def test_many_groups_are_counted_sparsely(make_scored):
+    df = make_scored(3_000)
+    df["country"] = [f"C{i % 300}" for i in range(len(df))]
+
+    # ~900 groups x 1000 bins is far larger than the chunk, so bins are counted sparsely
+    accumulator = PortfolioAccumulator(["country", "risk_tier"]).update(df)
+    frame = accumulator.frame()
+
+    expected = df.groupby(["country", "risk_tier"]).size()
+    np.testing.assert_array_equal(frame["merchants"], expected.loc[frame.index])
+    assert len(accumulator._stats["merchants"]) < 2 * len(frame)
+
+    bucket = np.minimum((df["risk_probability"] * accumulator.bins).astype(int), accumulator.bins - 1)
+    counts = df.assign(bucket=bucket).groupby(["country", "risk_tier", "bucket"]).size()
+    rows = [accumulator._index[(country, tier)] for country, tier, _ in counts.index]
+    np.testing.assert_array_equal(accumulator.histogram[rows, counts.index.get_level_values("bucket")], counts)
+    assert accumulator.histogram.sum() == len(df)
@@ -0,0 +1,83 @@
+import os
+
+from reporting.llm_report_generator import TemplateBackend, generate_llm_reports, set_backend
+from reporting.report_cache import ReportCache, report_cache_key
+
+
+class CountingBackend(TemplateBackend):
+    name = "counting"
+
+    def __init__(self):
+        self.generated = 0
+
+    def generate(self, prompts, max_new_tokens, batch_size):
+        self.generated += len(prompts)
+        return super().generate(prompts, max_new_tokens, batch_size)
+
+
+def test_key_covers_prompt_model_and_params():
+    base = report_cache_key("p", "m", {"max_new_tokens": 400})
+
+    assert base == report_cache_key("p", "m", {"max_new_tokens": 400})
+    assert base != report_cache_key("q", "m", {"max_new_tokens": 400})
+    assert base != report_cache_key("p", "other", {"max_new_tokens": 400})
+    assert base != report_cache_key("p", "m", {"max_new_tokens": 100})
+
+
+def test_memory_lru_falls_back_to_disk(tmp_path):
+    cache = ReportCache(str(tmp_path), memory_items=2)
+    for key in "abc":
+        cache.put(key * 4, f"report {key}")
+
+    assert cache.stats()["memory_items"] == 2
+    assert cache.get("aaaa") == "report a"  # evicted from memory, read from disk
+    assert cache.get("aaaa") == "report a"
+    assert cache.get("zzzz") is None
+
+    stats = cache.stats()
+    assert (stats["disk_hits"], stats["memory_hits"], stats["misses"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 2 / 3
+
+
+def test_disk_store_evicts_least_recently_used(tmp_path):
+    cache = ReportCache(str(tmp_path), memory_items=0, max_disk_bytes=250)
+
+    for i, key in enumerate(["k1", "k2", "k3"]):
+        cache.put(key, "x" * 100)
+        os.utime(cache._path(key), (i, i))
+
+    assert cache.get("k1") is None
+    assert cache.get("k2") == "x" * 100
+    assert cache.stats()["disk_bytes"] <= 250
+
+
+def test_generation_only_runs_for_cache_misses(tmp_path):
+    backend = CountingBackend()
+    cache = ReportCache(str(tmp_path))
+    set_backend(backend)
+
+    try:
+        first = generate_llm_reports(["Merchant ID: M1", "Merchant ID: M2", "Merchant ID: M1"], cache=cache)
+        again = generate_llm_reports(["Merchant ID: M2", "Merchant ID: M1"], cache=cache)
+    finally:
+        set_backend(None)
+
+    assert backend.generated == 2
+    assert again == [first[1], first[0]]
+    assert cache.stats()["hit_rate"] == 2 / 5
+
+
+def test_overwrites_keep_the_byte_count_and_evict_below_the_cap(tmp_path):
+    cache = ReportCache(str(tmp_path), memory_items=0, max_disk_bytes=1000)
+
+    for _ in range(5):
+        cache.put("same", "x" * 100)
+    assert cache.stats()["disk_bytes"] == 100
+
+    for i in range(10):
+        cache.put(f"k{i:02d}", "x" * 100)
+        os.utime(cache._path(f"k{i:02d}"), (i + 10, i + 10))
+
+    # Evicted down to the 90% low-water mark, and no temp files left behind
+    assert cache.stats()["disk_bytes"] <= 900
+    assert not [name for _, _, names in os.walk(tmp_path) for name in names if name.endswith(".tmp")]
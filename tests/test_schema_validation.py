@@ -0,0 +1,96 @@
+import pandas as pd
+import pytest
+
+from ingestion.schema_validation import (
+    ERRORS_COLUMN,
+    CompiledSchema,
+    Rule,
+    quarantine_merchants,
+    validate_merchants,
+    validate_schema,
+)
+
+
+def make_dirty(df):
+    df.loc[2, "merchant_id"] = "X2"
+    df.loc[[4, 6], "merchant_id"] = "M001"
+    df.loc[5, "name"] = None
+    df.loc[8, "dispute_count"] = -3
+    df.loc[[8, 9], "transaction_count"] = 0
+    return df
+
+
+def test_valid_frame_passes(make_merchants):
+    validate_schema(make_merchants())
+    assert validate_merchants(make_merchants()).valid
+
+
+def test_report_lists_every_offending_row_for_every_rule(make_merchants):
+    report = validate_merchants(make_dirty(make_merchants()))
+
+    assert not report.valid
+    assert {name: index.tolist() for name, index in report.failures.items()} == {
+        "merchant_id_prefix": [2],
+        "merchant_id_unique": [4, 6],
+        "name_not_null": [5],
+        "dispute_count_non_negative": [8],
+        "transaction_count_positive": [8, 9],
+    }
+    assert len(report.error_frame()) == 7
+
+
+def test_validate_schema_raises_with_every_failure(make_merchants):
+    with pytest.raises(ValueError) as error:
+        validate_schema(make_dirty(make_merchants()))
+
+    message = str(error.value)
+    assert "merchant_id must start with 'M' (1 rows" in message
+    assert "transaction_count must be greater than 0 (2 rows, e.g. index [8, 9])" in message
+
+
+def test_missing_columns_are_reported_first(make_merchants):
+    with pytest.raises(ValueError, match="Missing required columns"):
+        validate_schema(make_merchants().drop(columns=["country"]))
+
+
+def test_quarantine_splits_rows_and_names_the_broken_rules(make_merchants):
+    df = make_dirty(make_merchants())
+    df["monthly_volume"] = df["monthly_volume"].astype(object)
+    df.loc[11, "monthly_volume"] = "n/a"
+
+    valid, invalid, report = quarantine_merchants(df)
+
+    assert invalid.index.tolist() == [2, 4, 5, 6, 8, 9, 11]
+    assert len(valid) + len(invalid) == len(df)
+    assert invalid.loc[8, ERRORS_COLUMN] == "dispute_count_non_negative,transaction_count_positive"
+    assert invalid.loc[11, ERRORS_COLUMN] == "monthly_volume_numeric"
+    validate_schema(valid.astype({"monthly_volume": "float64"}))
+
+
+def test_custom_rules_compile_into_a_schema():
+    schema = CompiledSchema([Rule("code_prefix", "code", "prefix", "code must start with 'C'", "C")])
+
+    report = schema.validate(pd.DataFrame({"code": ["C1", "D2", None, "C3"]}, index=[10, 20, 30, 40]))
+
+    assert report.failures["code_prefix"].tolist() == [20]
+    with pytest.raises(ValueError, match="Unknown rule kinds"):
+        CompiledSchema([Rule("x", "code", "regex", "bad")])
+
+
+def test_positive_rule_rejects_negative_values_on_its_own():
+    schema = CompiledSchema([Rule("amount_positive", "amount", "positive", "amount must be greater than 0")])
+
+    report = schema.validate(pd.DataFrame({"amount": [5.0, 0.0, -2.0, None]}))
+
+    assert report.failures["amount_positive"].tolist() == [1, 2]
+
+
+def test_numeric_strings_fail_validation_but_parse_in_quarantine(make_merchants):
+    df = make_merchants(3).astype({"monthly_volume": str})
+
+    with pytest.raises(ValueError, match="monthly_volume must be numeric"):
+        validate_schema(df)
+    assert validate_merchants(df).error_counts() == {"monthly_volume_numeric": 3}
+
+    valid, rejected, _ = quarantine_merchants(df)
+    assert len(valid) == 3 and rejected.empty
@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+import scoring_api.api as api
+from features.feature_pipeline import TIER_HIGH_CUTOFF, TIER_MEDIUM_CUTOFF, assign_risk_tier
+from features.registry import MODEL_FEATURES
+from ingestion.country_cache import CountryMetadataCache
+from model.artifact_store import ModelStore
+from model.explain import explain_risk
+from model.registry import get_model
+
+
+def merchant(merchant_id="M1", **overrides):
+    body = {
+        "merchant_id": merchant_id,
+        "country": "Kenya",
+        "monthly_volume": 20000.0,
+        "dispute_count": 3,
+        "transaction_count": 200,
+        "internal_risk_flag": "high",
+        "last_30d_volume": 9000.0,
+        "last_30d_txn_count": 90,
+        "avg_ticket_size": 100.0,
+    }
+    body.update(overrides)
+    return body
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch, make_internal_api, make_risk_model):
+    store = ModelStore(str(tmp_path / "models"))
+    store.publish(make_risk_model(), MODEL_FEATURES, baseline=np.full(len(MODEL_FEATURES), 0.5))
+
+    internal_api = make_internal_api()
+    monkeypatch.setattr(api, "fetch_internal_risk_frame", internal_api)
+
+    api.configure_service(
+        model_path=store.root,
+        country_cache=CountryMetadataCache(
+            db_path=str(tmp_path / "countries.sqlite"),
+            fetcher=lambda country: {"region": "Africa", "subregion": "Eastern Africa"},
+        ),
+    )
+    client = TestClient(api.app)
+    client.internal_api = internal_api
+    yield client
+    api.configure_service()
+
+
+def test_score_returns_tier_and_drivers(client):
+    response = client.post("/score", json=merchant())
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["merchant_id"] == "M1"
+    assert 0 <= body["risk_probability"] <= 1
+    assert body["risk_tier"] in ("High", "Medium", "Low")
+    assert len(body["top_drivers"]) == 3
+    assert {d["feature"] for d in body["top_drivers"]} <= set(MODEL_FEATURES)
+    # Caller supplied every internal field, so the internal API was not called
+    assert client.internal_api.calls == []
+
+
+def test_score_rejects_bad_ids_and_values(client):
+    assert client.post("/score", json=merchant("X1")).status_code == 400
+    assert client.post("/score", json=merchant(transaction_count=0)).status_code == 422
+
+
+def test_batch_matches_single_scores_and_batch_pipeline_tiers(client):
+    bodies = [merchant(f"M{i}", monthly_volume=1000.0 * (i + 1), internal_risk_flag=flag)
+              for i, flag in enumerate(["low", "medium", "high", "high"])]
+
+    batch = client.post("/score/batch", json={"merchants": bodies}).json()["results"]
+    singles = [client.post("/score", json=body).json() for body in bodies]
+
+    assert [r["merchant_id"] for r in batch] == ["M0", "M1", "M2", "M3"]
+    assert [r["risk_probability"] for r in batch] == pytest.approx([r["risk_probability"] for r in singles])
+
+    # Tiers come from the cutoffs published with the model, as in the batch pipeline
+    assert get_model(api._state["model_path"])["tier_cutoffs"] == {"high": TIER_HIGH_CUTOFF, "medium": TIER_MEDIUM_CUTOFF}
+    expected = assign_risk_tier([r["risk_probability"] for r in batch])
+    assert [r["risk_tier"] for r in batch] == list(expected)
+
+
+def test_drivers_match_the_batch_explanations(client):
+    body = client.post("/score", json=merchant()).json()
+
+    scored = api.score_merchants([api.MerchantScoreRequest(**merchant())])
+    expected = explain_risk(scored.copy(), model=get_model(api._state["model_path"]))
+
+    assert [d["feature"] for d in body["top_drivers"]] == [expected.loc[0, f"driver_{i}"] for i in (1, 2, 3)]
+    assert body["top_drivers"][0]["contribution"] == pytest.approx(expected.loc[0, "driver_1_contribution"])
+
+
+def test_batch_rejects_duplicates(client):
+    response = client.post("/score/batch", json={"merchants": [merchant(), merchant()]})
+    assert response.status_code == 400
+
+
+def test_missing_internal_fields_are_fetched_once_and_cached(client):
+    bodies = [merchant("M1", internal_risk_flag=None), merchant("M2", avg_ticket_size=None)]
+
+    for _ in range(2):
+        response = client.post("/score/batch", json={"merchants": bodies})
+        assert response.status_code == 200
+
+    assert client.internal_api.calls == [["M1", "M2"]]
+
+
+def test_internal_cache_is_bounded_and_expires():
+    cache = api.InternalRiskCache(max_entries=2, ttl_seconds=60)
+    cache.put_many([{"merchant_id": m} for m in ["M1", "M2"]])
+    cache.get_many(["M1"])
+    cache.put_many([{"merchant_id": "M3"}])
+
+    assert sorted(cache.get_many(["M1", "M2", "M3"])) == ["M1", "M3"]
+    assert len(cache) == 2
+
+    expired = api.InternalRiskCache(ttl_seconds=0)
+    expired.put_many([{"merchant_id": "M1"}])
+    assert expired.get_many(["M1"]) == {}
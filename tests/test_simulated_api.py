@@ -0,0 +1,66 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from simulated_api.api import app, MerchantRiskResponse
+
+client = TestClient(app)
+
+
+def test_batch_endpoint_streams_one_payload_per_merchant():
+    merchant_ids = [f"M{i:04d}" for i in range(1200)]
+
+    response = client.post("/risk/batch", json={"merchant_ids": merchant_ids})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    payloads = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [p["merchant_id"] for p in payloads] == merchant_ids
+    for payload in payloads[:5]:
+        MerchantRiskResponse(**payload)
+
+
+def test_batch_endpoint_rejects_invalid_ids():
+    response = client.post("/risk/batch", json={"merchant_ids": ["M1", "X2"]})
+
+    assert response.status_code == 400
+
+
+def test_batch_payloads_are_validated_like_single_responses(monkeypatch):
+    import simulated_api.api as simulated
+
+    simulate = simulated._simulate_merchant_risk
+
+    def bad_payload(merchant_id):
+        payload = simulate(merchant_id)
+        payload["transaction_summary"]["last_30d_volume"] = -1.0
+        return payload
+
+    monkeypatch.setattr(simulated, "_simulate_merchant_risk", bad_payload)
+    strict_client = TestClient(app, raise_server_exceptions=False)
+
+    assert strict_client.get("/risk/M1").status_code == 500
+    with pytest.raises(ValidationError):
+        client.post("/risk/batch", json={"merchant_ids": ["M1"]})
+
+
+def test_batch_client_rejects_short_responses(monkeypatch):
+    import requests
+
+    from ingestion.simulated_api_client import fetch_internal_risk_batch
+
+    class ShortResponse:
+        def raise_for_status(self):
+            pass
+
+        def iter_lines(self):
+            return iter([b'{"merchant_id": "M1"}'])
+
+    monkeypatch.setattr(requests.Session, "post", lambda self, url, **kwargs: ShortResponse())
+
+    with pytest.raises(RuntimeError, match="returned 1 rows for 2 merchants"):
+        fetch_internal_risk_batch(["M1", "M2"])
@@ -0,0 +1,62 @@
+import os
+
+import pandas as pd
+import pytest
+
+from ingestion.country_cache import CountryMetadataCache
+from pipeline.streaming import SCORED_COLUMNS, score_merchants_streaming
+
+
+@pytest.fixture
+def scoring_kwargs(tmp_path, make_internal_api, make_risk_model):
+    return {
+        "model": make_risk_model(),
+        "internal_risk_fetcher": make_internal_api(),
+        "country_cache": CountryMetadataCache(
+            db_path=str(tmp_path / "countries.sqlite"),
+            fetcher=lambda country: {"region": "Africa", "subregion": "Eastern Africa"},
+        ),
+    }
+
+
+def test_chunks_are_scored_into_one_csv_with_one_header(tmp_path, scoring_kwargs, write_merchants):
+    input_path, output_path = tmp_path / "merchants.csv", str(tmp_path / "out" / "scored.csv")
+    write_merchants(input_path, 25)
+
+    summary = score_merchants_streaming(str(input_path), output_path, chunksize=10, **scoring_kwargs)
+    scored = pd.read_csv(output_path)
+
+    assert (summary["merchants"], summary["chunks"]) == (25, 3)
+    assert list(scored.columns) == SCORED_COLUMNS
+    assert scored["merchant_id"].tolist() == [f"M{i:03d}" for i in range(25)]
+    assert summary["portfolio_metrics"]["merchants"] == 25
+    assert not os.path.exists(f"{output_path}.partial")
+
+
+def test_failed_run_removes_the_partial_output(tmp_path, scoring_kwargs, write_merchants):
+    input_path, output_path = tmp_path / "merchants.csv", str(tmp_path / "scored.csv")
+    write_merchants(input_path, 25)
+
+    internal_api = scoring_kwargs["internal_risk_fetcher"]
+
+    def flaky(merchant_ids):
+        if internal_api.calls:
+            raise ConnectionError("internal API down")
+        return internal_api(merchant_ids)
+
+    scoring_kwargs["internal_risk_fetcher"] = flaky
+    with pytest.raises(ConnectionError):
+        score_merchants_streaming(str(input_path), output_path, chunksize=10, **scoring_kwargs)
+
+    assert not os.path.exists(output_path)
+    assert not os.path.exists(f"{output_path}.partial")
+
+
+def test_empty_input_writes_a_header_only_csv(tmp_path, scoring_kwargs, write_merchants):
+    input_path, output_path = tmp_path / "merchants.csv", str(tmp_path / "scored.csv")
+    write_merchants(input_path, 0)
+
+    summary = score_merchants_streaming(str(input_path), output_path, **scoring_kwargs)
+
+    assert summary["merchants"] == 0
+    assert list(pd.read_csv(output_path).columns) == SCORED_COLUMNS
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from features.feature_pipeline import build_external_features
+from features.text_signals import (
+    KeywordMatcher,
+    document_term_counts,
+    merchant_term_counts,
+)
+
+
+def test_counts_match_substring_semantics_including_overlaps():
+    matcher = KeywordMatcher(["charge", "Chargeback", "back", "arg", "chapter 11"])
+    text = "CHARGEBACK filed; chargeback again. Chapter 11 pending."
+
+    counts = matcher.counts(text)
+
+    for term in matcher.terms:
+        assert counts[term] == text.lower().count(term)
+
+
+def test_many_terms_agree_with_naive_scan():
+    rng = np.random.default_rng(0)
+    alphabet = list("abcde")
+    terms = {"".join(rng.choice(alphabet, rng.integers(2, 6))) for _ in range(300)}
+    texts = ["".join(rng.choice(alphabet + [" "], 2000)) for _ in range(5)]
+
+    matcher = KeywordMatcher(terms)
+    counts = matcher.count_many(texts)
+
+    for d, text in enumerate(texts):
+        for t, term in enumerate(matcher.terms):
+            # str.count skips overlapping occurrences, so count start positions
+            naive = sum(text.startswith(term, i) for i in range(len(text)))
+            assert counts[d, t] == naive
+
+
+def test_empty_terms_rejected():
+    with pytest.raises(ValueError):
+        KeywordMatcher([""])
+
+
+def test_document_signals_override_shared_text_per_merchant():
+    documents = pd.DataFrame({
+        "merchant_id": ["M1", "M1", "M2"],
+        "document": ["a.pdf", "b.pdf", "c.pdf"],
+        "text": ["Refund requested", "fraud alert, fraud confirmed", "all clear"],
+    })
+    signals = merchant_term_counts(document_term_counts(documents))
+
+    assert signals.set_index("merchant_id").loc["M1", "term_fraud"] == 2
+    assert signals.set_index("merchant_id").loc["M1", "document_count"] == 2
+
+    df = pd.DataFrame({
+        "merchant_id": ["M1", "M2", "M3"],
+        "internal_risk_flag": ["low", "low", "low"],
+        "region": ["Europe", "Europe", "Europe"],
+    })
+    out = build_external_features(df, "customer complaint", {}, document_signals=signals)
+
+    # M1 and M2 use their own documents; M3 falls back to the shared PDF
+    assert out["pdf_mentions_refunds"].tolist() == [1, 0, 0]
+    assert out["pdf_mentions_complaint"].tolist() == [0, 0, 1]
+    assert out["pdf_risk_signal"].tolist() == pytest.approx([1 / 3, 0.0, 0.0])
+    assert out["document_count"].tolist() == [2, 1, 0]
@@ -0,0 +1,107 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ingestion.scraper import scrape_sites
+from ingestion.web_fetcher import CachedFetcher, HostRateLimiter, ResponseCache, TokenBucket
+
+PAGE = b"""<html><body>
+<h1>Pay over time with Clear pricing</h1>
+<p>$2B+ processed</p>
+<img alt="Partner Bank">
+</body></html>"""
+
+
+class StandInSite(BaseHTTPRequestHandler):
+    etag = '"v1"'
+    requests = []
+
+    def do_GET(self):
+        StandInSite.requests.append((self.path, self.headers.get("If-None-Match")))
+
+        if self.path == "/missing":
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    StandInSite.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInSite)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def make_fetcher(tmp_path, **kwargs):
+    return CachedFetcher(
+        cache=ResponseCache(str(tmp_path / "http")),
+        rate_limiter=HostRateLimiter(rate_per_host=1000, burst=10),
+        **kwargs,
+    )
+
+
+def test_unchanged_page_is_revalidated_not_redownloaded(tmp_path, site):
+    fetcher = make_fetcher(tmp_path)
+
+    first = fetcher.fetch(f"{site}/")
+    second = fetcher.fetch(f"{site}/")
+
+    assert (first.status, first.from_cache) == (200, False)
+    assert (second.status, second.from_cache) == (304, True)
+    assert second.text == first.text
+    assert StandInSite.requests == [("/", None), ("/", '"v1"')]
+
+
+def test_fresh_entries_skip_the_network_and_stale_copy_survives_outage(tmp_path, site):
+    make_fetcher(tmp_path).fetch(f"{site}/")
+
+    fresh = make_fetcher(tmp_path, fresh_seconds=60).fetch(f"{site}/")
+    assert fresh.from_cache and len(StandInSite.requests) == 1
+
+    # Point a fetcher with the same cache at a dead server
+    offline = make_fetcher(tmp_path, timeout=0.5)
+    offline.cache.put("http://127.0.0.1:9/", PAGE, "utf-8", None, None)
+    assert offline.fetch("http://127.0.0.1:9/").from_cache
+
+
+def test_scrape_sites_parses_concurrently_and_reports_failures(tmp_path, site):
+    results = scrape_sites([f"{site}/a", f"{site}/b", f"{site}/missing"], fetcher=make_fetcher(tmp_path))
+
+    assert results[f"{site}/missing"] is None
+    assert results[f"{site}/a"] == {
+        "value_propositions": ["Pay over time with Clear pricing"],
+        "public_stats": ["$2B+ processed"],
+        "partners": ["Partner Bank"],
+    }
+
+
+def test_token_bucket_spaces_requests():
+    bucket = TokenBucket(rate=50, capacity=1)
+
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+
+    # First token is immediate, the other five wait 1/50 s each
+    assert time.monotonic() - start >= 5 / 50 * 0.9